@@ -1,6 +1,94 @@
+import os
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 
+# Таблица идеальной игры: индекс — код позиции в троичной системе (0 — пусто, 1 — X, 2 — O),
+# байт — (оценка + 1) << 4 | лучший ход для стороны, которая ходит. Хранятся только канонические позиции.
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tictactoe_table.bin")
+TABLE_SIZE = 3 ** 9
+UNKNOWN = 0xFF
+NO_MOVE = 9
+LINES = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
+POW3 = [3 ** i for i in range(9)]
+# Для каждой из 8 симметрий доски: SYMMETRIES[s][i] — куда переходит клетка i
+SYMMETRIES = [
+    [f(i // 3, i % 3)[0] * 3 + f(i // 3, i % 3)[1] for i in range(9)]
+    for f in (
+        lambda r, c: (r, c), lambda r, c: (c, 2 - r), lambda r, c: (2 - r, 2 - c), lambda r, c: (2 - c, r),
+        lambda r, c: (r, 2 - c), lambda r, c: (2 - r, c), lambda r, c: (c, r), lambda r, c: (2 - c, 2 - r),
+    )
+]
+_table = None
+
+def canonical(cells):
+    best_code, best_sym = None, 0
+    for s, perm in enumerate(SYMMETRIES):
+        code = 0
+        for i in range(9):
+            code += cells[i] * POW3[perm[i]]
+        if best_code is None or code < best_code:
+            best_code, best_sym = code, s
+    return best_code, best_sym
+
+def winner(cells):
+    for a, b, c in LINES:
+        if cells[a] and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return 0
+
+def _solve(cells, player, table):
+    code, sym = canonical(cells)
+    if table[code] != UNKNOWN:
+        return (table[code] >> 4) - 1
+    if winner(cells):
+        value, move = -1, NO_MOVE
+    elif 0 not in cells:
+        value, move = 0, NO_MOVE
+    else:
+        value, move = -2, NO_MOVE
+        for i in range(9):
+            if cells[i] == 0:
+                cells[i] = player
+                score = -_solve(cells, 3 - player, table)
+                cells[i] = 0
+                if score > value:
+                    value, move = score, SYMMETRIES[sym][i]
+    table[code] = (value + 1) << 4 | move
+    return value
+
+def build_table():
+    table = bytearray([UNKNOWN]) * TABLE_SIZE
+    _solve([0] * 9, 1, table)
+    return table
+
+def get_table():
+    global _table
+    if _table is None:
+        try:
+            with open(TABLE_FILE, "rb") as f:
+                data = f.read()
+            if len(data) == TABLE_SIZE:
+                _table = bytearray(data)
+        except OSError:
+            pass
+    if _table is None:
+        _table = build_table()
+        try:
+            with open(TABLE_FILE, "wb") as f:
+                f.write(_table)
+        except OSError:
+            pass
+    return _table
+
+def best_move(board):
+    cells = [" XO".index(mark) for row in board for mark in row]
+    code, sym = canonical(cells)
+    move = get_table()[code] & 0x0F
+    if move == NO_MOVE:
+        return None
+    index = SYMMETRIES[sym].index(move)
+    return index // 3, index % 3
+
 class TicTacToeApp:
     def __init__(self, root):
         self.root = root
@@ -14,6 +102,11 @@ class TicTacToeApp:
         self.btn_new = tk.Button(self.root, text="Новая игра", command=self.new_game)
         self.btn_new.pack(pady=10)
         
+        self.vs_computer = tk.BooleanVar(value=False)
+        self.chk_computer = tk.Checkbutton(self.root, text="Компьютер играет за O", variable=self.vs_computer,
+                                           command=self.computer_move)
+        self.chk_computer.pack()
+        
         # Создание игрового поля
         self.board_frame = tk.Frame(self.root)
         self.board_frame.pack()
@@ -39,9 +132,11 @@ class TicTacToeApp:
         self.update_board()
         self.log("Новая игра начата. Первый ход: X")
     
-    def make_move(self, row, col):
+    def make_move(self, row, col, by_computer=False):
         if self.game_over:
             return
+        if self.is_computer_turn() and not by_computer:
+            return
             
         if self.board[row][col] != " ":
             messagebox.showerror("Недопустимый ход", "Эта клетка уже занята!")
@@ -62,6 +157,17 @@ class TicTacToeApp:
             return
             
         self.current_player = "O" if self.current_player == "X" else "X"
+        self.computer_move()
+    
+    def is_computer_turn(self):
+        return self.vs_computer.get() and self.current_player == "O" and not self.game_over
+    
+    def computer_move(self):
+        if not self.is_computer_turn():
+            return
+        move = best_move(self.board)
+        if move is not None:
+            self.make_move(*move, by_computer=True)
     
     def check_win(self):
         # Проверка строк
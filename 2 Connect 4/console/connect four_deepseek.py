@@ -1,72 +1,157 @@
+import argparse
+
+EMPTY = '.'
+BORDER = '#'
+
+class MNKBoard:
+    def __init__(self, rows=6, cols=7, k=4, gravity=True, players=('X', 'O')):
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.gravity = gravity
+        # The grid is padded with a ring of BORDER cells so neighbour checks need no bounds tests
+        self.stride = cols + 2
+        size = (rows + 2) * self.stride
+        self.cells = [BORDER] * size
+        for row in range(rows):
+            for col in range(cols):
+                self.cells[self.index(row, col)] = EMPTY
+        self.directions = (1, self.stride, self.stride + 1, self.stride - 1)
+        # runs[n][i] is the length of the line through i in direction n; only the ends of a line are kept current
+        self.runs = [[0] * size for _ in self.directions]
+        self.heights = [0] * cols
+        self.moves = 0
+        self.threats = {player: set() for player in players}
+
+    def index(self, row, col):
+        return (row + 1) * self.stride + col + 1
+
+    def get(self, row, col):
+        return self.cells[self.index(row, col)]
+
+    def drop_row(self, col):
+        if self.heights[col] == self.rows:
+            return -1
+        return self.rows - 1 - self.heights[col]
+
+    def is_valid(self, row, col):
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        if self.gravity:
+            return row == self.drop_row(col)
+        return self.get(row, col) == EMPTY
+
+    def place(self, row, col, player):
+        i = self.index(row, col)
+        cells = self.cells
+        cells[i] = player
+        longest = 0
+        for run, d in zip(self.runs, self.directions):
+            back = run[i - d] if cells[i - d] == player else 0
+            fwd = run[i + d] if cells[i + d] == player else 0
+            total = back + 1 + fwd
+            run[i - back * d] = total
+            run[i + fwd * d] = total
+            run[i] = total
+            if total > longest:
+                longest = total
+        self.heights[col] += 1
+        self.moves += 1
+        self._update_threats(i)
+        return longest >= self.k
+
+    def completes(self, i, player):
+        cells = self.cells
+        for run, d in zip(self.runs, self.directions):
+            back = run[i - d] if cells[i - d] == player else 0
+            fwd = run[i + d] if cells[i + d] == player else 0
+            if back + 1 + fwd >= self.k:
+                return True
+        return False
+
+    def _update_threats(self, i):
+        # Only empty cells within k steps of the last move can change their threat status
+        for threats in self.threats.values():
+            threats.discard(i)
+        cells = self.cells
+        for d in self.directions:
+            for step in (d, -d):
+                j = i
+                for _ in range(self.k):
+                    j += step
+                    if cells[j] == BORDER:
+                        break
+                    if cells[j] != EMPTY:
+                        continue
+                    for player, threats in self.threats.items():
+                        if self.completes(j, player):
+                            threats.add(j)
+                        else:
+                            threats.discard(j)
+
+    def threat_count(self, player):
+        return len(self.threats[player])
+
+    def is_full(self):
+        return self.moves == self.rows * self.cols
+
 def print_board(board):
-    print("0 1 2 3 4 5 6")
-    print("--------------")
-    for row in board:
-        print(" ".join(row))
+    width = len(str(board.cols - 1))
+    print(" ".join(str(col).rjust(width) for col in range(board.cols)))
+    print("-" * (board.cols * (width + 1)))
+    for row in range(board.rows):
+        print(" ".join(board.get(row, col).rjust(width) for col in range(board.cols)))
 
 def get_valid_move(board, player):
     while True:
         try:
-            col = int(input(f"Player {player}, choose column (0-6): "))
-            if col < 0 or col > 6:
-                print("Invalid column. Choose 0-6.")
-                continue
-            if board[0][col] != '.':
-                print("Column full. Choose another.")
-                continue
-            return col
+            if board.gravity:
+                col = int(input(f"Player {player}, choose column (0-{board.cols - 1}): "))
+                if col < 0 or col >= board.cols:
+                    print(f"Invalid column. Choose 0-{board.cols - 1}.")
+                    continue
+                row = board.drop_row(col)
+                if row == -1:
+                    print("Column full. Choose another.")
+                    continue
+            else:
+                row, col = map(int, input(f"Player {player}, choose row and column: ").split())
+                if not board.is_valid(row, col):
+                    print("Invalid cell. Choose another.")
+                    continue
+            return row, col
         except ValueError:
             print("Enter a number.")
 
-def drop_piece(board, col, player):
-    for row in range(5, -1, -1):
-        if board[row][col] == '.':
-            board[row][col] = player
-            return row, col
-
-def check_win(board, row, col, player):
-    directions = [
-        [(0, 1), (0, -1)],  
-        [(1, 0), (-1, 0)],  
-        [(1, 1), (-1, -1)], 
-        [(1, -1), (-1, 1)] 
-    ]
-    for direction_pair in directions:
-        count = 1
-        for dr, dc in direction_pair:
-            r, c = row + dr, col + dc
-            while 0 <= r < 6 and 0 <= c < 7 and board[r][c] == player:
-                count += 1
-                r += dr
-                c += dc
-                if count >= 4:
-                    return True
-    return False
-
-def check_draw(board):
-    return all(cell != '.' for cell in board[0])
+def parse_args():
+    parser = argparse.ArgumentParser(description="Connect four and other m,n,k games")
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--cols", type=int, default=7)
+    parser.add_argument("--k", type=int, default=4, help="pieces in a row needed to win")
+    parser.add_argument("--no-gravity", action="store_true", help="place pieces on any empty cell (tic-tac-toe, gomoku)")
+    return parser.parse_args()
 
 def main():
-    board = [['.' for _ in range(7)] for _ in range(6)]
+    args = parse_args()
     players = ['X', 'O']
+    board = MNKBoard(args.rows, args.cols, args.k, not args.no_gravity, players)
     current = 0
-    
+
     while True:
         print_board(board)
         player = players[current]
-        col = get_valid_move(board, player)
-        row, _ = drop_piece(board, col, player)
-        
-        if check_win(board, row, col, player):
+        row, col = get_valid_move(board, player)
+
+        if board.place(row, col, player):
             print_board(board)
             print(f"Player {player} wins!")
             break
-            
-        if check_draw(board):
+
+        if board.is_full():
             print_board(board)
             print("It's a draw!")
             break
-            
+
         current = 1 - current
 
 if __name__ == "__main__":
@@ -7,20 +7,50 @@ PLAYER_ONE_PIECE = 'R'
 PLAYER_TWO_PIECE = 'Y'
 EMPTY_SLOT = ' '
 
+class BitBoard:
+    # Each column takes ROWS + 1 bits (the top one is a sentinel), bit 0 is the bottom cell.
+    def __init__(self, rows, cols, pieces):
+        self.rows = rows
+        self.cols = cols
+        self.stride = rows + 1
+        self.masks = {piece: 0 for piece in pieces}
+        self.heights = [0] * cols
+        self.moves = 0
+
+    def can_play(self, col):
+        return 0 <= col < self.cols and self.heights[col] < self.rows
+
+    def play(self, col, piece):
+        row = self.heights[col]
+        self.masks[piece] |= 1 << (col * self.stride + row)
+        self.heights[col] += 1
+        self.moves += 1
+        return row
+
+    def is_win(self, piece):
+        bits = self.masks[piece]
+        for shift in (1, self.stride, self.stride - 1, self.stride + 1):
+            pairs = bits & (bits >> shift)
+            if pairs & (pairs >> (2 * shift)):
+                return True
+        return False
+
+    def is_full(self):
+        return self.moves == self.rows * self.cols
+
 def create_board():
     return [[EMPTY_SLOT for _ in range(COLS)] for _ in range(ROWS)]
 
-def drop_piece(board, row, col, piece):
-    board[row][col] = piece
+def create_bitboard():
+    return BitBoard(ROWS, COLS, (PLAYER_ONE_PIECE, PLAYER_TWO_PIECE))
 
-def is_valid_location(board, col):
-    return 0 <= col < COLS and board[ROWS - 1][col] == EMPTY_SLOT
+def drop_piece(board, bitboard, col, piece):
+    row = bitboard.play(col, piece)
+    board[row][col] = piece
+    return row
 
-def get_next_open_row(board, col):
-    for r in range(ROWS):
-        if board[r][col] == EMPTY_SLOT:
-            return r
-    return None
+def is_valid_location(bitboard, col):
+    return bitboard.can_play(col)
 
 def print_board(board):
     print("\n  0   1   2   3   4   5   6")
@@ -30,38 +60,15 @@ def print_board(board):
         print(f"| {row_str} |")
     print("=============================")
 
-def winning_move(board, piece):
-    for c in range(COLS - 3):
-        for r in range(ROWS):
-            if all(board[r][c + i] == piece for i in range(4)):
-                return True
-
-    for c in range(COLS):
-        for r in range(ROWS - 3):
-            if all(board[r + i][c] == piece for i in range(4)):
-                return True
-
-    for c in range(COLS - 3):
-        for r in range(ROWS - 3):
-            if all(board[r + i][c + i] == piece for i in range(4)):
-                return True
-
-    for c in range(COLS - 3):
-        for r in range(3, ROWS):
-            if all(board[r - i][c + i] == piece for i in range(4)):
-                return True
-    
-    return False
+def winning_move(bitboard, piece):
+    return bitboard.is_win(piece)
 
-def is_board_full(board):
-    for r in range(ROWS):
-        for c in range(COLS):
-            if board[r][c] == EMPTY_SLOT:
-                return False
-    return True
+def is_board_full(bitboard):
+    return bitboard.is_full()
 
 def main():
     board = create_board()
+    bitboard = create_bitboard()
     game_over = False
     turn = 0
 
@@ -80,15 +87,14 @@ def main():
             print(f"Invalid column. Please choose a number between 0 and {COLS-1}.", file=sys.stderr)
             continue
 
-        if is_valid_location(board, col):
-            row = get_next_open_row(board, col)
-            drop_piece(board, row, col, piece)
+        if is_valid_location(bitboard, col):
+            drop_piece(board, bitboard, col, piece)
 
-            if winning_move(board, piece):
+            if winning_move(bitboard, piece):
                 print_board(board)
                 print(f"\n*** Player {player} ({piece}) wins! ***\n")
                 game_over = True
-            elif is_board_full(board):
+            elif is_board_full(bitboard):
                 print_board(board)
                 print("\n*** The game is a draw! ***\n")
                 game_over = True
@@ -1,20 +1,25 @@
-def check_win(board, player):
-    for r in range(6):
-        for c in range(4):
-            if all(board[r][c+i] == player for i in range(4)):
-                return True
-    for c in range(7):
-        for r in range(3):
-            if all(board[r+i][c] == player for i in range(4)):
-                return True
-    for r in range(3):
-        for c in range(4):
-            if all(board[r+i][c+i] == player for i in range(4)):
-                return True
-    for r in range(3):
-        for c in range(3,7):
-            if all(board[r+i][c-i] == player for i in range(4)):
-                return True
+class BitBoard:
+    # 7 bits per column: 6 cells from the bottom up plus a sentinel bit
+    def __init__(self):
+        self.masks = {'R': 0, 'Y': 0}
+        self.heights = [0] * 7
+        self.moves = 0
+
+    def play(self, col, player):
+        row = self.heights[col]
+        if row == 6:
+            return None
+        self.masks[player] |= 1 << (col * 7 + row)
+        self.heights[col] = row + 1
+        self.moves += 1
+        return row
+
+def check_win(bits, player):
+    b = bits.masks[player]
+    for s in (1, 7, 6, 8):
+        m = b & (b >> s)
+        if m & (m >> 2 * s):
+            return True
     return False
 
 def print_board(board):
@@ -25,6 +30,7 @@ def print_board(board):
 
 def main():
     board = [[' ' for _ in range(7)] for _ in range(6)]
+    bits = BitBoard()
     current_player = 'R'
     while True:
         print_board(board)
@@ -34,20 +40,16 @@ def main():
             if col < 0 or col > 6:
                 print("Invalid column. Choose between 1 and 7.")
                 continue
-            placed = False
-            for r in range(6):
-                if board[r][col] == ' ':
-                    board[r][col] = current_player
-                    placed = True
-                    break
-            if not placed:
+            r = bits.play(col, current_player)
+            if r is None:
                 print("Column is full. Choose another.")
                 continue
-            if check_win(board, current_player):
+            board[r][col] = current_player
+            if check_win(bits, current_player):
                 print_board(board)
                 print(f"Player {current_player} wins!")
                 break
-            if all(cell != ' ' for row in board for cell in row):
+            if bits.moves == 42:
                 print_board(board)
                 print("It's a draw!")
                 break
@@ -1,48 +1,152 @@
+import argparse
+import sys
+import time
+try:
+    import numpy as np
+except ImportError:
+    np=None
 ROWS=6
 COLS=7
-def make_move(board,col,player):
-    for r in range(ROWS-1,-1,-1):
-        if board[r][col]==' ':
-            board[r][col]=player
-            return True
-    return False
-def check_win(board,player):
-    for r in range(ROWS):
-        for c in range(COLS):
-            if board[r][c]!=player: continue
-            if c<=COLS-4 and all(board[r][c+i]==player for i in range(4)): return True
-            if r<=ROWS-4 and all(board[r+i][c]==player for i in range(4)): return True
-            if r<=ROWS-4 and c<=COLS-4 and all(board[r+i][c+i]==player for i in range(4)): return True
-            if r>=3 and c<=COLS-4 and all(board[r-i][c+i]==player for i in range(4)): return True
-    return False
+class BitBoard:
+    # one column = ROWS+1 bits, bit 0 is the bottom cell, the top bit is a sentinel
+    def __init__(self,players):
+        self.masks={p:0 for p in players}
+        self.heights=[0]*COLS
+        self.moves=0
+    def can_play(self,col):
+        return 0<=col<COLS and self.heights[col]<ROWS
+    def play(self,col,player):
+        h=self.heights[col]
+        self.masks[player]|=1<<(col*(ROWS+1)+h)
+        self.heights[col]=h+1
+        self.moves+=1
+        return ROWS-1-h
+    def is_win(self,player):
+        b=self.masks[player]
+        for s in (1,ROWS+1,ROWS,ROWS+2):
+            m=b&(b>>s)
+            if m&(m>>2*s): return True
+        return False
+    def is_full(self):
+        return self.moves==ROWS*COLS
+def make_move(board,bits,col,player):
+    if not bits.can_play(col): return False
+    board[bits.play(col,player)][col]=player
+    return True
+def check_win(bits,player):
+    return bits.is_win(player)
 def print_board(board):
     print(' '.join(str(i+1) for i in range(COLS)))
     for row in board:
         print('|'+'|'.join(row)+'|')
-def get_move(board,player):
+def get_move(bits,player):
     while True:
         try:
             col=int(input(f"Player {player}, choose column (1-7): "))-1
-            if 0<=col<COLS and board[0][col]==' ':
+            if bits.can_play(col):
                 return col
         except:
             pass
         print("Invalid move. Try again.")
+# Batch mode: N games as an (N,ROWS,COLS) int8 array, 0 empty, 1 for X, 2 for O, row 0 on top
+def batch_new(n):
+    return np.zeros((n,ROWS,COLS),np.int8),np.zeros((n,COLS),np.int8)
+def batch_legal(heights):
+    return heights<ROWS
+def batch_make_move(boards,heights,cols,player,active):
+    idx=np.nonzero(active)[0]
+    c=cols[idx]
+    h=heights[idx,c]
+    boards[idx,ROWS-1-h,c]=player
+    heights[idx,c]=h+1
+def batch_check_win(boards,player):
+    # window sums of 4 along each direction (a convolution with a ones kernel)
+    p=(boards==player).view(np.int8)
+    h=p[:,:,:-3]+p[:,:,1:-2]+p[:,:,2:-1]+p[:,:,3:]
+    v=p[:,:-3,:]+p[:,1:-2,:]+p[:,2:-1,:]+p[:,3:,:]
+    d=p[:,:-3,:-3]+p[:,1:-2,1:-2]+p[:,2:-1,2:-1]+p[:,3:,3:]
+    a=p[:,3:,:-3]+p[:,2:-1,1:-2]+p[:,1:-2,2:-1]+p[:,:-3,3:]
+    return (h==4).any((1,2))|(v==4).any((1,2))|(d==4).any((1,2))|(a==4).any((1,2))
+def batch_winning_cols(boards,heights,player):
+    # (N,COLS) mask of columns where player wins immediately
+    n=len(boards)
+    wins=np.zeros((n,COLS),bool)
+    legal=batch_legal(heights)
+    idx=np.arange(n)
+    for c in range(COLS):
+        ok=legal[:,c]
+        row=ROWS-1-np.minimum(heights[:,c],ROWS-1)
+        old=boards[idx,row,c]
+        boards[idx,row,c]=np.where(ok,player,old)
+        wins[:,c]=ok&batch_check_win(boards,player)
+        boards[idx,row,c]=old
+    return wins
+def policy_random(boards,heights,player,rng):
+    r=rng.random((len(boards),COLS))
+    r[~batch_legal(heights)]=-1
+    return r.argmax(1)
+def policy_heuristic(boards,heights,player,rng):
+    # win now, else block, else prefer the center
+    r=rng.random((len(boards),COLS))+COLS-np.abs(np.arange(COLS)-COLS//2)
+    r+=batch_winning_cols(boards,heights,3-player)*100
+    r+=batch_winning_cols(boards,heights,player)*1000
+    r[~batch_legal(heights)]=-1
+    return r.argmax(1)
+POLICIES={'random':policy_random,'heuristic':policy_heuristic}
+def batch_play(n,policy_x,policy_o,seed=None):
+    rng=np.random.default_rng(seed)
+    boards,heights=batch_new(n)
+    result=np.zeros(n,np.int8)
+    length=np.full(n,ROWS*COLS,np.int16)
+    active=np.ones(n,bool)
+    for ply in range(ROWS*COLS):
+        player=1+ply%2
+        policy=policy_x if player==1 else policy_o
+        cols=policy(boards,heights,player,rng)
+        batch_make_move(boards,heights,cols,player,active)
+        won=active&batch_check_win(boards,player)
+        result[won]=player
+        length[won]=ply+1
+        active&=~won
+        if not active.any(): break
+    return result,length
+def batch_main(args):
+    parser=argparse.ArgumentParser(prog='connect four_o4.py --batch',description="Play many games between two policies")
+    parser.add_argument('games',nargs='?',type=int,default=100000,help="games to play (default: 100000)")
+    parser.add_argument('x',nargs='?',default='random',choices=sorted(POLICIES),metavar='X',help="policy for X: "+", ".join(sorted(POLICIES)))
+    parser.add_argument('o',nargs='?',choices=sorted(POLICIES),metavar='O',help="policy for O (default: the X policy)")
+    a=parser.parse_args(args)
+    if np is None:
+        print("Batch mode needs numpy")
+        return
+    n,px=a.games,a.x
+    po=a.o or px
+    start=time.perf_counter()
+    result,length=batch_play(n,POLICIES[px],POLICIES[po])
+    elapsed=time.perf_counter()-start
+    print(f"{n} games, X={px}, O={po}")
+    print(f"X wins: {(result==1).mean()*100:.2f}%  O wins: {(result==2).mean()*100:.2f}%  draws: {(result==0).mean()*100:.2f}%")
+    print(f"average length: {length.mean():.2f} moves")
+    print(f"{n/elapsed:.0f} games/sec ({elapsed:.2f} s)")
 def main():
     board=[[' ' for _ in range(COLS)] for _ in range(ROWS)]
+    bits=BitBoard('XO')
     player='X'
     while True:
         print_board(board)
-        col=get_move(board,player)
-        make_move(board,col,player)
-        if check_win(board,player):
+        col=get_move(bits,player)
+        make_move(board,bits,col,player)
+        if check_win(bits,player):
             print_board(board)
             print(f"Player {player} wins!")
             break
-        if all(cell!=' ' for row in board for cell in row):
+        if bits.is_full():
             print_board(board)
             print("Draw!")
             break
         player='O' if player=='X' else 'X'
 if __name__=='__main__':
-    main()
+    if len(sys.argv)>1 and sys.argv[1]=='--batch':
+        batch_main(sys.argv[2:])
+    else:
+        main()
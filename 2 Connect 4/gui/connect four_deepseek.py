@@ -19,6 +19,7 @@ class ConnectFour:
         self.canvas.pack(padx=10, pady=5)
         self.canvas.bind("<Motion>", self.hover)
         self.canvas.bind("<Button-1>", self.click)
+        self.create_cells()
         
         self.status = tk.Label(self.root, text="Ход игрока: 🔴", font=("Arial", 12))
         self.status.pack(pady=5)
@@ -34,34 +35,56 @@ class ConnectFour:
         self.status.config(text="Ход игрока: 🔴")
         self.draw_board()
     
-    def draw_board(self):
-        self.canvas.delete("all")
+    def create_cells(self):
+        # Овалы создаются один раз, дальше меняются только их цвета
+        self.cells = []
         for row in range(self.rows):
+            items = []
             for col in range(self.cols):
                 x0 = col * self.cell_size
                 y0 = row * self.cell_size
                 x1 = x0 + self.cell_size
                 y1 = y0 + self.cell_size
-                self.canvas.create_oval(x0+5, y0+5, x1-5, y1-5, fill="white", outline="blue", tags="cell")
-                
-                if self.board[row][col] == "🔴":
-                    self.canvas.create_oval(x0+5, y0+5, x1-5, y1-5, fill="red", outline="darkred")
-                elif self.board[row][col] == "🟡":
-                    self.canvas.create_oval(x0+5, y0+5, x1-5, y1-5, fill="yellow", outline="goldenrod")
+                items.append(self.canvas.create_oval(x0+5, y0+5, x1-5, y1-5, fill="white", outline="blue", tags="cell"))
+            self.cells.append(items)
+        self.preview = self.canvas.create_oval(0, 0, 0, 0, outline="white", state="hidden", tags="preview")
+        self.preview_cell = None
+    
+    def draw_board(self):
+        for row in range(self.rows):
+            for col in range(self.cols):
+                self.draw_cell(row, col)
+        self.hide_preview()
+    
+    def draw_cell(self, row, col):
+        if self.board[row][col] == "🔴":
+            self.canvas.itemconfig(self.cells[row][col], fill="red", outline="darkred")
+        elif self.board[row][col] == "🟡":
+            self.canvas.itemconfig(self.cells[row][col], fill="yellow", outline="goldenrod")
+        else:
+            self.canvas.itemconfig(self.cells[row][col], fill="white", outline="blue")
+    
+    def hide_preview(self):
+        self.canvas.itemconfig(self.preview, state="hidden")
+        self.preview_cell = None
     
     def hover(self, event):
         if self.game_over: return
         col = event.x // self.cell_size
         if 0 <= col < self.cols:
-            self.canvas.delete("preview")
             row = self.find_empty_row(col)
-            if row != -1:
+            if row == -1:
+                self.hide_preview()
+                return
+            fill = "red" if self.current_player == "🔴" else "yellow"
+            if self.preview_cell != (row, col, fill):
                 x0 = col * self.cell_size
                 y0 = row * self.cell_size
                 x1 = x0 + self.cell_size
                 y1 = y0 + self.cell_size
-                fill = "red" if self.current_player == "🔴" else "yellow"
-                self.canvas.create_oval(x0+5, y0+5, x1-5, y1-5, fill=fill, outline="white", tags="preview")
+                self.canvas.coords(self.preview, x0+5, y0+5, x1-5, y1-5)
+                self.canvas.itemconfig(self.preview, fill=fill, state="normal")
+                self.preview_cell = (row, col, fill)
     
     def find_empty_row(self, col):
         for row in range(self.rows-1, -1, -1):
@@ -81,7 +104,8 @@ class ConnectFour:
         
         self.board[row][col] = self.current_player
         self.log(f"Игрок {self.current_player}: колонка {col+1}")
-        self.draw_board()
+        self.draw_cell(row, col)
+        self.hide_preview()
         
         if self.check_win(row, col):
             self.log(f"Игрок {self.current_player} победил!")
@@ -1,6 +1,210 @@
+import copy
+import random
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 
+class BitBoard:
+    # Each column takes rows + 1 bits (the top one is a sentinel), bit 0 is the bottom cell.
+    def __init__(self, rows, cols, pieces):
+        self.rows = rows
+        self.cols = cols
+        self.stride = rows + 1
+        self.masks = {piece: 0 for piece in pieces}
+        self.heights = [0] * cols
+        self.moves = 0
+        self.hash = 0
+        rng = random.Random(rows * 1000 + cols)
+        self.zobrist = {piece: [rng.getrandbits(64) for _ in range(cols * self.stride)] for piece in pieces}
+        self.bottom = sum(1 << (c * self.stride) for c in range(cols))
+        self.cells = self.bottom * ((1 << rows) - 1)
+
+    def copy(self):
+        # the zobrist keys are shared, they never change
+        other = copy.copy(self)
+        other.masks = dict(self.masks)
+        other.heights = list(self.heights)
+        return other
+
+    def can_play(self, col):
+        return 0 <= col < self.cols and self.heights[col] < self.rows
+
+    def play(self, col, piece):
+        row = self.heights[col]
+        index = col * self.stride + row
+        self.masks[piece] |= 1 << index
+        self.hash ^= self.zobrist[piece][index]
+        self.heights[col] += 1
+        self.moves += 1
+        return row
+
+    def undo(self, col, piece):
+        self.heights[col] -= 1
+        index = col * self.stride + self.heights[col]
+        self.masks[piece] ^= 1 << index
+        self.hash ^= self.zobrist[piece][index]
+        self.moves -= 1
+
+    def is_win(self, piece):
+        bits = self.masks[piece]
+        for shift in (1, self.stride, self.stride - 1, self.stride + 1):
+            pairs = bits & (bits >> shift)
+            if pairs & (pairs >> (2 * shift)):
+                return True
+        return False
+
+    def is_full(self):
+        return self.moves == self.rows * self.cols
+
+    def threats(self, piece):
+        # Empty cells that would complete a line of four for the given piece.
+        p = self.masks[piece]
+        r = (p << 1) & (p << 2) & (p << 3)
+        for shift in (self.stride, self.stride - 1, self.stride + 1):
+            t = (p << shift) & (p << (2 * shift))
+            r |= t & (p << (3 * shift))
+            r |= t & (p >> shift)
+            t = (p >> shift) & (p >> (2 * shift))
+            r |= t & (p << shift)
+            r |= t & (p >> (3 * shift))
+        occupied = 0
+        for bits in self.masks.values():
+            occupied |= bits
+        return r & (self.cells ^ occupied)
+
+class SearchTimeout(Exception):
+    pass
+
+class ConnectFourAI:
+    WIN_SCORE = 1000000
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, time_limit_ms=500, max_table_size=1000000):
+        self.time_limit_ms = time_limit_ms
+        self.max_table_size = max_table_size
+        self.table = {}
+        self.nodes = 0
+        self.deadline = 0.0
+        self.last_stats = {}
+
+    def choose_move(self, bitboard, piece, opponent):
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit_ms / 1000.0
+        self.nodes = 0
+        if len(self.table) > self.max_table_size:
+            self.table.clear()
+
+        center = bitboard.cols // 2
+        order = sorted(range(bitboard.cols), key=lambda c: abs(c - center))
+        moves = [c for c in order if bitboard.can_play(c)]
+        best_move, best_score, depth_done = moves[0], 0, 0
+
+        # Iterative deepening: the last fully searched depth always leaves a usable move.
+        for depth in range(1, bitboard.rows * bitboard.cols - bitboard.moves + 1):
+            try:
+                move, score = self._search_root(bitboard, moves, depth, piece, opponent)
+            except SearchTimeout:
+                break
+            best_move, best_score, depth_done = move, score, depth
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= self.WIN_SCORE:
+                break
+
+        elapsed = time.perf_counter() - start
+        self.last_stats = {
+            'depth': depth_done,
+            'score': best_score,
+            'nodes': self.nodes,
+            'time_ms': elapsed * 1000.0,
+            'nps': self.nodes / elapsed if elapsed > 0 else 0.0,
+        }
+        return best_move
+
+    def _search_root(self, bitboard, moves, depth, piece, opponent):
+        alpha, beta = -self.WIN_SCORE * 2, self.WIN_SCORE * 2
+        best_move, best_score = moves[0], -self.WIN_SCORE * 2
+        for col in moves:
+            bitboard.play(col, piece)
+            try:
+                if bitboard.is_win(piece):
+                    score = self.WIN_SCORE + depth
+                else:
+                    score = -self._negamax(bitboard, depth - 1, -beta, -alpha, opponent, piece)
+            finally:
+                bitboard.undo(col, piece)
+            if score > best_score:
+                best_move, best_score = col, score
+            alpha = max(alpha, score)
+        return best_move, best_score
+
+    def _negamax(self, bitboard, depth, alpha, beta, piece, opponent):
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        if bitboard.is_full():
+            return 0
+        if depth == 0:
+            return self._evaluate(bitboard, piece, opponent)
+
+        alpha_orig = alpha
+        tt_move = None
+        entry = self.table.get(bitboard.hash)
+        if entry is not None:
+            tt_depth, tt_score, tt_flag, tt_move = entry
+            if tt_depth >= depth:
+                if tt_flag == self.EXACT:
+                    return tt_score
+                if tt_flag == self.LOWER:
+                    alpha = max(alpha, tt_score)
+                else:
+                    beta = min(beta, tt_score)
+                if alpha >= beta:
+                    return tt_score
+
+        center = bitboard.cols // 2
+        moves = sorted((c for c in range(bitboard.cols) if bitboard.can_play(c)), key=lambda c: abs(c - center))
+        for col in moves:
+            bitboard.play(col, piece)
+            won = bitboard.is_win(piece)
+            bitboard.undo(col, piece)
+            if won:
+                return self.WIN_SCORE + depth
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best_score, best_move = -self.WIN_SCORE * 2, moves[0]
+        for col in moves:
+            bitboard.play(col, piece)
+            try:
+                score = -self._negamax(bitboard, depth - 1, -beta, -alpha, opponent, piece)
+            finally:
+                bitboard.undo(col, piece)
+            if score > best_score:
+                best_score, best_move = score, col
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= alpha_orig:
+            flag = self.UPPER
+        elif best_score >= beta:
+            flag = self.LOWER
+        else:
+            flag = self.EXACT
+        self.table[bitboard.hash] = (depth, best_score, flag, best_move)
+        return best_score
+
+    def _evaluate(self, bitboard, piece, opponent):
+        center_col = ((1 << bitboard.rows) - 1) << (bitboard.cols // 2 * bitboard.stride)
+        mine, theirs = bitboard.masks[piece], bitboard.masks[opponent]
+        score = 4 * (bitboard.threats(piece).bit_count() - bitboard.threats(opponent).bit_count())
+        score += (mine & center_col).bit_count() - (theirs & center_col).bit_count()
+        return score
+
 class ConnectFourGUI:
     def __init__(self, master):
         self.master = master
@@ -15,6 +219,7 @@ class ConnectFourGUI:
         self.EMPTY_SLOT = ' '
 
         self.board = []
+        self.bitboard = None
         self.game_over = True
         self.current_player = self.PLAYER_ONE_PIECE
 
@@ -25,6 +230,13 @@ class ConnectFourGUI:
         self.HEIGHT = (self.ROWS + 1) * self.SQUARESIZE
         self.COLORS = {'R': 'red', 'Y': 'yellow', 'BOARD': 'blue', 'EMPTY': 'white'}
 
+        # Computer opponent plays the second piece
+        self.OPPONENTS = ("Человек", "Компьютер")
+        self.ai = ConnectFourAI(time_limit_ms=500)
+        self.ai_thread = None
+        self.ai_result = None
+        self.game_id = 0
+
         self._create_widgets()
         self.new_game()
 
@@ -35,6 +247,16 @@ class ConnectFourGUI:
 
         self.new_game_button = tk.Button(control_frame, text="Новая игра", command=self.new_game)
         self.new_game_button.pack(side=tk.LEFT, padx=10)
+
+        tk.Label(control_frame, text="Соперник:", bg='#f0f0f0').pack(side=tk.LEFT)
+        self.opponent_var = tk.StringVar(value=self.OPPONENTS[0])
+        self.opponent_menu = tk.OptionMenu(control_frame, self.opponent_var, *self.OPPONENTS, command=self._on_opponent_change)
+        self.opponent_menu.pack(side=tk.LEFT)
+
+        tk.Label(control_frame, text="Время ИИ, мс:", bg='#f0f0f0').pack(side=tk.LEFT, padx=(10, 0))
+        self.time_limit_var = tk.IntVar(value=self.ai.time_limit_ms)
+        self.time_limit_spinbox = tk.Spinbox(control_frame, from_=50, to=10000, increment=50, width=6, textvariable=self.time_limit_var)
+        self.time_limit_spinbox.pack(side=tk.LEFT)
         
         self.status_label = tk.Label(control_frame, text="", font=('Helvetica', 12, 'bold'), bg='#f0f0f0')
         self.status_label.pack(side=tk.LEFT, expand=True)
@@ -44,6 +266,7 @@ class ConnectFourGUI:
         self.canvas.pack()
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<Motion>", self.on_mouse_hover)
+        self._create_board_items()
 
         # Log Frame
         log_frame = tk.Frame(self.master, padx=10, pady=5)
@@ -54,8 +277,10 @@ class ConnectFourGUI:
 
     def new_game(self):
         self.board = [[self.EMPTY_SLOT for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.bitboard = BitBoard(self.ROWS, self.COLS, (self.PLAYER_ONE_PIECE, self.PLAYER_TWO_PIECE))
         self.current_player = self.PLAYER_ONE_PIECE
         self.game_over = False
+        self.game_id += 1
         self.log_widget.config(state='normal')
         self.log_widget.delete('1.0', tk.END)
         self.log_widget.config(state='disabled')
@@ -63,23 +288,39 @@ class ConnectFourGUI:
         self._update_status()
         self._draw_board()
 
-    def _draw_board(self):
-        self.canvas.delete("all")
+    def _create_board_items(self):
+        # Canvas items are created once; moves only recolor the affected cell
+        self.cell_items = [[None] * self.COLS for _ in range(self.ROWS)]
         for c in range(self.COLS):
             for r in range(self.ROWS):
                 x1 = c * self.SQUARESIZE
                 y1 = (self.ROWS - 1 - r) * self.SQUARESIZE + self.SQUARESIZE
                 x2 = x1 + self.SQUARESIZE
                 y2 = y1 + self.SQUARESIZE
-                
-                fill_color = self.COLORS['EMPTY']
-                if self.board[r][c] == self.PLAYER_ONE_PIECE:
-                    fill_color = self.COLORS['R']
-                elif self.board[r][c] == self.PLAYER_TWO_PIECE:
-                    fill_color = self.COLORS['Y']
-                
                 self.canvas.create_rectangle(x1, y1, x2, y2, fill=self.COLORS['BOARD'], outline=self.COLORS['BOARD'])
-                self.canvas.create_oval(x1 + 5, y1 + 5, x2 - 5, y2 - 5, fill=fill_color, outline=self.COLORS['BOARD'])
+                self.cell_items[r][c] = self.canvas.create_oval(x1 + 5, y1 + 5, x2 - 5, y2 - 5,
+                                                                fill=self.COLORS['EMPTY'], outline=self.COLORS['BOARD'])
+        self.hover_item = self.canvas.create_oval(0, 5, 0, self.SQUARESIZE - 5, outline=self.COLORS['BOARD'],
+                                                  state='hidden', tags="hover")
+        self.hover_col = None
+
+    def _draw_board(self):
+        for c in range(self.COLS):
+            for r in range(self.ROWS):
+                self._draw_cell(r, c)
+        self._hide_hover()
+
+    def _draw_cell(self, r, c):
+        fill_color = self.COLORS['EMPTY']
+        if self.board[r][c] == self.PLAYER_ONE_PIECE:
+            fill_color = self.COLORS['R']
+        elif self.board[r][c] == self.PLAYER_TWO_PIECE:
+            fill_color = self.COLORS['Y']
+        self.canvas.itemconfig(self.cell_items[r][c], fill=fill_color)
+
+    def _hide_hover(self):
+        self.canvas.itemconfig(self.hover_item, state='hidden')
+        self.hover_col = None
 
     def _log(self, message):
         self.log_widget.config(state='normal')
@@ -99,82 +340,115 @@ class ConnectFourGUI:
         if self.game_over:
             messagebox.showwarning("Игра окончена", "Игра завершена. Начните новую, чтобы продолжить.")
             return
+        if self._is_ai_turn():
+            return
 
         col = event.x // self.SQUARESIZE
         
         if 0 <= col < self.COLS:
             if self._is_valid_location(col):
-                row = self._get_next_open_row(col)
-                self._drop_piece(row, col, self.current_player)
-                self._log(f"Игрок {self.current_player} сделал ход в колонку {col}.")
-                self._draw_board()
-
-                if self._winning_move(self.current_player):
-                    self.game_over = True
-                    winner_msg = f"Игрок {self.current_player} победил!"
-                    self._log(winner_msg)
-                    self._update_status()
-                    messagebox.showinfo("Победа!", winner_msg)
-                elif self._is_board_full():
-                    self.game_over = True
-                    self._log("Игра окончена. Ничья!")
-                    self._update_status()
-                    messagebox.showinfo("Ничья", "Поле заполнено. Ничья!")
-                else:
-                    self.current_player = self.PLAYER_TWO_PIECE if self.current_player == self.PLAYER_ONE_PIECE else self.PLAYER_ONE_PIECE
-                    self._update_status()
+                self._play_move(col)
+                self._start_ai()
             else:
                 messagebox.showerror("Недопустимый ход", "Эта колонка уже заполнена.")
+
+    def _play_move(self, col):
+        row = self._drop_piece(col, self.current_player)
+        self._log(f"Игрок {self.current_player} сделал ход в колонку {col}.")
+        self._draw_cell(row, col)
+        self._hide_hover()
+
+        if self._winning_move(self.current_player):
+            self.game_over = True
+            winner_msg = f"Игрок {self.current_player} победил!"
+            self._log(winner_msg)
+            self._update_status()
+            messagebox.showinfo("Победа!", winner_msg)
+        elif self._is_board_full():
+            self.game_over = True
+            self._log("Игра окончена. Ничья!")
+            self._update_status()
+            messagebox.showinfo("Ничья", "Поле заполнено. Ничья!")
+        else:
+            self.current_player = self.PLAYER_TWO_PIECE if self.current_player == self.PLAYER_ONE_PIECE else self.PLAYER_ONE_PIECE
+            self._update_status()
+
+    def _is_ai_turn(self):
+        return (not self.game_over and self.opponent_var.get() == self.OPPONENTS[1]
+                and self.current_player == self.PLAYER_TWO_PIECE)
+
+    def _on_opponent_change(self, value):
+        self._start_ai()
+
+    def _start_ai(self):
+        if not self._is_ai_turn() or self.ai_thread is not None:
+            return
+        try:
+            self.ai.time_limit_ms = max(1, int(self.time_limit_var.get()))
+        except (tk.TclError, ValueError):
+            pass
+        # The search runs on a copy in a worker thread; the Tk loop only polls for the result
+        bitboard = self.bitboard.copy()
+        game_id = self.game_id
+        def work():
+            self.ai_result = (game_id, self.ai.choose_move(bitboard, self.PLAYER_TWO_PIECE, self.PLAYER_ONE_PIECE))
+        self.opponent_menu.config(state=tk.DISABLED)
+        self.time_limit_spinbox.config(state=tk.DISABLED)
+        self.status_label.config(text="Компьютер думает...", fg=self.COLORS[self.PLAYER_TWO_PIECE])
+        self.ai_thread = threading.Thread(target=work, daemon=True)
+        self.ai_thread.start()
+        self.master.after(50, self._poll_ai)
+
+    def _poll_ai(self):
+        if self.ai_thread.is_alive():
+            self.master.after(50, self._poll_ai)
+            return
+        self.ai_thread = None
+        self.opponent_menu.config(state=tk.NORMAL)
+        self.time_limit_spinbox.config(state=tk.NORMAL)
+        game_id, col = self.ai_result
+        if game_id != self.game_id:
+            # a new game was started during the search
+            self._update_status()
+            self._start_ai()
+            return
+        if not self._is_ai_turn():
+            self._update_status()
+            return
+        stats = self.ai.last_stats
+        self._log(f"ИИ: глубина {stats['depth']}, узлов {stats['nodes']}, "
+                  f"{stats['time_ms']:.0f} мс, {stats['nps']:.0f} узлов/с")
+        self._play_move(col)
         
     def on_mouse_hover(self, event):
         if self.game_over:
+            self._hide_hover()
             return
         
-        self.canvas.delete("hover")
         col = event.x // self.SQUARESIZE
-        if 0 <= col < self.COLS:
+        if not 0 <= col < self.COLS:
+            self._hide_hover()
+            return
+        color = self.COLORS[self.current_player]
+        if self.hover_col != (col, color):
             x = col * self.SQUARESIZE + self.SQUARESIZE/2
-            color = self.COLORS[self.current_player]
-            self.canvas.create_oval(x - self.RADIUS, 5, x + self.RADIUS, self.SQUARESIZE - 5, 
-                                    fill=color, outline=self.COLORS['BOARD'], tags="hover")
+            self.canvas.coords(self.hover_item, x - self.RADIUS, 5, x + self.RADIUS, self.SQUARESIZE - 5)
+            self.canvas.itemconfig(self.hover_item, fill=color, state='normal')
+            self.hover_col = (col, color)
 
-    def _drop_piece(self, row, col, piece):
+    def _drop_piece(self, col, piece):
+        row = self.bitboard.play(col, piece)
         self.board[row][col] = piece
+        return row
 
     def _is_valid_location(self, col):
-        return self.board[self.ROWS - 1][col] == self.EMPTY_SLOT
-
-    def _get_next_open_row(self, col):
-        for r in range(self.ROWS):
-            if self.board[r][col] == self.EMPTY_SLOT:
-                return r
-        return None
+        return self.bitboard.can_play(col)
 
     def _is_board_full(self):
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                if self.board[r][c] == self.EMPTY_SLOT:
-                    return False
-        return True
+        return self.bitboard.is_full()
 
     def _winning_move(self, piece):
-        for c in range(self.COLS - 3):
-            for r in range(self.ROWS):
-                if all(self.board[r][c + i] == piece for i in range(4)):
-                    return True
-        for c in range(self.COLS):
-            for r in range(self.ROWS - 3):
-                if all(self.board[r + i][c] == piece for i in range(4)):
-                    return True
-        for c in range(self.COLS - 3):
-            for r in range(self.ROWS - 3):
-                if all(self.board[r + i][c + i] == piece for i in range(4)):
-                    return True
-        for c in range(self.COLS - 3):
-            for r in range(3, self.ROWS):
-                if all(self.board[r - i][c + i] == piece for i in range(4)):
-                    return True
-        return False
+        return self.bitboard.is_win(piece)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -4,27 +4,39 @@ from tkinter import messagebox
 ROWS = 6
 COLS = 7
 
-def make_move(board, col, player):
-    for r in range(ROWS - 1, -1, -1):
-        if board[r][col] == ' ':
-            board[r][col] = player
-            return True
-    return False
-
-def check_win(board, player):
-    for r in range(ROWS):
-        for c in range(COLS):
-            if board[r][c] != player:
-                continue
-            if c <= COLS - 4 and all(board[r][c + i] == player for i in range(4)):
-                return True
-            if r <= ROWS - 4 and all(board[r + i][c] == player for i in range(4)):
-                return True
-            if r <= ROWS - 4 and c <= COLS - 4 and all(board[r + i][c + i] == player for i in range(4)):
-                return True
-            if r >= 3 and c <= COLS - 4 and all(board[r - i][c + i] == player for i in range(4)):
+class BitBoard:
+    # one column = ROWS + 1 bits, bit 0 is the bottom cell, the top bit is a sentinel
+    def __init__(self, players):
+        self.masks = {p: 0 for p in players}
+        self.heights = [0] * COLS
+        self.moves = 0
+
+    def can_play(self, col):
+        return 0 <= col < COLS and self.heights[col] < ROWS
+
+    def play(self, col, player):
+        h = self.heights[col]
+        self.masks[player] |= 1 << (col * (ROWS + 1) + h)
+        self.heights[col] = h + 1
+        self.moves += 1
+        return ROWS - 1 - h
+
+    def is_win(self, player):
+        b = self.masks[player]
+        for s in (1, ROWS + 1, ROWS, ROWS + 2):
+            m = b & (b >> s)
+            if m & (m >> 2 * s):
                 return True
-    return False
+        return False
+
+def make_move(board, bits, col, player):
+    if not bits.can_play(col):
+        return False
+    board[bits.play(col, player)][col] = player
+    return True
+
+def check_win(bits, player):
+    return bits.is_win(player)
 
 class Connect4App:
     def __init__(self, master):
@@ -42,6 +54,7 @@ class Connect4App:
 
     def new_game(self):
         self.board = [[' ' for _ in range(COLS)] for _ in range(ROWS)]
+        self.bits = BitBoard('XO')
         self.player = 'X'
         self.moves = 0
         self.log.config(state=tk.NORMAL)
@@ -65,7 +78,7 @@ class Connect4App:
             if not 1 <= n <= COLS:
                 raise ValueError
             col = n - 1
-            if self.board[0][col] != ' ':
+            if not self.bits.can_play(col):
                 raise IndexError
         except ValueError:
             messagebox.showerror("Ошибка", "Введите число от 1 до 7")
@@ -74,13 +87,13 @@ class Connect4App:
             messagebox.showerror("Ошибка", "Столбец заполнен")
             return
 
-        make_move(self.board, col, self.player)
+        make_move(self.board, self.bits, col, self.player)
         self.moves += 1
         self.log.config(state=tk.NORMAL)
         self.log.insert(tk.END, f"Игрок {self.player} -> столбец {n}\n")
         self.print_board()
 
-        if check_win(self.board, self.player):
+        if check_win(self.bits, self.player):
             self.log.insert(tk.END, f"Игрок {self.player} победил\n")
             self.log.config(state=tk.DISABLED)
             return
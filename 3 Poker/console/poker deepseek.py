@@ -1,5 +1,88 @@
+import argparse
+import importlib.util
+import json
+import os
+import queue
 import random
-from collections import Counter
+import threading
+from array import array
+
+def load_core():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'poker core.py')
+    spec = importlib.util.spec_from_file_location('poker_core', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Hands are ranked by the table-driven evaluator in ../poker core.py, shared by all the poker games;
+# the bots' Monte Carlo DiscardEngine lives there too
+core = load_core()
+card_code, hand_strength = core.card_code, core.hand_strength
+DiscardEngine = core.DiscardEngine
+
+class HandHistory:
+    # Played hands as JSON lines. The game thread only encodes a record and queues it; a background
+    # thread writes whatever has queued up in one go and appends each hand's byte offset to path + '.idx'
+    # (8 bytes per hand), so a single hand can be read back without going through the ones before it.
+    def __init__(self, path, batch=256):
+        self.file = open(path, 'ab')
+        self.index = open(path + '.idx', 'ab')
+        self.offset = self.file.tell()
+        self.batch = batch
+        self.error = None
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._write, daemon=True)
+        self.thread.start()
+
+    def record(self, record):
+        self._check()
+        self.queue.put(json.dumps(record, separators=(',', ':')).encode() + b'\n')
+
+    def _write(self):
+        done = False
+        while not done:
+            lines = [self.queue.get()]
+            while len(lines) < self.batch:
+                try:
+                    lines.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            done = None in lines
+            # a failed write is kept for the game thread; later records are dropped, but still marked
+            # done so that flush and close do not wait for them forever
+            try:
+                if self.error is None:
+                    self._write_lines([line for line in lines if line is not None])
+            except Exception as e:
+                self.error = e
+            finally:
+                for _ in lines:
+                    self.queue.task_done()
+
+    def _write_lines(self, lines):
+        offsets = array('Q')
+        for line in lines:
+            offsets.append(self.offset)
+            self.offset += len(line)
+        self.file.write(b''.join(lines))
+        self.index.write(offsets.tobytes())
+        self.file.flush()
+        self.index.flush()
+
+    def _check(self):
+        if self.error is not None:
+            raise self.error
+
+    def flush(self):
+        self.queue.join()
+        self._check()
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.file.close()
+        self.index.close()
+        self._check()
 
 class PokerGame:
     SUITS = ['♠', '♥', '♦', '♣']
@@ -8,29 +91,44 @@ class PokerGame:
         "High Card", "Pair", "Two Pair", "Three of a Kind", "Straight",
         "Flush", "Full House", "Four of a Kind", "Straight Flush"
     ]
+    # A card is an int, rank * 4 + suit; names are only built for display
+    CARD_CODES = [card_code(card >> 2, card & 3) for card in range(52)]
     
     def __init__(self, players):
         self.players = players
-        self.deck = []
+        self.deck = array('B', range(52))
+        self.top = 0
         self.pot = 0
         self.current_bets = {}
         self.discards = {}
+        self.actions = []
+        self.draws = []
         self.reset_game()
         
+    @classmethod
+    def card_names(cls, hand):
+        return " ".join(cls.RANKS[card >> 2] + cls.SUITS[card & 3] for card in hand)
+        
     def reset_game(self):
-        self.deck = [(suit, rank) for suit in self.SUITS for rank in self.RANKS]
+        # one deck per game, shuffled in place and dealt from self.top
         random.shuffle(self.deck)
+        self.top = 0
         self.pot = 0
-        self.current_bets = {player: 0 for player in self.players}
-        self.discards = {player: [] for player in self.players}
+        self.current_bets.clear()
+        self.discards.clear()
+        self.actions.clear()
+        self.draws.clear()
         for player in self.players:
-            player.hand = []
+            self.current_bets[player] = 0
+            self.discards[player] = 0
             player.folded = False
+            player.drawn = False
             
     def deal_cards(self):
-        for _ in range(5):
+        for i in range(5):
             for player in self.players:
-                player.hand.append(self.deck.pop())
+                player.hand[i] = self.deck[self.top]
+                self.top += 1
     
     def ante_up(self, amount):
         for player in self.players:
@@ -39,49 +137,18 @@ class PokerGame:
             self.current_bets[player] = amount
             
     def draw_cards(self, player, discard_indices):
-        new_cards = []
-        for idx in sorted(discard_indices, reverse=True):
-            self.discards[player].append(player.hand.pop(idx))
-        for _ in range(len(discard_indices)):
-            if self.deck:
-                player.hand.append(self.deck.pop())
+        # discarded cards are kept as a bitmask per player, new ones take their places in the hand
+        for idx in discard_indices:
+            self.discards[player] |= 1 << player.hand[idx]
+            if self.top < len(self.deck):
+                self.draws.append((self.players.index(player), idx, player.hand[idx], self.deck[self.top]))
+                player.hand[idx] = self.deck[self.top]
+                self.top += 1
+        player.drawn = True
         return player.hand
     
     def evaluate_hand(self, hand):
-        values = sorted([self.RANKS.index(card[1]) for card in hand], reverse=True)
-        suits = [card[0] for card in hand]
-        value_counter = Counter(values)
-        is_flush = len(set(suits)) == 1
-        is_straight = len(set(values)) == 5 and (max(values) - min(values) == 4 or set(values) == {12, 3, 2, 1, 0})
-        straight_high = min(values) if values == [12, 3, 2, 1, 0] else max(values)
-        
-        if is_straight and is_flush:
-            return (8, straight_high)
-        if 4 in value_counter.values():
-            quad_value = next(val for val, count in value_counter.items() if count == 4)
-            kicker = next(val for val in values if val != quad_value)
-            return (7, quad_value, kicker)
-        if 3 in value_counter.values() and 2 in value_counter.values():
-            trio = next(val for val, count in value_counter.items() if count == 3)
-            pair = next(val for val, count in value_counter.items() if count == 2)
-            return (6, trio, pair)
-        if is_flush:
-            return (5, *values)
-        if is_straight:
-            return (4, straight_high)
-        if 3 in value_counter.values():
-            trio = next(val for val, count in value_counter.items() if count == 3)
-            kickers = sorted([val for val in values if val != trio], reverse=True)
-            return (3, trio, *kickers)
-        if list(value_counter.values()).count(2) == 2:
-            pairs = sorted([val for val, count in value_counter.items() if count == 2], reverse=True)
-            kicker = next(val for val in values if val not in pairs)
-            return (2, *pairs, kicker)
-        if 2 in value_counter.values():
-            pair_val = next(val for val, count in value_counter.items() if count == 2)
-            kickers = sorted([val for val in values if val != pair_val], reverse=True)
-            return (1, pair_val, *kickers)
-        return (0, *values)
+        return hand_strength([self.CARD_CODES[card] for card in hand])
     
     def compare_hands(self, hands):
         evaluations = {}
@@ -90,19 +157,34 @@ class PokerGame:
                 evaluations[player] = self.evaluate_hand(hand)
         
         best_player = None
-        best_eval = (-1,)
+        best_eval = -1
         
         for player, eval_score in evaluations.items():
             if eval_score > best_eval:
                 best_eval = eval_score
                 best_player = player
         
-        return best_player, self.HAND_RANKS[best_eval[0]]
+        return best_player, self.HAND_RANKS[best_eval >> 13]
+    
+    def hand_record(self, winner):
+        # seats in dealing order; dealt hands are the final ones with the draws undone
+        return {
+            'seats': [p.name for p in self.players],
+            'hands': [list(p.hand) for p in self.players],
+            'folded': [seat for seat, p in enumerate(self.players) if p.folded],
+            'draws': self.draws,
+            'actions': self.actions,
+            'bets': [self.current_bets[p] for p in self.players],
+            'pot': self.pot,
+            'winner': self.players.index(winner) if winner else None,
+        }
     
     def betting_round(self, start_idx):
         active_players = [p for p in self.players if not p.folded]
         idx = start_idx % len(active_players)
         max_bet = max(self.current_bets.values())
+        actions = []
+        self.actions.append(actions)
         
         while any(p.can_act and not p.folded for p in active_players):
             player = active_players[idx]
@@ -112,6 +194,7 @@ class PokerGame:
             
             call_amount = max_bet - self.current_bets[player]
             action, amount = player.make_decision(call_amount, max_bet)
+            actions.append((self.players.index(player), action, amount))
             
             if action == "fold":
                 player.folded = True
@@ -131,23 +214,29 @@ class PokerGame:
                     if p != player and not p.folded:
                         p.can_act = True
             
-            idx = (idx + 1) % len(active_players)
             active_players = [p for p in self.players if not p.folded]
             if len(active_players) == 1:
                 break
+            # a folded player leaves the list, so the next seat is already at idx
+            if not player.folded:
+                idx += 1
+            idx %= len(active_players)
 
 class Player:
     def __init__(self, name, chips, is_human=False):
         self.name = name
         self.chips = chips
-        self.hand = []
+        self.hand = array('B', bytes(5))
         self.folded = False
         self.can_act = True
         self.is_human = is_human
+        self.drawn = False
+        self.engine = DiscardEngine(max_discard=3)
+        self.estimate = (None, 0)
     
     def make_decision(self, call_amount, current_bet):
         if self.is_human:
-            print(f"\nYour hand: {self.hand}")
+            print(f"\nYour hand: {PokerGame.card_names(self.hand)}")
             print(f"Your chips: {self.chips}, Call: {call_amount}, Current bet: {current_bet}")
             while True:
                 action = input("Action (fold/call/raise): ").lower()
@@ -169,21 +258,42 @@ class Player:
                     except ValueError:
                         print("Invalid input")
         else:
-            hand_strength = max(Counter(card[1] for card in self.hand).values(), default=0)
+            category = self.hand_category()
             if call_amount == 0:
                 return "call", 0
-            if hand_strength < 2 and call_amount > 5:
+            if category < 1 and call_amount > 5:
                 return "fold", 0
-            if hand_strength == 2 and call_amount > 10:
+            if category < 3 and call_amount > 10:
                 return "fold", 0
-            if hand_strength >= 3 or random.random() > 0.3:
+            if category >= 3 or random.random() > 0.3:
                 if self.chips > call_amount + 5 and random.random() > 0.7:
                     raise_amt = min(5, self.chips - call_amount)
                     return "raise", raise_amt
                 return "call", 0
             return "fold", 0
 
+    def choose_discard(self):
+        codes = [PokerGame.CARD_CODES[card] for card in self.hand]
+        unseen = [code for card, code in enumerate(PokerGame.CARD_CODES) if card not in self.hand]
+        return self.engine.choose(codes, unseen)
+
+    def hand_category(self):
+        # before the draw: the expected category after the best discard; after it: the category held
+        key = (self.hand.tobytes(), self.drawn)
+        if self.estimate[0] != key:
+            if self.drawn:
+                strength = hand_strength([PokerGame.CARD_CODES[card] for card in self.hand])
+            else:
+                _, strength = self.choose_discard()
+            self.estimate = (key, strength / 8192)
+        return self.estimate[1]
+
 def main():
+    parser = argparse.ArgumentParser(description="Five-card draw against three bots")
+    parser.add_argument('--history', help="append the played hands to this JSON lines file")
+    args = parser.parse_args()
+    history = HandHistory(args.history) if args.history else None
+    
     human = Player("You", 100, is_human=True)
     bots = [Player(f"Bot {i+1}", 100) for i in range(3)]
     game = PokerGame([human] + bots)
@@ -203,14 +313,13 @@ def main():
                 if player.folded:
                     continue
                 if player.is_human:
-                    print(f"\nYour hand: {player.hand}")
+                    print(f"\nYour hand: {game.card_names(player.hand)}")
                     discards = input("Discard (0-4, comma separated): ")
                     indices = [int(idx.strip()) for idx in discards.split(",")] if discards else []
                     new_hand = game.draw_cards(player, indices)
-                    print(f"New hand: {new_hand}")
+                    print(f"New hand: {game.card_names(new_hand)}")
                 else:
-                    discard_count = min(3, random.randint(0, 3))
-                    indices = random.sample(range(5), discard_count)
+                    indices, _ = player.choose_discard()
                     game.draw_cards(player, indices)
             
             for player in game.players:
@@ -224,6 +333,8 @@ def main():
             print(f"{winner.name} wins {game.pot} chips")
         else:
             print("All players folded, no winner")
+        if history:
+            history.record(game.hand_record(winner))
         
         print("\nChip counts:")
         for player in game.players:
@@ -231,6 +342,9 @@ def main():
         
         if input("\nPlay again? (y/n): ").lower() != 'y':
             break
+    
+    if history:
+        history.close()
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,24 @@
+import importlib.util
+import os
 import random
 
+def load_core():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'poker core.py')
+    spec = importlib.util.spec_from_file_location('poker_core', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Hands are ranked by the table-driven evaluator in ../poker core.py, shared by all the poker games;
+# the bots' Monte Carlo DiscardEngine lives there too
+core = load_core()
+card_code, hand_strength, HAND_NAMES = core.card_code, core.hand_strength, core.HAND_NAMES
+DiscardEngine = core.DiscardEngine
+
+CARD_CODES = {r + s: card_code(i, j) for i, r in enumerate('23456789TJQKA') for j, s in enumerate('shdc')}
+
+DISCARD_ENGINE = DiscardEngine(max_discard=3)
+
 class PokerGame:
     def __init__(self, players_names):
         self.deck = self._create_deck()
@@ -103,6 +122,11 @@ class PokerGame:
     def discard_and_draw(self, active_players):
         for player_name in active_players:
             print(f"\n{player_name}'s turn to discard. Your hand: {self.players[player_name]}")
+            codes = [CARD_CODES[card] for card in self.players[player_name]]
+            unseen = [code for code in CARD_CODES.values() if code not in codes]
+            suggestion, expected = DISCARD_ENGINE.choose(codes, unseen)
+            print(f"Suggested discard: {' '.join(map(str, suggestion)) or 'none'} "
+                  f"(expected hand around {HAND_NAMES[int(expected) >> 13]})")
             while True:
                 discard_indices_str = input("Enter indices of cards to discard (e.g., '0 2 4' for 1st, 3rd, 5th card, max 3 cards). Enter nothing to keep all cards: ")
                 if not discard_indices_str:
@@ -135,65 +159,20 @@ class PokerGame:
 
 
     def _rank_hand(self, hand):
-        ranks = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
-        
-        card_ranks = sorted([ranks[card[0]] for card in hand])
-        card_suits = [card[1] for card in hand]
-
-        is_flush = len(set(card_suits)) == 1
-        is_straight = True
-        if 14 in card_ranks: 
-            low_ace_straight = sorted([1 if r == 14 else r for r in card_ranks])
-            if low_ace_straight == [2,3,4,5,14] or low_ace_straight == [1,2,3,4,5]:
-                pass 
-            elif not all(card_ranks[i] == card_ranks[i-1] + 1 for i in range(1, 5)):
-                is_straight = False
-        else:
-            if not all(card_ranks[i] == card_ranks[i-1] + 1 for i in range(1, 5)):
-                is_straight = False
-
-
-        rank_counts = {}
-        for r in card_ranks:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-
-        counts_list = sorted(rank_counts.values(), reverse=True)
-        unique_ranks = sorted(rank_counts.keys(), reverse=True)
-
-        if 5 in counts_list:
-            return (9, unique_ranks[0]) 
-        if is_straight and is_flush:
-            if card_ranks == [10, 11, 12, 13, 14]:
-                return (8, 14)  # Royal Flush
-            return (8, card_ranks[-1])
-        if 4 in counts_list:
-            return (7, unique_ranks[0], unique_ranks[1])
-        if counts_list == [3, 2]:
-            return (6, unique_ranks[0], unique_ranks[1])
-        if is_flush:
-            return (5, *unique_ranks)
-        if is_straight:
-            return (4, card_ranks[-1])
-        if 3 in counts_list:
-            return (3, unique_ranks[0], *unique_ranks[1:])
-        if counts_list == [2, 2, 1]:
-            return (2, unique_ranks[0], unique_ranks[1], unique_ranks[2])
-        if 2 in counts_list:
-            return (1, unique_ranks[0], *unique_ranks[1:])
-        return (0, *unique_ranks)
+        return hand_strength([CARD_CODES[card] for card in hand])
 
     def determine_winner(self, active_players):
         hand_strengths = {}
         for player_name in active_players:
             hand_strengths[player_name] = self._rank_hand(self.players[player_name])
-            print(f"{player_name}'s hand: {self.players[player_name]} - Strength: {hand_strengths[player_name]}")
+            print(f"{player_name}'s hand: {self.players[player_name]} - {HAND_NAMES[hand_strengths[player_name] >> 13]}")
 
         if not hand_strengths:
             print("No active players to determine a winner.")
             return
 
         winner = max(hand_strengths, key=hand_strengths.get)
-        print(f"\n{winner} wins the pot of {self.pot:.2f} with {self.players[winner]} (strength: {hand_strengths[winner]})!")
+        print(f"\n{winner} wins the pot of {self.pot:.2f} with {self.players[winner]} ({HAND_NAMES[hand_strengths[winner] >> 13]})!")
         self.pot = 0
 
     def play_hand(self):
@@ -1,4 +1,6 @@
-from collections import namedtuple, Counter
+from collections import namedtuple
+import importlib.util
+import os
 import random
 
 Card = namedtuple('Card', ['rank', 'suit'])
@@ -31,47 +33,21 @@ class Player:
         self.folded = False
         self.bet_this_round = 0
 
-def is_straight_check(sorted_ranks):
-    if set(sorted_ranks) == {2,3,4,5,14}:
-        return True, 5
-    elif max(sorted_ranks) - min(sorted_ranks) == 4 and len(set(sorted_ranks)) == 5:
-        return True, max(sorted_ranks)
-    else:
-        return False, 0
+def load_core():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'poker core.py')
+    spec = importlib.util.spec_from_file_location('poker_core', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Hands are ranked by the table-driven evaluator in ../poker core.py, shared by all the poker games
+core = load_core()
+card_code, hand_strength, HAND_NAMES = core.card_code, core.hand_strength, core.HAND_NAMES
+
+CARD_CODES = {card: card_code(rank_to_num(card.rank) - 2, 'SHDC'.index(card.suit)) for card in create_deck()}
 
 def evaluate_hand(hand):
-    ranks = [rank_to_num(card.rank) for card in hand]
-    suits = [card.suit for card in hand]
-    sorted_ranks = sorted(ranks)
-    is_flush = len(set(suits)) == 1
-    is_straight, straight_high = is_straight_check(sorted_ranks)
-    if is_straight and is_flush:
-        return 8, [straight_high] if straight_high != 5 else [5]
-    rank_counts = Counter(ranks)
-    four_count = [r for r, c in rank_counts.items() if c == 4]
-    if four_count:
-        kicker = max([r for r in ranks if r != four_count[0]])
-        return 7, [four_count[0], kicker]
-    three_count = [r for r, c in rank_counts.items() if c == 3]
-    two_count = [r for r, c in rank_counts.items() if c == 2]
-    if three_count and len(two_count) == 1:
-        return 6, [three_count[0], two_count[0]]
-    if is_flush:
-        return 5, sorted(ranks, reverse=True)
-    if is_straight:
-        return 4, [straight_high]
-    if three_count:
-        kickers = sorted([r for r in ranks if r != three_count[0]], reverse=True)
-        return 3, [three_count[0]] + kickers
-    if len(two_count) == 2:
-        pair1, pair2 = sorted(two_count, reverse=True)
-        kicker = max([r for r in ranks if r not in (pair1, pair2)])
-        return 2, [pair1, pair2, kicker]
-    if len(two_count) == 1:
-        pair = two_count[0]
-        kickers = sorted([r for r in ranks if r != pair], reverse=True)
-        return 1, [pair] + kickers
-    return 0, sorted(ranks, reverse=True)
+    return hand_strength([CARD_CODES[card] for card in hand])
 
 def main():
     deck = create_deck()
@@ -147,7 +123,7 @@ def main():
         winner = active_players[0]
     else:
         hand_values = [(evaluate_hand(p.hand), p) for p in active_players]
-        winner = max(hand_values, key=lambda x: (x[0][0], x[0][1]))[1]
+        winner = max(hand_values, key=lambda x: x[0])[1]
     print(f"Player {winner.id} wins the pot of {pot} with hand: {[card_str(card) for card in winner.hand]}")
     winner.stack += pot
 
@@ -1,3 +1,5 @@
+import importlib.util
+import os
 import random
 
 VALUES = '23456789TJQKA'
@@ -9,50 +11,21 @@ def create_deck():
 def deal(deck):
     return [deck.pop() for _ in range(5)]
 
+def load_core():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'poker core.py')
+    spec = importlib.util.spec_from_file_location('poker_core', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Hands are ranked by the table-driven evaluator in ../poker core.py, shared by all the poker games
+core = load_core()
+card_code, hand_strength, HAND_NAMES = core.card_code, core.hand_strength, core.HAND_NAMES
+
+CARD_CODES = {v + s: card_code(r, i) for r, v in enumerate(VALUES) for i, s in enumerate(SUITS)}
+
 def hand_rank(hand):
-    counts = {}
-    vals = []
-    for card in hand:
-        v = VALUES.index(card[0]) + 2
-        counts[v] = counts.get(v,0) + 1
-        vals.append(v)
-    flush = len({card[1] for card in hand}) == 1
-    unique_vals = sorted(set(vals))
-    straight = False
-    if len(unique_vals) == 5:
-        if max(unique_vals) - min(unique_vals) == 4:
-            straight = True
-            high = max(unique_vals)
-        elif set(unique_vals) == {14,2,3,4,5}:
-            straight = True
-            high = 5
-    counts_items = sorted(counts.items(), key=lambda x: (-x[1], -x[0]))
-    if straight and flush:
-        return (9, [high])
-    if counts_items[0][1] == 4:
-        four = counts_items[0][0]
-        kicker = [v for v in vals if v != four][0]
-        return (8, [four, kicker])
-    if counts_items[0][1] == 3 and counts_items[1][1] == 2:
-        return (7, [counts_items[0][0], counts_items[1][0]])
-    if flush:
-        return (6, sorted(vals, reverse=True))
-    if straight:
-        return (5, [high])
-    if counts_items[0][1] == 3:
-        three = counts_items[0][0]
-        kickers = sorted([v for v in vals if v != three], reverse=True)
-        return (4, [three] + kickers)
-    if counts_items[0][1] == 2 and counts_items[1][1] == 2:
-        p1, p2 = counts_items[0][0], counts_items[1][0]
-        kicker = [v for v in vals if v not in (p1,p2)][0]
-        highp, lowp = max(p1,p2), min(p1,p2)
-        return (3, [highp, lowp, kicker])
-    if counts_items[0][1] == 2:
-        pair = counts_items[0][0]
-        kickers = sorted([v for v in vals if v != pair], reverse=True)
-        return (2, [pair] + kickers)
-    return (1, sorted(vals, reverse=True))
+    return hand_strength([CARD_CODES[card] for card in hand])
 
 def main():
     deck = create_deck()
@@ -77,8 +50,8 @@ def main():
         result = "Player 2 wins"
     else:
         result = "Tie"
-    print("Player 1:", " ".join(p1), "Rank:", r1)
-    print("Player 2:", " ".join(p2), "Rank:", r2)
+    print("Player 1:", " ".join(p1), "Rank:", HAND_NAMES[r1 >> 13])
+    print("Player 2:", " ".join(p2), "Rank:", HAND_NAMES[r2 >> 13])
     print(result)
 
 if __name__ == "__main__":
@@ -1,7 +1,23 @@
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, simpledialog
+import importlib.util
+import itertools
+import os
 import random
-from collections import Counter
+import threading
+
+def load_core():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'poker core.py')
+    spec = importlib.util.spec_from_file_location('poker_core', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Hands are ranked by the table-driven evaluator in ../poker core.py, shared by all the poker games;
+# the bots' Monte Carlo DiscardEngine lives there too
+core = load_core()
+card_code, hand_strength = core.card_code, core.hand_strength
+DiscardEngine = core.DiscardEngine
 
 class PokerGame:
     SUITS = ['♠', '♥', '♦', '♣']
@@ -10,6 +26,8 @@ class PokerGame:
         "High Card", "Pair", "Two Pair", "Three of a Kind", "Straight",
         "Flush", "Full House", "Four of a Kind", "Straight Flush"
     ]
+    CARD_CODES = {(suit, rank): card_code(r, i)
+                  for (i, suit), (r, rank) in itertools.product(enumerate(SUITS), enumerate(RANKS))}
     
     def __init__(self, players):
         self.players = players
@@ -28,6 +46,7 @@ class PokerGame:
         for player in self.players:
             player.hand = []
             player.folded = False
+            player.drawn = False
             player.can_act = True
     
     def deal_cards(self):
@@ -48,43 +67,11 @@ class PokerGame:
         for _ in range(len(discard_indices)):
             if self.deck:
                 player.hand.append(self.deck.pop())
+        player.drawn = True
         return player.hand
     
     def evaluate_hand(self, hand):
-        values = sorted([self.RANKS.index(card[1]) for card in hand], reverse=True)
-        suits = [card[0] for card in hand]
-        value_counter = Counter(values)
-        is_flush = len(set(suits)) == 1
-        is_straight = len(set(values)) == 5 and (max(values) - min(values) == 4 or set(values) == {12, 3, 2, 1, 0})
-        straight_high = min(values) if values == [12, 3, 2, 1, 0] else max(values)
-        
-        if is_straight and is_flush:
-            return (8, straight_high)
-        if 4 in value_counter.values():
-            quad_value = next(val for val, count in value_counter.items() if count == 4)
-            kicker = next(val for val in values if val != quad_value)
-            return (7, quad_value, kicker)
-        if 3 in value_counter.values() and 2 in value_counter.values():
-            trio = next(val for val, count in value_counter.items() if count == 3)
-            pair = next(val for val, count in value_counter.items() if count == 2)
-            return (6, trio, pair)
-        if is_flush:
-            return (5, *values)
-        if is_straight:
-            return (4, straight_high)
-        if 3 in value_counter.values():
-            trio = next(val for val, count in value_counter.items() if count == 3)
-            kickers = sorted([val for val in values if val != trio], reverse=True)
-            return (3, trio, *kickers)
-        if list(value_counter.values()).count(2) == 2:
-            pairs = sorted([val for val, count in value_counter.items() if count == 2], reverse=True)
-            kicker = next(val for val in values if val not in pairs)
-            return (2, *pairs, kicker)
-        if 2 in value_counter.values():
-            pair_val = next(val for val, count in value_counter.items() if count == 2)
-            kickers = sorted([val for val in values if val != pair_val], reverse=True)
-            return (1, pair_val, *kickers)
-        return (0, *values)
+        return hand_strength([self.CARD_CODES[card] for card in hand])
     
     def compare_hands(self, hands):
         evaluations = {}
@@ -93,14 +80,14 @@ class PokerGame:
                 evaluations[player] = self.evaluate_hand(hand)
         
         best_player = None
-        best_eval = (-1,)
+        best_eval = -1
         
         for player, eval_score in evaluations.items():
             if eval_score > best_eval:
                 best_eval = eval_score
                 best_player = player
         
-        return best_player, self.HAND_RANKS[best_eval[0]]
+        return best_player, self.HAND_RANKS[best_eval >> 13]
 
 class Player:
     def __init__(self, name, chips, is_human=False):
@@ -110,22 +97,41 @@ class Player:
         self.folded = False
         self.can_act = True
         self.is_human = is_human
+        self.drawn = False
+        self.engine = DiscardEngine(max_discard=3)
+        self.estimate = (None, 0)
     
     def make_decision(self, call_amount, current_bet):
-        hand_strength = max(Counter(card[1] for card in self.hand).values(), default=0)
+        category = self.hand_category()
         if call_amount == 0:
             return "call", 0
-        if hand_strength < 2 and call_amount > 5:
+        if category < 1 and call_amount > 5:
             return "fold", 0
-        if hand_strength == 2 and call_amount > 10:
+        if category < 3 and call_amount > 10:
             return "fold", 0
-        if hand_strength >= 3 or random.random() > 0.3:
+        if category >= 3 or random.random() > 0.3:
             if self.chips > call_amount + 5 and random.random() > 0.7:
                 raise_amt = min(5, self.chips - call_amount)
                 return "raise", raise_amt
             return "call", 0
         return "fold", 0
 
+    def choose_discard(self):
+        codes = [PokerGame.CARD_CODES[card] for card in self.hand]
+        unseen = [code for code in PokerGame.CARD_CODES.values() if code not in codes]
+        return self.engine.choose(codes, unseen)
+
+    def hand_category(self):
+        # before the draw: the expected category after the best discard; after it: the category held
+        key = (tuple(self.hand), self.drawn)
+        if self.estimate[0] != key:
+            if self.drawn:
+                strength = hand_strength([PokerGame.CARD_CODES[card] for card in self.hand])
+            else:
+                _, strength = self.choose_discard()
+            self.estimate = (key, strength / 8192)
+        return self.estimate[1]
+
 class PokerApp:
     def __init__(self, root):
         self.root = root
@@ -282,10 +288,24 @@ class PokerApp:
         
         self.process_action(self.human_player, action, raise_amount)
     
+    def run_in_background(self, work, done):
+        # bot decisions run the discard engine in a worker thread; the Tk loop only polls for the result
+        game = self.game
+        result = []
+        worker = threading.Thread(target=lambda: result.append(work()), daemon=True)
+        worker.start()
+        def poll():
+            if worker.is_alive():
+                self.root.after(50, poll)
+            elif self.game is game:
+                done(result[0])
+        self.root.after(50, poll)
+    
     def bot_action(self, player):
-        call_amount = max(self.game.current_bets.values()) - self.game.current_bets[player]
-        action, raise_amount = player.make_decision(call_amount, max(self.game.current_bets.values()))
-        self.process_action(player, action, raise_amount)
+        max_bet = max(self.game.current_bets.values())
+        call_amount = max_bet - self.game.current_bets[player]
+        self.run_in_background(lambda: player.make_decision(call_amount, max_bet),
+                               lambda decision: self.process_action(player, *decision))
     
     def process_action(self, player, action, raise_amount=0):
         max_bet = max(self.game.current_bets.values())
@@ -376,12 +396,13 @@ class PokerApp:
         self.advance_game_state()
     
     def bot_discard(self, player):
-        discard_count = min(3, random.randint(0, 3))
-        indices = random.sample(range(5), discard_count)
-        self.game.draw_cards(player, indices)
-        self.log(f"{player.name} discards {discard_count} cards")
-        player.can_act = False
-        self.advance_game_state()
+        def done(choice):
+            indices, _ = choice
+            self.game.draw_cards(player, indices)
+            self.log(f"{player.name} discards {len(indices)} cards")
+            player.can_act = False
+            self.advance_game_state()
+        self.run_in_background(player.choose_discard, done)
     
     def advance_game_state(self):
         active_players = [p for p in self.game.players if not p.folded]
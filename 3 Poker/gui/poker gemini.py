@@ -1,7 +1,22 @@
+import importlib.util
+import os
 import random
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 
+def load_core():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'poker core.py')
+    spec = importlib.util.spec_from_file_location('poker_core', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Hands are ranked by the table-driven evaluator in ../poker core.py, shared by all the poker games
+core = load_core()
+card_code, hand_strength, HAND_NAMES = core.card_code, core.hand_strength, core.HAND_NAMES
+
+CARD_CODES = {r + s: card_code(i, j) for i, r in enumerate('23456789TJQKA') for j, s in enumerate('shdc')}
+
 class PokerGame:
     def __init__(self, player_names, gui_app):
         self.gui_app = gui_app
@@ -213,70 +228,20 @@ class PokerGame:
 
 
     def _rank_hand(self, hand):
-        ranks = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
-        
-        card_ranks_numerical = sorted([ranks[card[0]] for card in hand])
-        card_suits = [card[1] for card in hand]
-
-        is_flush = len(set(card_suits)) == 1
-        
-        # Check for straight
-        is_straight = True
-        if 14 in card_ranks_numerical and 2 in card_ranks_numerical and 3 in card_ranks_numerical and 4 in card_ranks_numerical and 5 in card_ranks_numerical:
-            # [cite_start]Special case for A-2-3-4-5 straight (Ace as low) [cite: 15, 26]
-            straight_ranks = [1, 2, 3, 4, 5]
-        else:
-            straight_ranks = card_ranks_numerical
-            for i in range(len(straight_ranks) - 1):
-                if straight_ranks[i+1] != straight_ranks[i] + 1:
-                    is_straight = False
-                    break
-        
-        if len(set(card_ranks_numerical)) < 5: # Not possible to be a straight if there are duplicates
-            is_straight = False
-
-        rank_counts = {}
-        for r in card_ranks_numerical:
-            rank_counts[r] = rank_counts.get(r, 0) + 1
-
-        counts_list = sorted(rank_counts.values(), reverse=True)
-        unique_ranks = sorted(rank_counts.keys(), reverse=True)
-
-        # [cite_start]Poker hand rankings [cite: 11]
-        if 5 in counts_list: # Five of a Kind [cite: 12]
-            return (9, unique_ranks[0]) 
-        if is_straight and is_flush: # Straight Flush [cite: 14]
-            if card_ranks_numerical == [10, 11, 12, 13, 14]:
-                return (8, 14)  # Royal Flush [cite: 17]
-            return (8, card_ranks_numerical[-1])
-        if 4 in counts_list: # Four of a Kind [cite: 18]
-            return (7, unique_ranks[0], unique_ranks[1] if len(unique_ranks) > 1 else 0)
-        if counts_list == [3, 2]: # Full House [cite: 22]
-            return (6, unique_ranks[0], unique_ranks[1])
-        if is_flush: # Flush [cite: 24]
-            return (5, *unique_ranks)
-        if is_straight: # Straight [cite: 25]
-            return (4, straight_ranks[-1])
-        if 3 in counts_list: # Three of a Kind [cite: 29]
-            return (3, unique_ranks[0], unique_ranks[1] if len(unique_ranks) > 1 else 0, unique_ranks[2] if len(unique_ranks) > 2 else 0)
-        if counts_list == [2, 2, 1]: # Two Pair [cite: 30]
-            return (2, unique_ranks[0], unique_ranks[1], unique_ranks[2])
-        if 2 in counts_list: # Pair [cite: 31]
-            return (1, unique_ranks[0], unique_ranks[1] if len(unique_ranks) > 1 else 0, unique_ranks[2] if len(unique_ranks) > 2 else 0, unique_ranks[3] if len(unique_ranks) > 3 else 0)
-        return (0, *unique_ranks) # High Card [cite: 32]
+        return hand_strength([CARD_CODES[card] for card in hand])
 
     def determine_winner(self, active_players):
         hand_strengths = {}
         for player_name in active_players:
             hand_strengths[player_name] = self._rank_hand(self.players[player_name])
-            self.gui_app.log_message(f"{player_name}'s hand: {self.players[player_name]} - Strength: {hand_strengths[player_name]}")
+            self.gui_app.log_message(f"{player_name}'s hand: {self.players[player_name]} - {HAND_NAMES[hand_strengths[player_name] >> 13]}")
 
         if not hand_strengths:
             self.gui_app.log_message("No active players to determine a winner.")
             return
 
         winner = max(hand_strengths, key=hand_strengths.get)
-        self.gui_app.log_message(f"\n{winner} wins the pot of {self.pot:.2f} with {self.players[winner]} (strength: {hand_strengths[winner]})!")
+        self.gui_app.log_message(f"\n{winner} wins the pot of {self.pot:.2f} with {self.players[winner]} ({HAND_NAMES[hand_strengths[winner] >> 13]})!")
         self.pot = 0
 
     def play_hand(self):
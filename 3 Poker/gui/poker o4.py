@@ -1,5 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
+import importlib.util
+import os
 import random
 
 VALUES='23456789TJQKA'
@@ -11,36 +13,19 @@ def create_deck():
 def deal(deck,n=5):
     return [deck.pop() for _ in range(n)]
 
+def load_core():
+    spec=importlib.util.spec_from_file_location('poker_core',os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','poker core.py'))
+    m=importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(m)
+    return m
+
+# hands are ranked by the table-driven evaluator in ../poker core.py, shared by all the poker games
+core=load_core()
+card_code,hand_strength,HAND_NAMES=core.card_code,core.hand_strength,core.HAND_NAMES
+CARD_CODES={v+s:card_code(r,i) for r,v in enumerate(VALUES) for i,s in enumerate(SUITS)}
+
 def hand_rank(hand):
-    counts={}
-    vals=[]
-    for c in hand:
-        v=VALUES.index(c[0])+2
-        counts[v]=counts.get(v,0)+1
-        vals.append(v)
-    flush=len({c[1] for c in hand})==1
-    unique=sorted(set(vals))
-    straight=False
-    if len(unique)==5:
-        if unique[-1]-unique[0]==4:
-            straight=True
-            high=unique[-1]
-        elif set(unique)=={2,3,4,5,14}:
-            straight=True
-            high=5
-    items=sorted(counts.items(),key=lambda x:(-x[1],-x[0]))
-    if straight and flush: return (9,[high])
-    if items[0][1]==4: return (8,[items[0][0]]+sorted([v for v in vals if v!=items[0][0]],reverse=True))
-    if items[0][1]==3 and items[1][1]==2: return (7,[items[0][0],items[1][0]])
-    if flush: return (6,sorted(vals,reverse=True))
-    if straight: return (5,[high])
-    if items[0][1]==3: return (4,[items[0][0]]+sorted([v for v in vals if v!=items[0][0]],reverse=True))
-    if items[0][1]==2 and items[1][1]==2:
-        p1,p2=items[0][0],items[1][0]
-        kicker=[v for v in vals if v not in (p1,p2)][0]
-        return (3,sorted([p1,p2],reverse=True)+[kicker])
-    if items[0][1]==2: return (2,[items[0][0]]+sorted([v for v in vals if v!=items[0][0]],reverse=True))
-    return (1,sorted(vals,reverse=True))
+    return hand_strength([CARD_CODES[card] for card in hand])
 
 class PokerApp:
     def __init__(self,master):
@@ -97,8 +82,8 @@ class PokerApp:
         else:
             r0=hand_rank(self.hands[0])
             r1=hand_rank(self.hands[1])
-            self.log.insert(tk.END,f"Игрок 1 рука: {' '.join(self.hands[0])} Ранг: {r0}\n")
-            self.log.insert(tk.END,f"Игрок 2 рука: {' '.join(self.hands[1])} Ранг: {r1}\n")
+            self.log.insert(tk.END,f"Игрок 1 рука: {' '.join(self.hands[0])} Ранг: {HAND_NAMES[r0>>13]}\n")
+            self.log.insert(tk.END,f"Игрок 2 рука: {' '.join(self.hands[1])} Ранг: {HAND_NAMES[r1>>13]}\n")
             if r0>r1: res="Игрок 1 выиграл"
             elif r1>r0: res="Игрок 2 выиграл"
             else: res="Ничья"
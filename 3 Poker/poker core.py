@@ -0,0 +1,131 @@
+import itertools
+import math
+import random
+import time
+from collections import Counter
+
+# Table-driven 5-card hand evaluator shared by every poker game in this folder. A card is packed as
+# rank bit << 16 | suit bit << 12 | rank prime: a flush is an AND over the suit bits, five different
+# ranks are an OR over the rank bits, and every other hand is identified by the product of its rank
+# primes. Strength is category << 13 | order, so hands compare as plain integers and strength >> 13
+# indexes HAND_NAMES.
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+HAND_NAMES = ["High Card", "Pair", "Two Pair", "Three of a Kind", "Straight",
+              "Flush", "Full House", "Four of a Kind", "Straight Flush"]
+GROUP_CATEGORIES = {(4, 1): 7, (3, 2): 6, (3, 1, 1): 3, (2, 2, 1): 2, (2, 1, 1, 1): 1}
+
+def card_code(rank, suit):
+    return 1 << (16 + rank) | 1 << (12 + suit) | PRIMES[rank]
+
+def _build_tables():
+    # every distinct 5-card hand class, keyed the way the rules order them
+    straights = [0x100F] + [0x1F << low for low in range(9)]
+    classes = []
+    for ranks in itertools.combinations(range(12, -1, -1), 5):
+        bits = sum(1 << r for r in ranks)
+        if bits in straights:
+            high = straights.index(bits)
+            classes.append(((8, (high,)), 'flush', bits))
+            classes.append(((4, (high,)), 'unique', bits))
+        else:
+            classes.append(((5, ranks), 'flush', bits))
+            classes.append(((0, ranks), 'unique', bits))
+    for ranks in itertools.combinations_with_replacement(range(13), 5):
+        counts = Counter(ranks)
+        if len(counts) == 5 or max(counts.values()) == 5:
+            continue
+        groups = sorted(counts.items(), key=lambda x: (-x[1], -x[0]))
+        category = GROUP_CATEGORIES[tuple(n for _, n in groups)]
+        classes.append(((category, tuple(r for r, _ in groups)), 'groups', math.prod(PRIMES[r] for r in ranks)))
+    flushes = [0] * 8192
+    unique = [0] * 8192
+    groups = {}
+    for order, ((category, _), kind, key) in enumerate(sorted(classes), 1):
+        strength = category << 13 | order
+        if kind == 'flush':
+            flushes[key] = strength
+        elif kind == 'unique':
+            unique[key] = strength
+        else:
+            groups[key] = strength
+    return flushes, unique, groups
+
+FLUSHES, UNIQUE5, PRODUCTS = _build_tables()
+
+def hand_strength(codes):
+    a, b, c, d, e = codes
+    bits = (a | b | c | d | e) >> 16
+    if a & b & c & d & e & 0xF000:
+        return FLUSHES[bits]
+    return UNIQUE5[bits] or PRODUCTS[(a & 0xFF) * (b & 0xFF) * (c & 0xFF) * (d & 0xFF) * (e & 0xFF)]
+
+class DiscardEngine:
+    # Monte Carlo choice of the cards to throw before the draw. Every hold/discard subset is scored by the
+    # mean strength of the hands it can become: small draws are enumerated exactly, the rest are sampled
+    # from the unseen cards in rounds, and subsets that are clearly behind the leader stop being sampled.
+    def __init__(self, time_budget=0.2, max_discard=5, batch=32, max_samples=3000, exact_limit=1200, z=3.0, seed=None):
+        self.time_budget = time_budget
+        self.max_discard = max_discard
+        self.batch = batch
+        self.max_samples = max_samples
+        self.exact_limit = exact_limit
+        self.z = z
+        self.rng = random.Random(seed)
+        self.stats = {}
+
+    def choose(self, hand, unseen):
+        # hand and unseen are card codes; returns the indices to discard and the expected strength
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        evaluations = 0
+        options = []
+        for k in range(self.max_discard + 1):
+            for discard in itertools.combinations(range(5), k):
+                kept = [code for i, code in enumerate(hand) if i not in discard]
+                # [discard, kept, samples, total, total of squares, exact]
+                option = [discard, kept, 0, 0, 0, False]
+                if math.comb(len(unseen), k) <= self.exact_limit:
+                    for draw in itertools.combinations(unseen, k):
+                        value = hand_strength(kept + list(draw))
+                        option[2] += 1
+                        option[3] += value
+                    option[5] = True
+                    evaluations += option[2]
+                options.append(option)
+
+        def bounds(option):
+            n, total, squares, exact = option[2], option[3], option[4], option[5]
+            mean = total / n
+            if exact:
+                return mean, mean
+            spread = self.z * math.sqrt(max(squares / n - mean * mean, 0) / n)
+            return mean - spread, mean + spread
+
+        alive = options
+        rounds = 0
+        # the first round runs even when exact enumeration has used up the budget, so every option has
+        # samples before it is compared or chosen
+        while len(alive) > 1:
+            sampled = [o for o in alive if not o[5] and o[2] < self.max_samples]
+            if not sampled:
+                break
+            for option in sampled:
+                discard, kept = option[0], option[1]
+                k = len(discard)
+                for _ in range(self.batch):
+                    value = hand_strength(kept + self.rng.sample(unseen, k))
+                    option[2] += 1
+                    option[3] += value
+                    option[4] += value * value
+                evaluations += self.batch
+            rounds += 1
+            best_low = max(bounds(o)[0] for o in alive)
+            alive = [o for o in alive if bounds(o)[1] >= best_low]
+            if time.perf_counter() >= deadline:
+                break
+
+        best = max(alive, key=lambda o: o[3] / o[2])
+        elapsed = time.perf_counter() - start
+        self.stats = {'evaluations': evaluations, 'rounds': rounds, 'candidates': len(alive),
+                      'time_ms': elapsed * 1000}
+        return list(best[0]), best[3] / best[2]
@@ -0,0 +1,119 @@
+import argparse
+import importlib.util
+import json
+import os
+import time
+from array import array
+from collections import Counter
+
+# Reader for the hand histories written by HandHistory in console/poker deepseek.py (the console game
+# and poker simulation.py with --history). Files are read one line at a time, so memory does not grow
+# with their size; every showdown is evaluated again with the game's own evaluator and checked against
+# the recorded winner. --hand jumps straight to one hand through the .idx file next to the history.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def load_game():
+    spec = importlib.util.spec_from_file_location('poker_deepseek', os.path.join(HERE, 'console', 'poker deepseek.py'))
+    poker = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(poker)
+    return poker
+
+def read_hand(path, number):
+    # hands are numbered from 1 in the order they were written
+    offsets = array('Q')
+    with open(path + '.idx', 'rb') as index:
+        count = os.fstat(index.fileno()).st_size // offsets.itemsize
+        if not 1 <= number <= count:
+            raise ValueError(f"{path} has hands 1 to {count}, not {number}")
+        index.seek((number - 1) * offsets.itemsize)
+        offsets.frombytes(index.read(offsets.itemsize))
+    with open(path, 'rb') as f:
+        f.seek(offsets[0])
+        return json.loads(f.readline())
+
+def dealt_hands(record):
+    hands = [list(hand) for hand in record['hands']]
+    for seat, idx, old, new in reversed(record['draws']):
+        hands[seat][idx] = old
+    return hands
+
+def show_hand(poker, record):
+    game = poker.PokerGame
+    names = record['seats']
+    for name, hand in zip(names, dealt_hands(record)):
+        print(f"{name}: {game.card_names(hand)}")
+    for round_no, actions in enumerate(record['actions'], 1):
+        print(f"\nBetting round {round_no}")
+        for seat, action, amount in actions:
+            print(f"  {names[seat]} {action}{f' {amount}' if action == 'raise' else ''}")
+        if round_no == 1:
+            for seat, idx, old, new in record['draws']:
+                print(f"  {names[seat]} draws {game.card_names([new])} for {game.card_names([old])}")
+    print()
+    for seat, (name, hand) in enumerate(zip(names, record['hands'])):
+        if seat not in record['folded']:
+            strength = poker.hand_strength([game.CARD_CODES[card] for card in hand])
+            print(f"{name}: {game.card_names(hand)} ({game.HAND_RANKS[strength >> 13]})")
+    if record['winner'] is not None:
+        print(f"{names[record['winner']]} wins {record['pot']} chips")
+
+def analyse(poker, paths):
+    codes = poker.PokerGame.CARD_CODES
+    players = {}
+    categories = Counter()
+    hands = showdowns = pots = mismatches = 0
+    start = time.perf_counter()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for line in f:
+                record = json.loads(line)
+                hands += 1
+                pots += record['pot']
+                winner = record['winner']
+                live = [seat for seat in range(len(record['seats'])) if seat not in record['folded']]
+                if len(live) > 1:
+                    showdowns += 1
+                    strengths = {seat: poker.hand_strength([codes[card] for card in record['hands'][seat]])
+                                 for seat in live}
+                    # ties go to the first seat, as in PokerGame.compare_hands
+                    best = max(live, key=strengths.get)
+                    mismatches += best != winner
+                    categories[strengths[best] >> 13] += 1
+                for seat, name in enumerate(record['seats']):
+                    s = players.setdefault(name, [0, 0, 0, 0])
+                    s[0] += 1
+                    s[1] += (record['pot'] if seat == winner else 0) - record['bets'][seat]
+                    s[2] += seat == winner
+                    s[3] += len(live) > 1 and seat in live
+    elapsed = time.perf_counter() - start
+
+    print(f"{'player':>12} {'hands':>8} {'net/hand':>9} {'won':>7} {'showdown':>9}")
+    for name, (n, net, won, shown) in sorted(players.items()):
+        print(f"{name:>12} {n:>8} {net / n:>9.2f} {won / n:>7.1%} {shown / n:>9.1%}")
+    print(f"\n{'winning hand':>16} {'showdowns':>10}")
+    for category, n in sorted(categories.items()):
+        print(f"{poker.PokerGame.HAND_RANKS[category]:>16} {n:>10}")
+    if hands:
+        print(f"\n{hands} hands, {showdowns} showdowns, average pot {pots / hands:.1f}, "
+              f"{mismatches} recorded winners differ from the evaluator")
+        print(f"read in {elapsed:.1f}s ({hands / elapsed:.0f} hands/s)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay and analyse poker hand histories")
+    parser.add_argument('files', nargs='+', help="JSON lines histories")
+    parser.add_argument('--hand', type=int, help="print this hand of the first file (from 1)")
+    args = parser.parse_args()
+
+    poker = load_game()
+    if args.hand is not None:
+        try:
+            record = read_hand(args.files[0], args.hand)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        show_hand(poker, record)
+    else:
+        analyse(poker, args.files)
+
+if __name__ == "__main__":
+    main()
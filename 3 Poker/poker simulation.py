@@ -0,0 +1,208 @@
+import argparse
+import importlib.util
+import math
+import multiprocessing as mp
+import os
+import random
+import time
+from collections import Counter
+
+# Headless five-card draw. Hands are played with PokerGame from console/poker deepseek.py (ante,
+# two betting rounds, draw, showdown) between bot strategies; workers play chunks of hands with their
+# own seeded random streams and the main process adds the results up per strategy. The discard engine
+# takes a fixed number of samples per option instead of a time budget, so a seed fixes every result.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STACK = 10000
+poker = None
+strategies = None
+history = None
+
+def load_game(history_path=None):
+    global poker, strategies, history
+    spec = importlib.util.spec_from_file_location('poker_deepseek', os.path.join(HERE, 'console', 'poker deepseek.py'))
+    poker = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(poker)
+    strategies = strategy_classes()
+    if history_path:
+        # one file per worker, the main process never sees the records
+        history = poker.HandHistory(f"{history_path}.{os.getpid()}.jsonl")
+
+def strategy_classes():
+    def codes(hand):
+        return [poker.PokerGame.CARD_CODES[card] for card in hand]
+
+    class EngineBot(poker.Player):
+        # the game's own bot: discard engine at the draw, expected category when betting
+        choice = (None, None)
+
+        def choose_discard(self):
+            # betting before the draw already searched this hand
+            key = self.hand.tobytes()
+            if self.choice[0] != key:
+                self.choice = (key, super().choose_discard())
+            return self.choice[1]
+
+        def discard(self):
+            return self.choose_discard()[0]
+
+    class RandomBot(poker.Player):
+        # the bot before the discard engine: random draws, bets on the largest rank count
+        def make_decision(self, call_amount, current_bet):
+            strength = max(Counter(card >> 2 for card in self.hand).values())
+            if call_amount == 0:
+                return "call", 0
+            if strength < 2 and call_amount > 5 or strength == 2 and call_amount > 10:
+                return "fold", 0
+            if strength >= 3 or random.random() > 0.3:
+                if self.chips > call_amount + 5 and random.random() > 0.7:
+                    return "raise", 5
+                return "call", 0
+            return "fold", 0
+
+        def discard(self):
+            return random.sample(range(5), random.randint(0, 3))
+
+    class CallingStation(poker.Player):
+        def make_decision(self, call_amount, current_bet):
+            return "call", 0
+
+        def discard(self):
+            return []
+
+    class TightBot(poker.Player):
+        # plays made hands only: folds without a pair, raises two pair or better up to four raises
+        def make_decision(self, call_amount, current_bet):
+            category = poker.hand_strength(codes(self.hand)) >> 13
+            if category >= 2 and current_bet < 25 and self.chips > call_amount + 5:
+                return "raise", 5
+            if category >= 1 or call_amount == 0:
+                return "call", 0
+            return "fold", 0
+
+        def discard(self):
+            # keep paired ranks, throw the lowest odd cards, at most three
+            ranks = [card >> 2 for card in self.hand]
+            loose = [i for i, rank in enumerate(ranks) if ranks.count(rank) == 1]
+            loose.sort(key=ranks.__getitem__)
+            return loose[:3]
+
+    return {'engine': EngineBot, 'random': RandomBot, 'station': CallingStation, 'tight': TightBot}
+
+def play_chunk(task):
+    names, hands, seed, ante, samples, exact_limit, first_hand = task
+    random.seed(seed)
+    players = []
+    for seat, name in enumerate(names):
+        player = strategies[name](f"{name} {seat + 1}", STACK)
+        player.strategy = name
+        player.engine = poker.DiscardEngine(time_budget=math.inf, max_discard=3, batch=min(samples, 32),
+                                             max_samples=samples, exact_limit=exact_limit,
+                                             seed=random.getrandbits(64))
+        players.append(player)
+    stats = {name: {'hands': 0, 'net': 0, 'showdowns': 0, 'wins': 0, 'time': 0.0} for name in names}
+    timers = {}
+
+    def timed(player, method):
+        # time spent inside each strategy's own decisions
+        def call(*args):
+            start = time.perf_counter()
+            try:
+                return method(*args)
+            finally:
+                timers[player.strategy] = timers.get(player.strategy, 0.0) + time.perf_counter() - start
+        return call
+
+    for player in players:
+        player.make_decision = timed(player, player.make_decision)
+        player.discard = timed(player, player.discard)
+
+    game = poker.PokerGame(list(players))
+    start = time.perf_counter()
+    for hand in range(first_hand, first_hand + hands):
+        # seats rotate every hand so no strategy keeps the first position
+        shift = hand % len(players)
+        game.players = players[shift:] + players[:shift]
+        game.reset_game()
+        for player in players:
+            player.chips = STACK
+        game.ante_up(ante)
+        game.deal_cards()
+        for player in game.players:
+            player.can_act = True
+        game.betting_round(0)
+        if sum(1 for p in game.players if not p.folded) > 1:
+            for player in game.players:
+                if not player.folded:
+                    game.draw_cards(player, player.discard())
+            for player in game.players:
+                player.can_act = True
+            game.betting_round(1)
+        active = [p for p in game.players if not p.folded]
+        winner, _ = game.compare_hands({p: p.hand for p in game.players})
+        if winner:
+            winner.chips += game.pot
+        if history:
+            history.record(game.hand_record(winner))
+        for player in players:
+            s = stats[player.strategy]
+            s['hands'] += 1
+            s['net'] += player.chips - STACK
+            if len(active) > 1 and player in active:
+                s['showdowns'] += 1
+                s['wins'] += player is winner
+    for name, spent in timers.items():
+        stats[name]['time'] += spent
+    if history:
+        history.flush()
+    return stats, hands, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Five-card draw simulation between bot strategies")
+    parser.add_argument('--players', nargs='+', default=['engine', 'random', 'station', 'tight'],
+                        choices=['engine', 'random', 'station', 'tight'], help="one strategy per seat")
+    parser.add_argument('--hands', type=int, default=10000)
+    parser.add_argument('--chunk', type=int, default=500, help="hands per worker task")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--ante', type=int, default=5, help="also the unit of the bb/100 column")
+    parser.add_argument('--samples', type=int, default=16, help="draws the discard engine samples per option")
+    parser.add_argument('--exact-limit', type=int, default=50, help="draws the discard engine enumerates instead of sampling")
+    parser.add_argument('--seed', type=int, default=1, help="with --chunk, fixes every result")
+    parser.add_argument('--history', help="write hand histories to HISTORY.<pid>.jsonl, one file per worker")
+    args = parser.parse_args()
+    if len(set(args.players)) != len(args.players):
+        parser.error("each strategy can take one seat")
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+
+    seeds = random.Random(args.seed)
+    tasks = []
+    for first in range(0, args.hands, args.chunk):
+        tasks.append((args.players, min(args.chunk, args.hands - first), seeds.getrandbits(64),
+                      args.ante, args.samples, args.exact_limit, first))
+
+    totals = {name: {'hands': 0, 'net': 0, 'showdowns': 0, 'wins': 0, 'time': 0.0} for name in args.players}
+    played = 0
+    busy = 0.0
+    start = time.perf_counter()
+    with mp.Pool(args.workers, initializer=load_game, initargs=(args.history,)) as pool:
+        for stats, hands, elapsed in pool.imap_unordered(play_chunk, tasks):
+            for name, s in stats.items():
+                for key, value in s.items():
+                    totals[name][key] += value
+            played += hands
+            busy += elapsed
+    wall = time.perf_counter() - start
+
+    print(f"{'strategy':>10} {'hands':>8} {'bb/100':>9} {'showdown':>9} {'sd won':>7} {'hands/s':>10}")
+    for name, s in totals.items():
+        bb100 = s['net'] / args.ante / s['hands'] * 100
+        showdown = s['showdowns'] / s['hands']
+        won = s['wins'] / s['showdowns'] if s['showdowns'] else 0
+        speed = s['hands'] / s['time'] if s['time'] else float('inf')
+        print(f"{name:>10} {s['hands']:>8} {bb100:>9.1f} {showdown:>9.1%} {won:>7.1%} {speed:>10.0f}")
+    print(f"\n{played} hands in {wall:.1f}s: {played / wall:.0f} hands/s overall, "
+          f"{played / busy:.0f} hands/s per worker")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ class MemoryGame:
     def __init__(self, pairs=8):
         self.cards = self._create_cards(pairs)
         self.board = ['*' for _ in range(len(self.cards))]
+        self.indices = "Indices: " + " ".join([str(i) for i in range(len(self.board))])
         self.matched_pairs = 0
         self.player_scores = {}
         self.current_player_index = 0
@@ -21,7 +22,7 @@ class MemoryGame:
 
     def display_board(self):
         print("\n" + " ".join(self.board))
-        print("Indices: " + " ".join([str(i) for i in range(len(self.board))]))
+        print(self.indices)
 
     def is_game_over(self):
         return self.matched_pairs == len(self.cards) // 2
@@ -1,11 +1,24 @@
+import argparse
 import random
+import shutil
+import sys
+from collections import deque
 
 ROWS=4
 COLS=4
 PAIRS=ROWS*COLS//2
 
+def label(i):
+    # A..Z, then AA, AB, ... for boards with more than 26 pairs
+    s=''
+    i+=1
+    while i:
+        i,r=divmod(i-1,26)
+        s=chr(ord('A')+r)+s
+    return s
+
 def init_board():
-    cards=[chr(ord('A')+i) for i in range(PAIRS)]*2
+    cards=[label(i) for i in range(PAIRS)]*2
     random.shuffle(cards)
     return cards
 
@@ -21,10 +34,88 @@ def print_board(board,revealed,temp):
         print(' '.join(row))
     print()
 
+ESC='\x1b['
+
+class Screen:
+    # Terminal view that draws the board once and afterwards rewrites only the cells that change,
+    # with ANSI cursor moves; messages use the lines under the board. A board larger than the terminal
+    # is shown a page at a time, and the page moves to the cards turned face up outside it.
+    def __init__(self,board,revealed):
+        self.board=board
+        self.revealed=revealed
+        self.temp=()
+        self.lines=[]
+        self.cell=max(len(label(PAIRS-1)),len(str(COLS)))+1
+        self.margin=len(str(ROWS))+1
+        size=shutil.get_terminal_size()
+        self.height=max(1,min(ROWS,size.lines-9))
+        self.width=max(1,min(COLS,(size.columns-self.margin)//self.cell))
+        self.top=self.left=0
+        self.draw()
+
+    def face(self,idx):
+        return self.board[idx] if self.revealed[idx] or idx in self.temp else '*'
+
+    def visible(self,idx):
+        r,c=divmod(idx,COLS)
+        return self.top<=r<self.top+self.height and self.left<=c<self.left+self.width
+
+    def center(self,cards):
+        # all face up cards when they fit on one page, otherwise the last one
+        rows=[idx//COLS for idx in cards]
+        cols=[idx%COLS for idx in cards]
+        if max(rows)-min(rows)>=self.height or max(cols)-min(cols)>=self.width:
+            rows,cols=rows[-1:],cols[-1:]
+        top=min(rows)-(self.height-1-(max(rows)-min(rows)))//2
+        left=min(cols)-(self.width-1-(max(cols)-min(cols)))//2
+        self.top=min(max(0,top),ROWS-self.height)
+        self.left=min(max(0,left),COLS-self.width)
+
+    def draw(self):
+        # the whole page, then the messages of this turn again under it
+        cols=range(self.left,self.left+self.width)
+        out=[ESC+'2J'+ESC+'H'+' '*self.margin]+[f"{c+1:>{self.cell}}" for c in cols]
+        for r in range(self.top,self.top+self.height):
+            out.append(f"\n{r+1:>{self.margin}}")
+            out+=[f"{self.face(r*COLS+c):>{self.cell}}" for c in cols]
+        out.append('\n\n'+''.join(line+'\n' for line in self.lines))
+        sys.stdout.write(''.join(out))
+
+    def say(self,text):
+        self.lines.append(text)
+        print(text)
+
+    def show(self,temp,changed,clear=False):
+        # temp are the cards face up this turn, changed the ones whose face may have changed
+        self.temp=temp
+        if clear:
+            self.lines=[]
+        if any(idx in temp and not self.visible(idx) for idx in changed):
+            self.center(temp)
+            self.draw()
+            sys.stdout.flush()
+            return
+        out=[ESC+'s']
+        for idx in changed:
+            if self.visible(idx):
+                r,c=divmod(idx,COLS)
+                out.append(f"{ESC}{r-self.top+2};{self.margin+(c-self.left)*self.cell+1}H{self.face(idx):>{self.cell}}")
+        if clear:
+            out.append(f"{ESC}{self.height+3};1H{ESC}J")
+        else:
+            out.append(ESC+'u')
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+
 def get_choice(board,revealed,temp):
     while True:
         try:
-            n=int(input(f"Choose card (1-{ROWS*COLS}): "))-1
+            nums=[int(x) for x in input(f"Choose card (1-{ROWS*COLS} or row column): ").split()]
+            n=-1
+            if len(nums)==1:
+                n=nums[0]-1
+            elif len(nums)==2 and 1<=nums[1]<=COLS:
+                n=(nums[0]-1)*COLS+nums[1]-1
             if 0<=n<ROWS*COLS and not revealed[n] and n not in temp:
                 return n
         except:
@@ -39,29 +130,140 @@ def make_move(board,revealed,p1,p2,current,scores):
         return True
     return False
 
-def check_win(scores):
-    return sum(scores.values())==PAIRS
+def check_win(left):
+    return left==0
+
+class Bot:
+    # Remembers flipped cards: seen maps a value to its known positions, unknown holds the positions
+    # never seen (or forgotten) with where[pos] as the index into it, so every step is O(1).
+    # memory=None is perfect recall, memory=n keeps only the last n sightings.
+    def __init__(self,size,memory=None,rng=random):
+        self.memory=memory
+        self.rng=rng
+        self.unknown=list(range(size))
+        self.where=list(range(size))
+        self.seen={}
+        self.pairs=[]
+        self.recent=deque()
+
+    def _take(self,pos):
+        i=self.where[pos]
+        if i<0:
+            return
+        last=self.unknown.pop()
+        if last!=pos:
+            self.unknown[i]=last
+            self.where[last]=i
+        self.where[pos]=-1
+
+    def _forget(self,pos,value):
+        known=self.seen.get(value)
+        if known and pos in known:
+            known.remove(pos)
+            self.where[pos]=len(self.unknown)
+            self.unknown.append(pos)
+
+    def observe(self,pos,value):
+        known=self.seen.setdefault(value,[])
+        if pos in known:
+            return
+        self._take(pos)
+        known.append(pos)
+        if len(known)==2:
+            self.pairs.append(value)
+        if self.memory is not None:
+            self.recent.append((pos,value))
+            if len(self.recent)>self.memory:
+                self._forget(*self.recent.popleft())
+
+    def removed(self,p1,p2,value):
+        self._take(p1)
+        self._take(p2)
+        self.seen.pop(value,None)
+
+    def first(self):
+        # a known pair if there is one (entries that were forgotten or taken are skipped), else a guess
+        while self.pairs:
+            known=self.seen.get(self.pairs.pop())
+            if known and len(known)==2:
+                return known[0]
+        return self.unknown[self.rng.randrange(len(self.unknown))]
+
+    def second(self,p1,value):
+        for pos in self.seen.get(value,()):
+            if pos!=p1:
+                return pos
+        pos=p1
+        while pos==p1:
+            pos=self.unknown[self.rng.randrange(len(self.unknown))]
+        return pos
 
 def main():
+    global ROWS,COLS,PAIRS
+    parser=argparse.ArgumentParser(description="Memory for two players")
+    parser.add_argument('--bot',nargs='?',const='perfect',help="player 2 is a bot remembering this many cards (default: all)")
+    parser.add_argument('--rows',type=int,default=ROWS)
+    parser.add_argument('--cols',type=int,default=COLS)
+    args=parser.parse_args()
+    if args.rows*args.cols%2:
+        parser.error("the board needs an even number of cards")
+    ROWS,COLS,PAIRS=args.rows,args.cols,args.rows*args.cols//2
     board=init_board()
-    revealed=[False]*(ROWS*COLS)
+    # one byte per card for matched cards, and a count of the pairs still on the board
+    revealed=bytearray(ROWS*COLS)
+    left=PAIRS
     scores={1:0,2:0}
     current=1
+    bot=None
+    if args.bot:
+        bot=Bot(ROWS*COLS,None if args.bot=='perfect' else int(args.bot))
+    screen=Screen(board,revealed) if sys.stdout.isatty() else None
+
+    def show(temp,changed,clear=False):
+        if screen:
+            screen.show(temp,changed,clear)
+        else:
+            print_board(board,revealed,temp)
+
+    def say(text):
+        if screen:
+            screen.say(text)
+        else:
+            print(text)
+
+    last=()
     while True:
-        print_board(board,revealed,[])
-        print(f"Player {current}'s turn")
-        p1=get_choice(board,revealed,[])
-        print_board(board,revealed,[p1])
-        p2=get_choice(board,revealed,[p1])
-        print_board(board,revealed,[p1,p2])
+        show((),last,True)
+        say(f"Player {current}'s turn")
+        if bot and current==2:
+            p1=bot.first()
+            say(f"Bot flips {p1+1}")
+        else:
+            p1=get_choice(board,revealed,[])
+        show((p1,),(p1,))
+        if bot:
+            bot.observe(p1,board[p1])
+        if bot and current==2:
+            p2=bot.second(p1,board[p1])
+            say(f"Bot flips {p2+1}")
+        else:
+            p2=get_choice(board,revealed,[p1])
+        show((p1,p2),(p2,))
+        last=(p1,p2)
+        if bot:
+            bot.observe(p2,board[p2])
         if make_move(board,revealed,p1,p2,current,scores):
-            print("Match!")
-            if check_win(scores):
+            if bot:
+                bot.removed(p1,p2,board[p1])
+            say("Match!")
+            left-=1
+            if check_win(left):
                 break
         else:
-            print("No match")
+            say("No match")
             current=1 if current==2 else 2
         input("Press Enter to continue")
+    show((),(),True)
     print("Game over. Scores:",scores)
     if scores[1]>scores[2]:
         print("Player 1 wins")
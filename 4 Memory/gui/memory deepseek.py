@@ -4,10 +4,13 @@ import random
 import time
 
 class MemoryGameGUI:
+    BOARD_PIXELS = 400
+    COLORS = {'hidden': "lightgray", 'visible': "lightblue", 'matched': "green"}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Memory Game")
-        self.root.geometry("600x600")
+        self.root.geometry("600x750")
         
         self.num_pairs = 8
         self.board_size = 16
@@ -20,7 +23,10 @@ class MemoryGameGUI:
         self.first_card = None
         self.second_card = None
         self.game_over = False
-        self.card_buttons = []
+        # (rectangle, text) canvas items of every card, kept from game to game
+        self.card_items = []
+        self.side = 0
+        self.cell = 0
         
         self.create_widgets()
         self.new_game()
@@ -38,6 +44,11 @@ class MemoryGameGUI:
         self.player_menu = tk.OptionMenu(self.control_frame, self.player_var, "1", "2", "3", "4")
         self.player_menu.pack(side=tk.LEFT, padx=5)
         
+        tk.Label(self.control_frame, text="Size:").pack(side=tk.LEFT, padx=5)
+        self.size_var = tk.StringVar(value="4")
+        self.size_menu = tk.OptionMenu(self.control_frame, self.size_var, "4", "6", "8", "10", "16", "20")
+        self.size_menu.pack(side=tk.LEFT, padx=5)
+        
         # Status frame
         self.status_frame = tk.Frame(self.root)
         self.status_frame.pack(pady=5)
@@ -48,9 +59,11 @@ class MemoryGameGUI:
         self.score_label = tk.Label(self.status_frame, text="Scores: P1: 0")
         self.score_label.pack(side=tk.LEFT, padx=10)
         
-        # Game board
-        self.board_frame = tk.Frame(self.root)
-        self.board_frame.pack(pady=10)
+        # Game board: one canvas, a rectangle and a text item per card
+        self.board_canvas = tk.Canvas(self.root, width=self.BOARD_PIXELS, height=self.BOARD_PIXELS,
+                                      highlightthickness=0)
+        self.board_canvas.pack(pady=10)
+        self.board_canvas.bind("<Button-1>", self.on_board_click)
         
         # Game log
         self.log_frame = tk.LabelFrame(self.root, text="Game Log")
@@ -67,11 +80,9 @@ class MemoryGameGUI:
         self.log_area.config(state=tk.DISABLED)
     
     def new_game(self):
-        # Clear previous board
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
-        
-        self.card_buttons = []
+        side = int(self.size_var.get())
+        self.num_pairs = side * side // 2
+        self.board_size = side * side
         self.players = int(self.player_var.get())
         self.scores = [0] * self.players
         self.current_player = 0
@@ -85,25 +96,46 @@ class MemoryGameGUI:
         self.board = symbols
         self.state = ['hidden'] * self.board_size
         
-        # Create card buttons
-        for i in range(4):
-            for j in range(4):
-                index = i * 4 + j
-                btn = tk.Button(
-                    self.board_frame, 
-                    text="?", 
-                    width=4, 
-                    height=2,
-                    font=("Arial", 14),
-                    command=lambda idx=index: self.card_click(idx)
-                )
-                btn.grid(row=i, column=j, padx=5, pady=5)
-                self.card_buttons.append(btn)
+        # Reuse the card items; two tag-wide calls turn every card face down
+        self.layout_cards(side)
+        self.board_canvas.itemconfig('card', fill=self.COLORS['hidden'])
+        self.board_canvas.itemconfig('label', text="?")
         
         self.update_status()
         self.log("=== New game started ===")
         self.log(f"Players: {self.players}")
     
+    def layout_cards(self, side):
+        # items are only added, removed or moved when the board size changes
+        if side == self.side:
+            return
+        canvas = self.board_canvas
+        while len(self.card_items) < side * side:
+            rect = canvas.create_rectangle(0, 0, 0, 0, outline="gray", tags='card')
+            text = canvas.create_text(0, 0, tags='label')
+            self.card_items.append((rect, text))
+        while len(self.card_items) > side * side:
+            canvas.delete(*self.card_items.pop())
+        self.side = side
+        self.cell = self.BOARD_PIXELS // side
+        pad = max(1, self.cell // 12)
+        for index, (rect, text) in enumerate(self.card_items):
+            row, col = divmod(index, side)
+            x, y = col * self.cell, row * self.cell
+            canvas.coords(rect, x + pad, y + pad, x + self.cell - pad, y + self.cell - pad)
+            canvas.coords(text, x + self.cell / 2, y + self.cell / 2)
+        canvas.itemconfig('label', font=("Arial", max(6, self.cell // 4)))
+    
+    def on_board_click(self, event):
+        row, col = event.y // self.cell, event.x // self.cell
+        if 0 <= row < self.side and 0 <= col < self.side:
+            self.card_click(row * self.side + col)
+    
+    def show_card(self, index, text):
+        rect, label = self.card_items[index]
+        self.board_canvas.itemconfig(rect, fill=self.COLORS[self.state[index]])
+        self.board_canvas.itemconfig(label, text=text)
+    
     def update_status(self):
         self.player_label.config(text=f"Player: {self.current_player + 1}")
         score_text = "Scores: " + ", ".join([f"P{i+1}: {s}" for i, s in enumerate(self.scores)])
@@ -132,19 +164,19 @@ class MemoryGameGUI:
     
     def reveal_card(self, index):
         self.state[index] = 'visible'
-        self.card_buttons[index].config(text=str(self.board[index]), bg="lightblue")
+        self.show_card(index, str(self.board[index]))
     
     def hide_card(self, index):
         self.state[index] = 'hidden'
-        self.card_buttons[index].config(text="?", bg="SystemButtonFace")
+        self.show_card(index, "?")
     
     def check_match(self):
         if self.board[self.first_card] == self.board[self.second_card]:
             # Match found
             self.state[self.first_card] = 'matched'
             self.state[self.second_card] = 'matched'
-            self.card_buttons[self.first_card].config(bg="green", state=tk.DISABLED)
-            self.card_buttons[self.second_card].config(bg="green", state=tk.DISABLED)
+            for index in (self.first_card, self.second_card):
+                self.board_canvas.itemconfig(self.card_items[index][0], fill=self.COLORS['matched'])
             self.scores[self.current_player] += 1
             
             self.log(f"Player {self.current_player+1} found a match!")
@@ -1,3 +1,4 @@
+import math
 import random
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, simpledialog
@@ -103,6 +104,8 @@ class MemoryGame:
             self.gui_app.log_message(f"The winner is {winners[0]} with {highest_score} pairs!")
 
 class MemoryGUI:
+    BOARD_PIXELS = 400
+
     def __init__(self, master):
         self.master = master
         master.title("Memory Game")
@@ -114,9 +117,16 @@ class MemoryGUI:
         self.log_text = scrolledtext.ScrolledText(master, state='disabled', width=60, height=15)
         self.log_text.grid(row=0, column=0, columnspan=4, padx=5, pady=5)
 
-        self.board_frame = tk.Frame(master, borderwidth=2, relief="groove")
-        self.board_frame.grid(row=1, column=0, columnspan=4, padx=5, pady=5)
-        self.card_buttons = []
+        # The board is one canvas with a rectangle and a text item per card. The items stay between games
+        # and self.shown keeps what each one displays, so a redraw only touches cards that changed.
+        self.board_canvas = tk.Canvas(master, width=self.BOARD_PIXELS, height=self.BOARD_PIXELS,
+                                      borderwidth=2, relief="groove", highlightthickness=0)
+        self.board_canvas.grid(row=1, column=0, columnspan=4, padx=5, pady=5)
+        self.board_canvas.bind("<Button-1>", self.on_board_click)
+        self.card_items = []
+        self.shown = []
+        self.cols = 1
+        self.cell = 1
 
         self.current_player_label = tk.Label(master, text="Current Player:")
         self.current_player_label.grid(row=2, column=0, columnspan=4)
@@ -143,18 +153,36 @@ class MemoryGUI:
     def show_error(self, message):
         messagebox.showerror("Error", message)
 
-    def update_board_display(self, board):
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
+    def reset_board(self, size):
+        canvas = self.board_canvas
+        if size != len(self.card_items):
+            while len(self.card_items) < size:
+                rect = canvas.create_rectangle(0, 0, 0, 0, outline="gray", tags='card')
+                text = canvas.create_text(0, 0, tags='label')
+                self.card_items.append((rect, text))
+            while len(self.card_items) > size:
+                canvas.delete(*self.card_items.pop())
+            self.cols = math.ceil(math.sqrt(size))
+            self.cell = self.BOARD_PIXELS // self.cols
+            pad = max(1, self.cell // 12)
+            for i, (rect, text) in enumerate(self.card_items):
+                x, y = i % self.cols * self.cell, i // self.cols * self.cell
+                canvas.coords(rect, x + pad, y + pad, x + self.cell - pad, y + self.cell - pad)
+                canvas.coords(text, x + self.cell / 2, y + self.cell / 2)
+            canvas.itemconfig('label', font=("Arial", max(6, self.cell // 4)))
+        canvas.itemconfig('card', fill="lightgray")
+        canvas.itemconfig('label', text='*')
+        self.shown = ['*'] * size
 
-        cols = 4 # Or another suitable number for layout
+    def update_board_display(self, board):
+        if len(board) != len(self.shown):
+            self.reset_board(len(board))
         for i, card_value in enumerate(board):
-            button = tk.Button(self.board_frame, text=card_value, width=5, height=2,
-                               command=lambda idx=i: self.on_card_click(idx))
-            button.grid(row=i // cols, column=i % cols, padx=2, pady=2)
-            self.card_buttons.append(button)
-            if card_value != '*': # If card is revealed (matched), disable button
-                button.config(state=tk.DISABLED)
+            if card_value != self.shown[i]:
+                rect, text = self.card_items[i]
+                self.board_canvas.itemconfig(rect, fill="lightgray" if card_value == '*' else "white")
+                self.board_canvas.itemconfig(text, text=card_value)
+                self.shown[i] = card_value
 
     def update_game_state(self):
         if self.game:
@@ -194,11 +222,17 @@ class MemoryGUI:
             self.show_error(f"Invalid number of players: {e}. Defaulting to 2 players.")
             num_players = 2
 
+        pairs = simpledialog.askinteger("Number of Pairs", "Enter number of pairs (2-200):",
+                                        initialvalue=num_pairs, minvalue=2, maxvalue=200)
+        if pairs is not None:
+            num_pairs = pairs
+
         self.player_names = [f"Player {i+1}" for i in range(num_players)] # Simple player names for GUI example
 
         self.game = MemoryGame(pairs=num_pairs, gui_app=self)
         for name in self.player_names:
             self.game.add_player(name)
+        self.reset_board(len(self.game.board))
 
         self.game.display_board()
         self.log_message("Instructions:")
@@ -226,6 +260,12 @@ class MemoryGUI:
         except Exception as e:
             self.show_error(f"An error occurred: {e}")
 
+    def on_board_click(self, event):
+        col, row = event.x // self.cell, event.y // self.cell
+        index = row * self.cols + col
+        if col < self.cols and 0 <= index < len(self.card_items):
+            self.on_card_click(index)
+
     def on_card_click(self, index):
         # This allows clicking on the card buttons directly
         if self.game and len(self.game.flipped_cards) < 2:
@@ -0,0 +1,155 @@
+import argparse
+import time
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Monte Carlo statistics of Memory game length and scores, for sizing boards. Whole batches of games
+# are played in lockstep as NumPy arrays: one row per game for the shuffled cards, the matched mask and
+# every bot's memory. The bots play like Bot in console/memory o4.py: take a pair whose two cards they
+# remember, otherwise turn up an unknown card, then its partner if they remember it, otherwise another
+# unknown card. A bot that remembers N cards keeps the last N positions it saw for the first time.
+
+NEVER = np.iinfo(np.int32).min + 1 if np else None
+PERFECT = 1 << 30
+PERCENTILES = [5, 25, 50, 75, 95, 99]
+
+def parse_bot(spec):
+    if spec == 'perfect':
+        return PERFECT
+    if spec == 'random':
+        return 0
+    name, _, n = spec.partition(':')
+    if name != 'memory' or not n.isdigit():
+        raise argparse.ArgumentTypeError(f"unknown bot {spec!r}")
+    return int(n)
+
+def parse_size(spec):
+    # ROWSxCOLS as in memory o4.py, or a number of pairs as in the deepseek MemoryGame
+    rows, x, cols = spec.partition('x')
+    if x:
+        if not (rows.isdigit() and cols.isdigit()) or int(rows) * int(cols) % 2:
+            raise argparse.ArgumentTypeError(f"bad board size {spec!r}")
+        return spec, int(rows) * int(cols) // 2
+    if not spec.isdigit() or int(spec) < 1:
+        raise argparse.ArgumentTypeError(f"bad board size {spec!r}")
+    return '', int(spec)
+
+def play_batch(rng, n, pairs, memories, max_turns):
+    players = len(memories)
+    size = 2 * pairs
+    cards = rng.permuted(np.tile(np.repeat(np.arange(pairs, dtype=np.int32), 2), (n, 1)), axis=1)
+    # partner[g, i] is the position of the other card with the value of card i
+    order = np.argsort(cards, axis=1, kind='stable')
+    partner = np.empty_like(order)
+    rows = np.arange(n)[:, None]
+    partner[rows, order[:, 0::2]] = order[:, 1::2]
+    partner[rows, order[:, 1::2]] = order[:, 0::2]
+
+    matched = np.zeros((n, size), bool)
+    # seen[p, g, i] is the sighting number at which player p first saw card i, clock[p, g] counts them;
+    # the card is remembered while seen >= clock - memory
+    seen = np.full((players, n, size), NEVER, np.int32)
+    clock = np.zeros((players, n), np.int32)
+    memory = np.array(memories, np.int32)
+    current = np.arange(n) % players
+    scores = np.zeros((n, players), np.int32)
+    turns = np.zeros((n, players), np.int32)
+    left = np.full(n, pairs)
+
+    def observe(g, pos):
+        for p in range(players):
+            new = seen[p, g, pos] < clock[p, g] - memory[p]
+            seen[p, g[new], pos[new]] = clock[p, g[new]]
+            clock[p, g[new]] += 1
+
+    def remembered(g, cp):
+        return (seen[cp, g] >= (clock[cp, g] - memory[cp])[:, None]) & ~matched[g]
+
+    def random_pick(candidates):
+        keys = rng.random(candidates.shape)
+        keys[~candidates] = -1
+        return keys.argmax(1)
+
+    for _ in range(max_turns or np.iinfo(np.int64).max):
+        g = np.nonzero(left)[0]
+        if not len(g):
+            break
+        cp = current[g]
+        turns[g, cp] += 1
+        at = np.arange(len(g))
+        known = remembered(g, cp)
+        pair = known & np.take_along_axis(known, partner[g], 1)
+        p1 = np.where(pair.any(1), pair.argmax(1), random_pick(~known & ~matched[g]))
+        observe(g, p1)
+        mate = partner[g, p1]
+        known = remembered(g, cp)
+        unknown = ~known & ~matched[g]
+        unknown[at, p1] = False
+        p2 = np.where(known[at, mate], mate, random_pick(unknown))
+        observe(g, p2)
+        hit = p2 == mate
+        matched[g[hit], p1[hit]] = True
+        matched[g[hit], p2[hit]] = True
+        scores[g[hit], cp[hit]] += 1
+        left[g[hit]] -= 1
+        miss = g[~hit]
+        current[miss] = (current[miss] + 1) % players
+    return turns, scores, left == 0
+
+def table(title, rows):
+    print(f"{title:<22} {'mean':>8} " + " ".join(f"{'p' + str(q):>7}" for q in PERCENTILES))
+    for name, values in rows:
+        print(f"{name:<22} {values.mean():>8.2f} " + " ".join(f"{v:>7.0f}" for v in np.percentile(values, PERCENTILES)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory game length and score distributions")
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[parse_size(s) for s in ('4x4', '6x6', '8x8')],
+                        help="ROWSxCOLS or a number of pairs")
+    parser.add_argument('--bots', nargs='+', default=['perfect'], help="one bot per player: perfect, random or memory:N")
+    parser.add_argument('--games', type=int, default=100000, help="games per board size")
+    parser.add_argument('--batch', type=int, default=20000, help="games played together as one set of arrays")
+    parser.add_argument('--max-turns', type=int, default=0, help="stop unfinished games after this many turns")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    if np is None:
+        print("The analysis needs numpy")
+        return
+    try:
+        memories = [parse_bot(spec) for spec in args.bots]
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    rng = np.random.default_rng(args.seed)
+    for name, pairs in args.sizes:
+        turns, scores, done = [], [], []
+        start = time.perf_counter()
+        for first in range(0, args.games, args.batch):
+            t, s, d = play_batch(rng, min(args.batch, args.games - first), pairs, memories, args.max_turns)
+            turns.append(t)
+            scores.append(s)
+            done.append(d)
+        elapsed = time.perf_counter() - start
+        turns, scores, done = np.concatenate(turns), np.concatenate(scores), np.concatenate(done)
+
+        print(f"\n{name + ', ' if name else ''}{pairs} pairs: {' vs '.join(args.bots)}")
+        rows = [("turns", turns.sum(1))]
+        if len(memories) > 1:
+            rows += [(f"turns P{p + 1} {spec}", turns[:, p]) for p, spec in enumerate(args.bots)]
+            rows += [(f"pairs P{p + 1} {spec}", scores[:, p]) for p, spec in enumerate(args.bots)]
+        # stopped games are in the table with the turns and pairs they had reached
+        table("" if done.all() else f"censored at {args.max_turns} turns", rows)
+        if len(memories) > 1:
+            best = scores.max(1, keepdims=True)
+            share = (scores == best) / (scores == best).sum(1, keepdims=True)
+            if done.any():
+                print("wins " + ", ".join(f"P{p + 1} {w:.1%}" for p, w in enumerate(share[done].mean(0))))
+            else:
+                print("wins: no game finished")
+        if not done.all():
+            print(f"{(~done).sum()} games stopped after {args.max_turns} turns")
+        print(f"{len(turns)} games in {elapsed:.2f}s ({len(turns) / elapsed:.0f} games/s)")
+
+if __name__ == "__main__":
+    main()
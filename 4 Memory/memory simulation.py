@@ -0,0 +1,129 @@
+import argparse
+import importlib.util
+import multiprocessing as mp
+import os
+import random
+import time
+
+# Headless Memory games between bots. The rules are the ones of console/memory o4.py (init_board,
+# make_move, check_win on a flat cards list with a revealed bytearray) and the players are its Bot class
+# with perfect or limited recall. Workers play chunks of games with their own seeded random streams.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+game = None
+
+def load_game(rows, cols):
+    global game
+    spec = importlib.util.spec_from_file_location('memory_o4', os.path.join(HERE, 'console', 'memory o4.py'))
+    game = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(game)
+    # the o4 rules read the board size from module constants
+    game.ROWS, game.COLS, game.PAIRS = rows, cols, rows * cols // 2
+
+def parse_bot(spec):
+    # 'perfect' remembers everything, 'memory:N' the last N cards seen, 'random' nothing
+    if spec == 'perfect':
+        return None
+    if spec == 'random':
+        return 0
+    name, _, n = spec.partition(':')
+    if name != 'memory' or not n.isdigit():
+        raise argparse.ArgumentTypeError(f"unknown bot {spec!r}")
+    return int(n)
+
+def play_game(specs, first):
+    board = game.init_board()
+    revealed = bytearray(len(board))
+    left = game.PAIRS
+    bots = [game.Bot(len(board), parse_bot(spec)) for spec in specs]
+    scores = {seat: 0 for seat in range(len(bots))}
+    turns = [0] * len(bots)
+    current = first
+    while True:
+        bot = bots[current]
+        turns[current] += 1
+        p1 = bot.first()
+        for other in bots:
+            other.observe(p1, board[p1])
+        p2 = bot.second(p1, board[p1])
+        for other in bots:
+            other.observe(p2, board[p2])
+        if game.make_move(board, revealed, p1, p2, current, scores):
+            for other in bots:
+                other.removed(p1, p2, board[p1])
+            left -= 1
+            if game.check_win(left):
+                return turns, scores
+        else:
+            current = (current + 1) % len(bots)
+
+def play_chunk(task):
+    specs, games, seed, first_game = task
+    random.seed(seed)
+    n = len(specs)
+    stats = {'turns': 0, 'squares': 0, 'seats': [[0, 0, 0.0, 0] for _ in specs]}
+    start = time.perf_counter()
+    for number in range(first_game, first_game + games):
+        # the first player rotates from game to game
+        turns, scores = play_game(specs, number % n)
+        total = sum(turns)
+        stats['turns'] += total
+        stats['squares'] += total * total
+        best = max(scores.values())
+        winners = [seat for seat, score in scores.items() if score == best]
+        for seat in range(n):
+            s = stats['seats'][seat]
+            s[0] += turns[seat]
+            s[1] += scores[seat]
+            s[2] += 1 / len(winners) if seat in winners else 0
+    return stats, games, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory games between bots")
+    parser.add_argument('--bots', nargs='+', default=['perfect', 'memory:4'],
+                        help="one bot per player: perfect, random or memory:N")
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--rows', type=int, default=4)
+    parser.add_argument('--cols', type=int, default=4)
+    parser.add_argument('--chunk', type=int, default=2000, help="games per worker task")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    for spec in args.bots:
+        try:
+            parse_bot(spec)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+    if args.rows * args.cols % 2:
+        parser.error("the board needs an even number of cards")
+
+    seeds = random.Random(args.seed)
+    tasks = [(args.bots, min(args.chunk, args.games - first), seeds.getrandbits(64), first)
+             for first in range(0, args.games, args.chunk)]
+
+    turns = squares = played = 0
+    busy = 0.0
+    seats = [[0, 0, 0.0] for _ in args.bots]
+    start = time.perf_counter()
+    with mp.Pool(args.workers, initializer=load_game, initargs=(args.rows, args.cols)) as pool:
+        for stats, games, elapsed in pool.imap_unordered(play_chunk, tasks):
+            turns += stats['turns']
+            squares += stats['squares']
+            for total, s in zip(seats, stats['seats']):
+                for i in range(3):
+                    total[i] += s[i]
+            played += games
+            busy += elapsed
+    wall = time.perf_counter() - start
+
+    mean = turns / played
+    spread = (max(squares / played - mean * mean, 0) / played) ** 0.5
+    print(f"{args.rows}x{args.cols} board, {args.rows * args.cols // 2} pairs")
+    print(f"{'seat':>5} {'bot':>10} {'turns':>8} {'pairs':>7} {'wins':>7}")
+    for seat, (spec, (t, pairs, wins)) in enumerate(zip(args.bots, seats), 1):
+        print(f"{seat:>5} {spec:>10} {t / played:>8.2f} {pairs / played:>7.2f} {wins / played:>7.1%}")
+    print(f"\n{mean:.2f} turns per game (+-{spread:.2f})")
+    print(f"{played} games in {wall:.1f}s: {played / wall:.0f} games/s overall, {played / busy:.0f} games/s per worker")
+
+if __name__ == "__main__":
+    main()
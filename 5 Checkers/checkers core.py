@@ -0,0 +1,218 @@
+# Rules core shared by the o4 console and GUI games: a 32-square bitboard with flying-king ray tables
+# and adapters for the 8x8 list board. It imports no Tk, so the console game and perft can load it anywhere.
+
+ROWS = 8
+COLS = 8
+
+def init_board():
+    board = [[None] * COLS for _ in range(ROWS)]
+    for r in range(ROWS):
+        for c in range(COLS):
+            if (r + c) % 2 == 1:
+                if r < 3:
+                    board[r][c] = 'w'
+                elif r > 4:
+                    board[r][c] = 'b'
+                else:
+                    board[r][c] = '.'
+    return board
+
+def opponent(p):
+    return 'b' if p == 'w' else 'w'
+
+def is_playable(r, c):
+    return 0 <= r < ROWS and 0 <= c < COLS and (r + c) % 2 == 1
+
+def piece_color(p):
+    return p.lower() if p and p != '.' else None
+
+# Bitboard core: the 32 playable squares are numbered row by row (square = r * 4 + c // 2),
+# each side is kept as a men mask and a kings mask.
+SQUARES = [(r, c) for r in range(ROWS) for c in range(COLS) if (r + c) % 2 == 1]
+SQUARE_INDEX = {rc: i for i, rc in enumerate(SQUARES)}
+DIRECTIONS = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+# RAYS[s][d]: squares from s in direction d, nearest first; RAY_MASKS[s][d]: the same as a mask
+RAYS = []
+RAY_MASKS = []
+for _r, _c in SQUARES:
+    _rays = []
+    for _dr, _dc in DIRECTIONS:
+        _ray = []
+        _nr, _nc = _r + _dr, _c + _dc
+        while is_playable(_nr, _nc):
+            _ray.append(SQUARE_INDEX[(_nr, _nc)])
+            _nr, _nc = _nr + _dr, _nc + _dc
+        _rays.append(tuple(_ray))
+    RAYS.append(_rays)
+    RAY_MASKS.append([sum(1 << sq for sq in ray) for ray in _rays])
+MAN_DIRECTIONS = {'w': (2, 3), 'b': (0, 1)}
+PROMOTION_MASKS = {'w': sum(1 << SQUARE_INDEX[(ROWS - 1, c)] for c in range(COLS) if is_playable(ROWS - 1, c)),
+                   'b': sum(1 << SQUARE_INDEX[(0, c)] for c in range(COLS) if is_playable(0, c))}
+
+def nearest(mask, d):
+    # directions with dr > 0 walk towards higher squares
+    if d >= 2:
+        return (mask & -mask).bit_length() - 1
+    return mask.bit_length() - 1
+
+class BitBoard:
+    def __init__(self):
+        self.men = {'w': 0, 'b': 0}
+        self.kings = {'w': 0, 'b': 0}
+
+    @classmethod
+    def from_board(cls, b):
+        bb = cls()
+        for sq, (r, c) in enumerate(SQUARES):
+            piece = b[r][c]
+            if piece and piece != '.':
+                if piece.isupper():
+                    bb.kings[piece.lower()] |= 1 << sq
+                else:
+                    bb.men[piece] |= 1 << sq
+        return bb
+
+    def to_board(self, b):
+        for sq, (r, c) in enumerate(SQUARES):
+            bit = 1 << sq
+            if self.men['w'] & bit:
+                b[r][c] = 'w'
+            elif self.men['b'] & bit:
+                b[r][c] = 'b'
+            elif self.kings['w'] & bit:
+                b[r][c] = 'W'
+            elif self.kings['b'] & bit:
+                b[r][c] = 'B'
+            else:
+                b[r][c] = '.'
+
+    def state(self):
+        return self.men['w'], self.men['b'], self.kings['w'], self.kings['b']
+
+    def set_state(self, state):
+        self.men['w'], self.men['b'], self.kings['w'], self.kings['b'] = state
+
+    def copy(self):
+        bb = BitBoard()
+        bb.set_state(self.state())
+        return bb
+
+    def pieces(self, p):
+        return self.men[p] | self.kings[p]
+
+    def occupied(self):
+        return self.men['w'] | self.men['b'] | self.kings['w'] | self.kings['b']
+
+    def captures_from(self, sq, p):
+        # a capturing piece keeps its rank until the move is over; taken pieces leave the board at once
+        king = bool(self.kings[p] >> sq & 1)
+        own = self.kings if king else self.men
+        opp = opponent(p)
+        seqs = []
+        path = [sq]
+
+        def jump(cur, taken, land):
+            taken_bit = 1 << taken
+            taken_masks = self.men if self.men[opp] & taken_bit else self.kings
+            taken_masks[opp] ^= taken_bit
+            own[p] ^= (1 << cur) | (1 << land)
+            path.append(land)
+            backtrack(land)
+            path.pop()
+            own[p] ^= (1 << cur) | (1 << land)
+            taken_masks[opp] ^= taken_bit
+
+        def backtrack(cur):
+            found = False
+            occ = self.occupied()
+            enemies = self.pieces(opp)
+            for d in range(4):
+                if king:
+                    blockers = RAY_MASKS[cur][d] & occ
+                    if not blockers:
+                        continue
+                    taken = nearest(blockers, d)
+                    if not enemies >> taken & 1:
+                        continue
+                    for land in RAYS[taken][d]:
+                        if occ >> land & 1:
+                            break
+                        jump(cur, taken, land)
+                        found = True
+                else:
+                    ray = RAYS[cur][d]
+                    if len(ray) > 1 and enemies >> ray[0] & 1 and not occ >> ray[1] & 1:
+                        jump(cur, ray[0], ray[1])
+                        found = True
+            if not found and len(path) > 1:
+                seqs.append(path[:])
+
+        backtrack(sq)
+        return seqs
+
+    def simple_moves_from(self, sq, p):
+        occ = self.occupied()
+        moves = []
+        if self.kings[p] >> sq & 1:
+            for d in range(4):
+                for to in RAYS[sq][d]:
+                    if occ >> to & 1:
+                        break
+                    moves.append([sq, to])
+        else:
+            for d in range(4):
+                if d in MAN_DIRECTIONS[p] and RAYS[sq][d] and not occ >> RAYS[sq][d][0] & 1:
+                    moves.append([sq, RAYS[sq][d][0]])
+        return moves
+
+    def valid_moves(self, p):
+        caps = {}
+        mine = self.pieces(p)
+        squares = [sq for sq in range(32) if mine >> sq & 1]
+        for sq in squares:
+            seqs = self.captures_from(sq, p)
+            if seqs:
+                caps[sq] = seqs
+        if caps:
+            return caps, True
+        simples = {}
+        for sq in squares:
+            seqs = self.simple_moves_from(sq, p)
+            if seqs:
+                simples[sq] = seqs
+        return simples, False
+
+    def apply(self, path, p):
+        opp = opponent(p)
+        start, end = path[0], path[-1]
+        king = self.kings[p] >> start & 1
+        own = self.kings if king else self.men
+        own[p] ^= 1 << start
+        for frm, to in zip(path, path[1:]):
+            for d in range(4):
+                if RAY_MASKS[frm][d] >> to & 1:
+                    between = RAY_MASKS[frm][d] & ~RAY_MASKS[to][d] & ~(1 << to)
+                    taken = between & self.pieces(opp)
+                    if taken:
+                        bit = 1 << nearest(taken, d)
+                        self.men[opp] &= ~bit
+                        self.kings[opp] &= ~bit
+                    break
+        if not king and PROMOTION_MASKS[p] >> end & 1:
+            own = self.kings
+        own[p] |= 1 << end
+
+def to_paths(seqs):
+    return [[SQUARES[sq] for sq in seq] for seq in seqs]
+
+# Adapters for the 8x8 list boards of the console and GUI front ends
+
+def get_capture_moves(b, r, c):
+    return to_paths(BitBoard.from_board(b).captures_from(SQUARE_INDEX[(r, c)], piece_color(b[r][c])))
+
+def get_simple_moves(b, r, c):
+    return to_paths(BitBoard.from_board(b).simple_moves_from(SQUARE_INDEX[(r, c)], piece_color(b[r][c])))
+
+def generate_moves(b, p):
+    moves, capture = BitBoard.from_board(b).valid_moves(p)
+    return {SQUARES[sq]: to_paths(seqs) for sq, seqs in moves.items()}, capture
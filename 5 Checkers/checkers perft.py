@@ -0,0 +1,276 @@
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+# Perft for the checkers rule engines in this folder.
+#
+# Positions are written in one frame for every engine: row 0 is at the top, white moves up and
+# is crowned on row 0, black moves down and is crowned on row 7. A position is a tuple of the
+# 32 playable squares (row by row, 'w', 'b', 'W', 'B' or '.') plus the side to move.
+# The engines number rows differently and let a turn be one call or several (chained captures),
+# so every adapter replays a whole turn the way its game loop does and returns the distinct
+# positions it can end in. Perft counts those positions, which makes the numbers comparable.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SQUARES = [(r, c) for r in range(8) for c in range(8) if (r + c) % 2 == 1]
+
+POSITIONS = {
+    # playable squares of rows 0..7, four per row
+    'start': ['bbbb', 'bbbb', 'bbbb', '....', '....', 'wwww', 'wwww', 'wwww'],
+    'king-multijump': ['....', '....', 'b.b.', '....', '..b.', '.b..', '....', 'W..w'],
+    'promotion-mid-capture': ['....', '.b..', 'w.b.', '....', '....', '....', '...b', '..w.'],
+    'majority-capture': ['....', '....', '.b..', '....', 'bb..', '.w..', '....', 'w...'],
+}
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def parse_position(rows, side):
+    return tuple(ch for line in rows for ch in line), side
+
+def other(side):
+    return 'b' if side == 'w' else 'w'
+
+def to_grid(squares, empty, flip, blank=None):
+    grid = [[blank] * 8 for _ in range(8)]
+    for (r, c), ch in zip(SQUARES, squares):
+        if flip:
+            r, c = 7 - r, 7 - c
+        grid[r][c] = empty if ch == '.' else ch
+    return grid
+
+def from_grid(grid, empty, flip):
+    out = []
+    for r, c in SQUARES:
+        if flip:
+            r, c = 7 - r, 7 - c
+        ch = grid[r][c]
+        out.append('.' if ch == empty else ch)
+    return tuple(out)
+
+class BitboardEngine:
+    # checkers core.py, the bitboard core behind both o4 games (console and GUI). White is crowned
+    # on row 7 there, so the board is turned around
+    name = 'o4-bitboard'
+
+    def __init__(self):
+        self.m = load('checkers_core', os.path.join(HERE, 'checkers core.py'))
+
+    def successors(self, pos):
+        squares, side = pos
+        bb = self.m.BitBoard.from_board(to_grid(squares, '.', True))
+        moves, _ = bb.valid_moves(side)
+        state = bb.state()
+        result = set()
+        grid = [[None] * 8 for _ in range(8)]
+        for seqs in moves.values():
+            for seq in seqs:
+                bb.apply(seq, side)
+                bb.to_board(grid)
+                result.add((from_grid(grid, '.', True), other(side)))
+                bb.set_state(state)
+        return result
+
+class DeepseekEngine:
+    # RussianCheckers.play: get_valid_moves per piece, a capture continues while find_captures finds more
+    name = 'deepseek'
+
+    def __init__(self):
+        self.m = load('checkers_deepseek', os.path.join(HERE, 'console', 'checkers deepseek.py'))
+        self.game = self.m.RussianCheckers()
+
+    def set_board(self, grid):
+        self.game.board = grid
+        self.game.move_cache.clear()
+
+    def successors(self, pos):
+        squares, side = pos
+        result = set()
+        self.turn(to_grid(squares, ' ', False, ' '), side, None, result)
+        return result
+
+    def turn(self, grid, side, chain, result):
+        g = self.game
+        self.set_board([row[:] for row in grid])
+        starts = [chain] if chain else [(r, c) for r, c in SQUARES if grid[r][c] != ' ' and grid[r][c].lower() == side]
+        must_capture = g.has_any_capture(side)
+        for start in starts:
+            self.set_board([row[:] for row in grid])
+            piece = grid[start[0]][start[1]]
+            moves = g.get_valid_moves(*start)
+            if must_capture and not any(m[2] for m in moves):
+                moves = []
+            if not moves and chain:
+                result.add((from_grid(grid, ' ', False), other(side)))
+            for er, ec, captures in moves:
+                self.set_board([row[:] for row in grid])
+                if captures:
+                    g.execute_capture(start, (er, ec), captures)
+                    after = g.board
+                    if g.find_captures(er, ec, piece, set()):
+                        self.turn(after, side, (er, ec), result)
+                    else:
+                        result.add((from_grid(after, ' ', False), other(side)))
+                elif not must_capture:
+                    g.move_piece(start, (er, ec))
+                    result.add((from_grid(g.board, ' ', False), other(side)))
+
+class GeminiEngine:
+    # RussianCheckers.play_game: every (start, end) a player could type, checked the same way;
+    # "capture_again" gives the same side another move
+    name = 'gemini'
+
+    def __init__(self):
+        self.m = load('checkers_gemini', os.path.join(HERE, 'console', 'checkers gemini.py'))
+        self.game = self.m.RussianCheckers()
+
+    def successors(self, pos):
+        squares, side = pos
+        result = set()
+        self.turn(to_grid(squares, '.', False, '.'), side, result)
+        return result
+
+    def turn(self, grid, side, result):
+        g = self.game
+        g.board = [row[:] for row in grid]
+        g.current_player = side
+        must_capture = bool(g.get_all_possible_captures())
+        for start in SQUARES:
+            if grid[start[0]][start[1]].lower() != side:
+                continue
+            for end in SQUARES:
+                g.board = [row[:] for row in grid]
+                capture = abs(start[0] - end[0]) == 2 and abs(start[1] - end[1]) == 2
+                long_capture = (grid[start[0]][start[1]].isupper() and abs(start[0] - end[0]) > 2
+                                and abs(start[1] - end[1]) > 2)
+                if must_capture and not (capture or long_capture):
+                    continue
+                if capture or long_capture:
+                    if not g._is_valid_capture(start, end)[0]:
+                        continue
+                elif not g._is_valid_move(start, end)[0]:
+                    continue
+                success, move_type = g.make_move(start, end)
+                if not success:
+                    continue
+                after = g.board
+                if move_type == "capture_again":
+                    self.turn(after, side, result)
+                    g.current_player = side
+                else:
+                    result.add((from_grid(after, '.', False), other(side)))
+
+class GrokEngine:
+    # console grok main: every (start, end) checked with is_valid_capture / is_valid_move;
+    # after a capture the same side moves again while the capturing piece can still take
+    name = 'grok'
+
+    def __init__(self):
+        self.m = load('checkers_grok', os.path.join(HERE, 'console', 'checkers grok.py'))
+
+    def successors(self, pos):
+        squares, side = pos
+        result = set()
+        self.turn(to_grid(squares, None, False), side, result)
+        return result
+
+    def turn(self, grid, side, result):
+        m = self.m
+        captures = m.has_capture_moves(grid, side)
+        for start in SQUARES:
+            if grid[start[0]][start[1]] not in (side, side.upper()):
+                continue
+            for end in SQUARES:
+                b = [row[:] for row in grid]
+                if captures:
+                    if not m.is_valid_capture(b, side, start, end):
+                        continue
+                    m.make_capture(b, start, end)
+                    if m.get_capture_moves(b, side, end):
+                        self.turn(b, side, result)
+                        continue
+                else:
+                    if not m.is_valid_move(b, side, start, end):
+                        continue
+                    m.make_move(b, start, end)
+                result.add((from_grid(b, None, False), other(side)))
+
+ENGINES = [BitboardEngine, DeepseekEngine, GeminiEngine, GrokEngine]
+
+def perft(engine, pos, depth):
+    if depth == 0:
+        return 1
+    succ = engine.successors(pos)
+    if depth == 1:
+        return len(succ)
+    return sum(perft(engine, nxt, depth - 1) for nxt in succ)
+
+def show(squares):
+    return '/'.join(''.join(squares[i:i + 4]) for i in range(0, 32, 4))
+
+def main():
+    parser = argparse.ArgumentParser(description="Perft benchmark for the checkers rule engines")
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--engines', nargs='*', help="engine names (default: all)")
+    parser.add_argument('--positions', nargs='*', help="position names (default: all)")
+    parser.add_argument('--reference', default='o4-bitboard', help="engine the others are compared with")
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(10000)
+    engines = [cls() for cls in ENGINES if not args.engines or cls.name in args.engines]
+    names = [e.name for e in engines]
+    reference = next((e for e in engines if e.name == args.reference), engines[0])
+    disagreements = 0
+
+    for pos_name, rows in POSITIONS.items():
+        if args.positions and pos_name not in args.positions:
+            continue
+        for side in ('w', 'b'):
+            pos = parse_position(rows, side)
+            print(f"\n{pos_name}, {'white' if side == 'w' else 'black'} to move")
+            print(f"{'depth':>5} " + " ".join(f"{n:>20}" for n in names))
+            for depth in range(1, args.depth + 1):
+                cells = []
+                counts = {}
+                for engine in engines:
+                    start = time.perf_counter()
+                    try:
+                        n = perft(engine, pos, depth)
+                    except Exception as e:
+                        counts[engine.name] = None
+                        cells.append(f"{type(e).__name__:>20}")
+                        continue
+                    dt = time.perf_counter() - start
+                    counts[engine.name] = n
+                    cells.append(f"{n:>8} {n / dt if dt else 0:>9.0f}/s")
+                mark = "" if len(set(counts.values())) == 1 else "  <- differ"
+                print(f"{depth:>5} " + " ".join(cells) + mark)
+            # depth-1 differences against the reference engine, move by move
+            try:
+                ref = reference.successors(pos)
+            except Exception:
+                continue
+            for engine in engines:
+                if engine is reference:
+                    continue
+                try:
+                    got = engine.successors(pos)
+                except Exception as e:
+                    print(f"  {engine.name}: {type(e).__name__}")
+                    disagreements += 1
+                    continue
+                for squares, _ in sorted(ref - got):
+                    print(f"  {engine.name} misses   {show(squares)}")
+                for squares, _ in sorted(got - ref):
+                    print(f"  {engine.name} extra    {show(squares)}")
+                disagreements += len(ref ^ got)
+
+    print(f"\n{disagreements} depth-1 disagreements with {reference.name}")
+
+if __name__ == "__main__":
+    main()
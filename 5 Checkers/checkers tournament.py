@@ -0,0 +1,183 @@
+import argparse
+import importlib.util
+import itertools
+import multiprocessing as mp
+import os
+import random
+import sys
+import time
+
+# Headless self-play for the checkers bots. Games run in a process pool on the bitboard core of
+# checkers core.py (the engine that passes the start-position perft), loaded through gui/checkers o4.py
+# for its CheckersAI; each worker sends back a packed move list, and the main process writes PDN and
+# keeps the tally as results come in.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BOTS = ('random', 'greedy', 'ai')
+RESULTS = {'w': '1-0', 'b': '0-1', None: '1/2-1/2'}
+engine = None
+
+def load_engine():
+    global engine
+    spec = importlib.util.spec_from_file_location('checkers_o4_gui', os.path.join(HERE, 'gui', 'checkers o4.py'))
+    engine = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(engine)
+
+def other(side):
+    return 'b' if side == 'w' else 'w'
+
+# Square names follow Russian draughts notation: white sits on ranks 1-3 and a1 is a playable square
+NAMES = ['hgfedcba'[c] + str(r + 1) for r in range(8) for c in range(8) if (r + c) % 2 == 1]
+
+def pack_moves(moves):
+    # one length byte per move (high bit set for captures) followed by the visited squares
+    out = bytearray()
+    for path, capture in moves:
+        out.append(len(path) | (0x80 if capture else 0))
+        out.extend(path)
+    return bytes(out)
+
+def unpack_moves(data):
+    moves = []
+    i = 0
+    while i < len(data):
+        n = data[i] & 0x7F
+        moves.append((list(data[i + 1:i + 1 + n]), bool(data[i] & 0x80)))
+        i += 1 + n
+    return moves
+
+def pdn_moves(data):
+    words = []
+    for ply, (path, capture) in enumerate(unpack_moves(data)):
+        if ply % 2 == 0:
+            words.append(f"{ply // 2 + 1}.")
+        words.append((':' if capture else '-').join(NAMES[sq] for sq in path))
+    return words
+
+def pdn_game(round_no, white, black, result, data):
+    lines = ['[Event "Self-play"]', f'[Round "{round_no}"]', f'[White "{white}"]', f'[Black "{black}"]',
+             f'[Result "{result}"]', '[GameType "25"]', '']
+    line = ''
+    for word in pdn_moves(data) + [result]:
+        if len(line) + len(word) >= 80:
+            lines.append(line)
+            line = ''
+        line += (' ' if line else '') + word
+    lines.append(line)
+    return '\n'.join(lines) + '\n\n'
+
+def make_bot(name, rng, ai_time):
+    if name == 'random':
+        return lambda bb, p, moves: rng.choice(moves)
+    if name == 'greedy':
+        judge = engine.CheckersAI(table_bits=1)
+        def greedy(bb, p, moves):
+            # best material balance after the move, ties broken at random
+            state = bb.state()
+            scored = []
+            for path in moves:
+                bb.apply(path, p)
+                scored.append((judge.evaluate(bb, p), path))
+                bb.set_state(state)
+            best = max(score for score, _ in scored)
+            return rng.choice([path for score, path in scored if score == best])
+        return greedy
+    ai = engine.CheckersAI(time_limit=ai_time, table_bits=16)
+    return lambda bb, p, moves: ai.choose_move(bb, p)
+
+def play_game(spec):
+    round_no, white, black, seed, ai_time, max_plies, opening = spec
+    rng = random.Random(seed)
+    bots = {'w': make_bot(white, rng, ai_time), 'b': make_bot(black, rng, ai_time)}
+    bb = engine.BitBoard.from_board(engine.init_board())
+    p = 'w'
+    moves = []
+    start = time.perf_counter()
+    while len(moves) < max_plies:
+        legal, capture = bb.valid_moves(p)
+        flat = [seq for seqs in legal.values() for seq in seqs]
+        if not flat:
+            winner = engine.opponent(p)
+            break
+        # a few random opening moves keep deterministic bots from replaying the same game
+        path = rng.choice(flat) if len(moves) < opening else bots[p](bb, p, flat)
+        bb.apply(path, p)
+        moves.append((path, capture))
+        p = engine.opponent(p)
+    else:
+        winner = None
+    return round_no, white, black, winner, pack_moves(moves), len(moves), time.perf_counter() - start, os.getpid()
+
+def percent(n, total):
+    return f"{100 * n / total:5.1f}%" if total else "    -"
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkers self-play tournament")
+    parser.add_argument('--bots', nargs='+', choices=BOTS, default=['random', 'greedy'])
+    parser.add_argument('--games', type=int, default=100, help="games per pairing and colour")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--ai-time', type=float, default=0.05, help="seconds per move for the ai bot")
+    parser.add_argument('--max-plies', type=int, default=200, help="longer games are scored as draws")
+    parser.add_argument('--opening', type=int, default=4, help="random plies at the start of each game")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--pdn', help="write the games to this PDN file")
+    args = parser.parse_args()
+
+    specs = []
+    for white, black in itertools.product(args.bots, repeat=2):
+        for _ in range(args.games):
+            round_no = len(specs) + 1
+            specs.append((round_no, white, black, args.seed * 1000003 + round_no, args.ai_time,
+                          args.max_plies, args.opening))
+
+    pairs = {}
+    workers = {}
+    out = open(args.pdn, 'w') if args.pdn else None
+    start = time.perf_counter()
+    done = 0
+    with mp.Pool(args.workers, initializer=load_engine) as pool:
+        for round_no, white, black, winner, data, plies, elapsed, pid in pool.imap_unordered(play_game, specs, chunksize=4):
+            stats = pairs.setdefault((white, black), {'w': 0, 'b': 0, None: 0, 'plies': 0})
+            stats[winner] += 1
+            stats['plies'] += plies
+            worker = workers.setdefault(pid, [0, 0, 0.0])
+            worker[0] += 1
+            worker[1] += plies
+            worker[2] += elapsed
+            if out:
+                out.write(pdn_game(round_no, white, black, RESULTS[winner], data))
+            done += 1
+            if done % max(1, len(specs) // 20) == 0 or done == len(specs):
+                print(f"\r{done}/{len(specs)} games", end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    if out:
+        out.close()
+    wall = time.perf_counter() - start
+
+    print(f"\n{'white':>8} {'black':>8} {'games':>6} {'white':>6} {'draw':>6} {'black':>6} {'plies':>6}")
+    for (white, black), s in pairs.items():
+        n = s['w'] + s['b'] + s[None]
+        print(f"{white:>8} {black:>8} {n:>6} {percent(s['w'], n)} {percent(s[None], n)} {percent(s['b'], n)} "
+              f"{s['plies'] / n:6.1f}")
+
+    print(f"\n{'bot':>8} {'games':>6} {'win':>6} {'draw':>6} {'loss':>6}")
+    for bot in args.bots:
+        win = draw = loss = 0
+        for (white, black), s in pairs.items():
+            for side, name in (('w', white), ('b', black)):
+                if name == bot:
+                    win += s[side]
+                    draw += s[None]
+                    loss += s[other(side)]
+        n = win + draw + loss
+        print(f"{bot:>8} {n:>6} {percent(win, n)} {percent(draw, n)} {percent(loss, n)}")
+
+    print(f"\n{'worker':>8} {'games':>6} {'moves':>8} {'moves/s':>9}")
+    for pid, (games, moves, busy) in sorted(workers.items()):
+        print(f"{pid:>8} {games:>6} {moves:>8} {moves / busy if busy else 0:9.0f}")
+    total_moves = sum(w[1] for w in workers.values())
+    print(f"\n{len(specs)} games, {total_moves} moves in {wall:.1f}s "
+          f"({len(specs) / wall:.1f} games/s, {total_moves / wall:.0f} moves/s)")
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,17 @@ class RussianCheckers:
         self.game_over = False
         self.chain_capture = False
         self.chain_piece = None
+        # Ходы текущей позиции: считаются один раз, сбрасываются в move_piece
+        self.move_cache = {}
+        self.cache_stats = {'hits': 0, 'misses': 0}
+
+    def cached(self, key, compute):
+        if key in self.move_cache:
+            self.cache_stats['hits'] += 1
+            return self.move_cache[key]
+        self.cache_stats['misses'] += 1
+        result = self.move_cache[key] = compute()
+        return result
 
     def create_board(self):
         board = [[' ' for _ in range(8)] for _ in range(8)]
@@ -25,6 +36,9 @@ class RussianCheckers:
             print(f"{i} {' '.join(cell if cell != ' ' else '.' for cell in row)}")
 
     def get_valid_moves(self, row, col):
+        return self.cached((row, col), lambda: self._get_valid_moves(row, col))
+
+    def _get_valid_moves(self, row, col):
         piece = self.board[row][col]
         if piece == ' ': return []
         moves = []
@@ -75,12 +89,18 @@ class RussianCheckers:
                 while 0 <= r < 8 and 0 <= c < 8:
                     if self.board[r][c] == ' ':
                         if (r, c) not in visited:
-                            new_visited = visited | {opp}
-                            new_path = path + [opp]
-                            extended = self.find_captures(r, c, piece, new_visited, new_path)
+                            # visited и path общие для всей рекурсии: добавляем, спускаемся, откатываем
+                            added = opp not in visited
+                            if added:
+                                visited.add(opp)
+                            path.append(opp)
+                            extended = self.find_captures(r, c, piece, visited, path)
                             if extended:
                                 captures.extend(extended)
-                            captures.append((r, c, new_path))
+                            captures.append((r, c, path[:]))
+                            path.pop()
+                            if added:
+                                visited.discard(opp)
                         found = True
                         break
                     else:
@@ -90,6 +110,9 @@ class RussianCheckers:
         return captures
 
     def has_any_capture(self, player):
+        return self.cached(player, lambda: self._has_any_capture(player))
+
+    def _has_any_capture(self, player):
         for r in range(8):
             for c in range(8):
                 piece = self.board[r][c]
@@ -99,6 +122,7 @@ class RussianCheckers:
         return False
 
     def move_piece(self, start, end):
+        self.move_cache.clear()
         sr, sc = start
         er, ec = end
         piece = self.board[sr][sc]
@@ -112,6 +136,7 @@ class RussianCheckers:
         self.move_piece(start, end)
         for r, c in captures:
             self.board[r][c] = ' '
+        self.move_cache.clear()
 
     def play(self):
         while not self.game_over:
@@ -185,6 +210,7 @@ class RussianCheckers:
             if self.check_winner():
                 self.print_board()
                 print(f"Победили {player_name}!")
+                print(f"Кэш ходов: {self.cache_stats['hits']} попаданий, {self.cache_stats['misses']} промахов")
                 self.game_over = True
 
     def check_winner(self):
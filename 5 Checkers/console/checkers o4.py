@@ -1,8 +1,17 @@
-import copy
+import importlib.util
+import os
 
 ROWS=8
 COLS=8
 
+def load_core():
+    spec=importlib.util.spec_from_file_location('checkers_core',os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','checkers core.py'))
+    m=importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(m)
+    return m
+
+core=load_core()
+
 def init_board():
     board=[[None]*COLS for _ in range(ROWS)]
     for r in range(ROWS):
@@ -35,103 +44,62 @@ def opponent(p): return 'b' if p=='w' else 'w'
 def is_playable(r,c): return 0<=r<ROWS and 0<=c<COLS and (r+c)%2==1
 def piece_color(p): return p.lower() if p and p!='.' else None
 
+# move generation comes from the bitboard core in ../checkers core.py, shared with the GUI game
 def get_capture_moves(b,r,c):
-    p=b[r][c]
-    col=piece_color(p)
-    king=p.isupper()
-    seqs=[]
-    def backtrack(board,cr,cc,path):
-        found=False
-        for dr,dc in [(-1,-1),(-1,1),(1,-1),(1,1)]:
-            if king:
-                step=1
-                while True:
-                    pr,pc=cr+dr*step,cc+dc*step
-                    if not is_playable(pr,pc): break
-                    if board[pr][pc]=='.': step+=1; continue
-                    if piece_color(board[pr][pc])==opponent(col):
-                        step2=1
-                        while True:
-                            lr,lc=pr+dr*step2,pc+dc*step2
-                            if not is_playable(lr,lc) or board[lr][lc]!='.': break
-                            nb=copy.deepcopy(board)
-                            nb[pr][pc]='.'
-                            nb[cr][cc]='.'
-                            nb[lr][lc]=p
-                            backtrack(nb,lr,lc,path+[(lr,lc)])
-                            found=True
-                            step2+=1
-                    break
-            else:
-                pr,pc=cr+dr,cc+dc
-                lr,lc=cr+2*dr,cc+2*dc
-                if is_playable(pr,pc) and is_playable(lr,lc) and piece_color(board[pr][pc])==opponent(col) and board[lr][lc]=='.':
-                    nb=copy.deepcopy(board)
-                    nb[pr][pc]='.'
-                    nb[cr][cc]='.'
-                    nb[lr][lc]=p
-                    backtrack(nb,lr,lc,path+[(lr,lc)])
-                    found=True
-        if not found and path:
-            seqs.append([(r,c)]+path)
-    backtrack(b,r,c,[])
-    return seqs
+    return core.get_capture_moves(b,r,c)
 
 def get_simple_moves(b,r,c):
-    p=b[r][c]
-    col=piece_color(p)
-    moves=[]
-    for dr,dc in [(-1,-1),(-1,1),(1,-1),(1,1)]:
-        if p.islower():
-            if col=='w' and dr>0: continue
-            if col=='b' and dr<0: continue
-            nr, nc = r+dr, c+dc
-            if is_playable(nr,nc) and b[nr][nc]=='.':
-                moves.append([(r,c),(nr,nc)])
-        else:
-            step=1
-            while True:
-                nr, nc = r+dr*step, c+dc*step
-                if not is_playable(nr,nc) or b[nr][nc] != '.': break
-                moves.append([(r,c),(nr,nc)])
-                step+=1
-    return moves
+    return core.get_simple_moves(b,r,c)
+
+def generate_moves(b,p):
+    return core.generate_moves(b,p)
+
+# legal moves are generated once per position and shared by check_win, input checks and the GUI;
+# apply_move clears the cache, the position key guards against any other board edits
+MOVE_CACHE={}
+CACHE_STATS={'hits':0,'misses':0}
 
 def get_all_valid_moves(b,p):
-    caps={}
-    for r in range(ROWS):
-        for c in range(COLS):
-            if piece_color(b[r][c])==p:
-                seqs=get_capture_moves(b,r,c)
-                if seqs:
-                    caps[(r,c)]=seqs
-    if caps:
-        return caps,True
-    simples={}
-    for r in range(ROWS):
-        for c in range(COLS):
-            if piece_color(b[r][c])==p:
-                mv=get_simple_moves(b,r,c)
-                if mv: simples[(r,c)]=mv
-    return simples,False
+    key=(p,tuple(map(tuple,b)))
+    res=MOVE_CACHE.get(key)
+    if res is None:
+        CACHE_STATS['misses']+=1
+        res=MOVE_CACHE[key]=generate_moves(b,p)
+    else:
+        CACHE_STATS['hits']+=1
+    return res
+
+def invalidate_moves():
+    MOVE_CACHE.clear()
 
 def apply_move(b,path,p):
+    # returns the changed squares with their old contents for undo_move:
+    # the start, each captured piece on the way and the landing square
+    invalidate_moves()
+    undo=[]
     r0,c0=path[0]
     piece=b[r0][c0]
+    undo.append((r0,c0,piece))
     b[r0][c0]='.'
     for r1,c1 in path[1:]:
-        if abs(r1-r0)>1:
-            dr=(r1-r0)//abs(r1-r0); dc=(c1-c0)//abs(c1-c0)
-            rr,cc=r0+dr,c0+dc
-            while (rr,cc)!=(r1,c1):
-                if piece_color(b[rr][cc])==opponent(p):
-                    b[rr][cc]='.'
-                    break
-                rr+=dr; cc+=dc
+        dr=1 if r1>r0 else -1; dc=1 if c1>c0 else -1
+        rr,cc=r0+dr,c0+dc
+        while (rr,cc)!=(r1,c1):
+            if piece_color(b[rr][cc])==opponent(p):
+                undo.append((rr,cc,b[rr][cc]))
+                b[rr][cc]='.'
+                break
+            rr+=dr; cc+=dc
         r0,c0=r1,c1
     if (p=='w' and r0==ROWS-1) or (p=='b' and r0==0):
         piece=piece.upper()
+    undo.append((r0,c0,b[r0][c0]))
     b[r0][c0]=piece
+    return undo
+
+def undo_move(b,undo):
+    for r,c,old in reversed(undo):
+        b[r][c]=old
 
 def check_win(b,p):
     moves,_=get_all_valid_moves(b,p)
@@ -139,6 +107,45 @@ def check_win(b,p):
         return None
     return 'b' if p=='w' else 'w'
 
+def perft(b,p,depth):
+    if depth==0: return 1
+    moves,_=generate_moves(b,p)
+    n=0
+    for seqs in moves.values():
+        for path in seqs:
+            if depth==1:
+                n+=1
+                continue
+            undo=apply_move(b,path,p)
+            n+=perft(b,opponent(p),depth-1)
+            undo_move(b,undo)
+    return n
+
+PERFT_POSITIONS={
+    # playable squares of rows 8 down to 1; W/B are kings
+    'kings':['...W','.B..','.bb.','..b.','...b','.b..','..b.','W...'],
+    'captures':['....','..b.','..b.','.w..','b.b.','.b..','.bb.','w.w.'],
+}
+
+def parse_position(rows):
+    board=init_board()
+    for i,line in enumerate(rows):
+        r=ROWS-1-i
+        for c,ch in zip([c for c in range(COLS) if is_playable(r,c)],line):
+            board[r][c]=ch
+    return board
+
+def run_perft(max_depth):
+    import time
+    for name,rows in PERFT_POSITIONS.items():
+        for player in ('w','b'):
+            board=parse_position(rows)
+            for depth in range(1,max_depth+1):
+                t=time.perf_counter()
+                n=perft(board,player,depth)
+                dt=time.perf_counter()-t
+                print(f"{name} {player} depth {depth}: {n} positions, {dt:.3f}s, {n/dt if dt else 0:.0f} pos/s")
+
 def main():
     board=init_board()
     player='w'
@@ -147,6 +154,7 @@ def main():
         winner=check_win(board,player)
         if winner:
             print(('White' if winner=='w' else 'Black')+" wins")
+            print(f"move cache: {CACHE_STATS['hits']} hits, {CACHE_STATS['misses']} misses")
             break
         moves,cap=get_all_valid_moves(board,player)
         inp=input(( 'White' if player=='w' else 'Black')+" move: ")
@@ -167,4 +175,8 @@ def main():
         player=opponent(player)
 
 if __name__=='__main__':
-    main()
+    import sys
+    if len(sys.argv)>2 and sys.argv[1]=='--perft':
+        run_perft(int(sys.argv[2]))
+    else:
+        main()
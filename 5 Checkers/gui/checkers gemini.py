@@ -306,6 +306,8 @@ class RussianCheckers:
         return "Black" if self.current_player == 'w' else "White"
 
 class CheckersGUI:
+    PIECE_STYLES = {'w': ("o", "white"), 'b': ("o", "black"), 'W': ("♕", "white"), 'B': ("♛", "black")}
+
     def __init__(self, master):
         self.master = master
         master.title("Russian Checkers")
@@ -320,6 +322,7 @@ class CheckersGUI:
         self.board_frame = tk.Frame(master, borderwidth=2, relief="groove")
         self.board_frame.grid(row=1, column=0, columnspan=8, padx=5, pady=5)
         self.board_buttons = {} # {(row, col): button_widget}
+        self.rendered = {} # {(row, col): (piece, selected)} as last pushed to the button
 
         self.create_board_buttons()
 
@@ -352,29 +355,21 @@ class CheckersGUI:
     def update_board_display(self, board):
         for r in range(8):
             for c in range(8):
-                piece = board[r][c]
-                button = self.board_buttons[(r, c)]
-                
-                # Reset background color first
-                bg_color = "darkgray" if (r + c) % 2 == 1 else "lightgray"
-                button.config(bg=bg_color, relief=tk.RAISED, borderwidth=2)
-
-                # Set piece text and color
-                if piece == 'w':
-                    button.config(text="o", fg="white", font=("Arial", 12, "bold"))
-                elif piece == 'b':
-                    button.config(text="o", fg="black", font=("Arial", 12, "bold"))
-                elif piece == 'W':
-                    button.config(text="♕", fg="white", font=("Arial", 12, "bold"))
-                elif piece == 'B':
-                    button.config(text="♛", fg="black", font=("Arial", 12, "bold"))
-                else:
-                    button.config(text="", fg="white") # Empty square, no text
+                self.render_square(r, c, board[r][c], (r, c) == self.selected_piece)
 
-        # Highlight selected piece if any
-        if self.selected_piece:
-            r, c = self.selected_piece
-            self.board_buttons[(r, c)].config(relief=tk.SUNKEN, borderwidth=2, bg="lightblue")
+    def render_square(self, r, c, piece, selected):
+        # Every config is a Tcl round trip, so a button is only touched when its piece or highlight changed
+        state = (piece, selected)
+        if self.rendered.get((r, c)) == state:
+            return
+        self.rendered[(r, c)] = state
+        text, fg = self.PIECE_STYLES.get(piece, ("", "white"))
+        if selected:
+            bg, relief = "lightblue", tk.SUNKEN
+        else:
+            bg, relief = ("darkgray" if (r + c) % 2 == 1 else "lightgray"), tk.RAISED
+        self.board_buttons[(r, c)].config(text=text, fg=fg, font=("Arial", 12, "bold"),
+                                          bg=bg, relief=relief, borderwidth=2)
 
     def log_message(self, message):
         self.log_text.config(state='normal')
@@ -425,7 +420,7 @@ class CheckersGUI:
                 self.show_error(f"You must continue capturing with the piece at {self.game.forced_capture_piece[0]},{self.game.forced_capture_piece[1]}.")
             else:
                 self.selected_piece = (r, c)
-                self.game.display_board() # Redraw to highlight selected piece
+                self.render_square(r, c, piece_at_click, True) # Only the selected square changes
 
     def process_move(self, start_pos, end_pos):
         self.message_label.config(text="") # Clear previous error message
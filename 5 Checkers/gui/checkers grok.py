@@ -168,31 +168,68 @@ class CheckersGame(tk.Tk):
         self.canvas.bind("<Button-1>", self.start_drag)
         self.canvas.bind("<B1-Motion>", self.drag_piece)
         self.canvas.bind("<ButtonRelease-1>", self.drop_piece)
+        # squares are drawn once; piece items are moved, recoloured or hidden as the board changes
+        self.squares = {}
+        self.pieces = {}
+        self.spare = []
+        self.drawn = [[None] * 8 for _ in range(8)]
+        self.draw_squares()
         self.draw_board()
         self.update_log(f"Ход игрока {self.game.player}")
 
-    def draw_board(self):
-        self.canvas.delete("all")
+    def draw_squares(self):
         square_size = 50
         for r in range(8):
             for c in range(8):
                 x1 = c * square_size
                 y1 = r * square_size
-                x2 = x1 + square_size
-                y2 = y1 + square_size
                 color = "#8B4513" if (r + c) % 2 == 1 else "#F5F5DC"
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, tags=f"square_{r}_{c}")
-                piece = self.game.board[r][c]
-                if piece:
-                    cx = (x1 + x2) / 2
-                    cy = (y1 + y2) / 2
-                    radius = square_size // 3
-                    fill = "white" if piece in ('w', 'W') else "black"
-                    self.canvas.create_oval(cx - radius, cy - radius, cx + radius, cy + radius, 
-                                            fill=fill, tags=f"piece_{r}_{c}")
-                    if piece in ('W', 'B'):
-                        self.canvas.create_text(cx, cy, text="D", fill="red", font=("Arial", 12, "bold"), 
-                                                tags=f"piece_{r}_{c}")
+                self.squares[(r, c)] = self.canvas.create_rectangle(x1, y1, x1 + square_size, y1 + square_size,
+                                                                    fill=color, tags=f"square_{r}_{c}")
+
+    def create_piece(self):
+        oval = self.canvas.create_oval(0, 0, 0, 0)
+        text = self.canvas.create_text(0, 0, text="D", fill="red", font=("Arial", 12, "bold"))
+        return oval, text
+
+    def place_piece(self, items, r, c):
+        oval, text = items
+        piece = self.game.board[r][c]
+        square_size = 50
+        cx = c * square_size + square_size / 2
+        cy = r * square_size + square_size / 2
+        radius = square_size // 3
+        self.canvas.coords(oval, cx - radius, cy - radius, cx + radius, cy + radius)
+        self.canvas.coords(text, cx, cy)
+        self.canvas.itemconfig(oval, fill="white" if piece in ('w', 'W') else "black", state="normal")
+        self.canvas.itemconfig(text, state="normal" if piece in ('W', 'B') else "hidden")
+
+    def draw_board(self):
+        board = self.game.board
+        changed = [(r, c) for r in range(8) for c in range(8) if self.drawn[r][c] != board[r][c]]
+        freed = [self.pieces.pop(pos) for pos in changed if pos in self.pieces]
+        self.spare.extend(freed)
+        for r, c in changed:
+            if board[r][c]:
+                items = self.spare.pop() if self.spare else self.create_piece()
+                self.place_piece(items, r, c)
+                self.pieces[(r, c)] = items
+            self.drawn[r][c] = board[r][c]
+        for items in freed:
+            if items in self.spare:
+                for item in items:
+                    self.canvas.itemconfig(item, state="hidden")
+        self.must_capture = None
+        self.targets = {}
+
+    def legal_moves(self, start):
+        # computed once per position and piece, reused for every drag until the board is redrawn
+        if self.must_capture is None:
+            self.must_capture = self.game.has_capture_moves()
+        if start not in self.targets:
+            self.targets[start] = (self.game.get_capture_moves(start) if self.must_capture
+                                   else self.game.get_non_capture_moves(start))
+        return self.targets[start]
 
     def update_log(self, message):
         self.log_text.config(state='normal')
@@ -219,26 +256,24 @@ class CheckersGame(tk.Tk):
         if self.game.pending_capture and (row, col) != self.game.pending_capture:
             messagebox.showerror("Ошибка", "Продолжите взятие с последней позиции.")
             return
-        items = self.canvas.find_withtag(f"piece_{row}_{col}")
+        items = self.pieces.get((row, col))
         if not items:
             return
         self.dragging_start = (row, col)
         self.dragging_piece = piece
         self.dragging_items = items
+        self.drag_x, self.drag_y = x, y
         for item in items:
             self.canvas.tag_raise(item)
-        self.valid_moves = self.game.get_capture_moves((row, col)) if self.game.has_capture_moves() else self.game.get_non_capture_moves((row, col))
+        self.valid_moves = self.legal_moves((row, col))
         for move in self.valid_moves:
-            self.canvas.itemconfig(f"square_{move[0]}_{move[1]}", outline="green", width=2)
+            self.canvas.itemconfig(self.squares[move], outline="green", width=2)
 
     def drag_piece(self, event):
         if self.dragging_items:
-            x, y = event.x, event.y
             for item in self.dragging_items:
-                if "oval" in self.canvas.gettags(item):
-                    self.canvas.coords(item, x - 20, y - 20, x + 20, y + 20)
-                elif "text" in self.canvas.gettags(item):
-                    self.canvas.coords(item, x, y)
+                self.canvas.move(item, event.x - self.drag_x, event.y - self.drag_y)
+            self.drag_x, self.drag_y = event.x, event.y
 
     def drop_piece(self, event):
         if not self.dragging_piece:
@@ -258,14 +293,15 @@ class CheckersGame(tk.Tk):
         self.reset_drag()
 
     def reset_drag(self):
-        for r in range(8):
-            for c in range(8):
-                self.canvas.itemconfig(f"square_{r}_{c}", outline="")
+        for move in self.valid_moves:
+            # back to the default border the squares were created with
+            self.canvas.itemconfig(self.squares[move], outline="black", width=1)
+        if self.dragging_start and self.pieces.get(self.dragging_start) is self.dragging_items:
+            self.place_piece(self.dragging_items, *self.dragging_start)
         self.dragging_piece = None
         self.dragging_start = None
         self.dragging_items = None
         self.valid_moves = []
-        self.draw_board()
 
     def is_valid_position(self, pos):
         return 0 <= pos[0] < 8 and 0 <= pos[1] < 8
@@ -1,135 +1,203 @@
+import importlib.util
+import os
+import random
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
-import copy
 
 ROWS = 8
 COLS = 8
 SQUARE = 60
 
-def init_board():
-    board = [[None] * COLS for _ in range(ROWS)]
-    for r in range(ROWS):
-        for c in range(COLS):
-            if (r + c) % 2 == 1:
-                if r < 3:
-                    board[r][c] = 'w'
-                elif r > 4:
-                    board[r][c] = 'b'
-                else:
-                    board[r][c] = '.'
-    return board
-
-def opponent(p):
-    return 'b' if p == 'w' else 'w'
-
-def is_playable(r, c):
-    return 0 <= r < ROWS and 0 <= c < COLS and (r + c) % 2 == 1
-
-def piece_color(p):
-    return p.lower() if p and p != '.' else None
-
-def get_capture_moves(b, r, c):
-    p = b[r][c]
-    col = piece_color(p)
-    king = p.isupper()
-    seqs = []
-    def backtrack(board, cr, cc, path):
-        found = False
-        for dr, dc in [(-1,-1),(-1,1),(1,-1),(1,1)]:
-            if king:
-                step = 1
-                while True:
-                    pr, pc = cr + dr * step, cc + dc * step
-                    if not is_playable(pr, pc): break
-                    if board[pr][pc] == '.':
-                        step += 1
-                        continue
-                    if piece_color(board[pr][pc]) == opponent(col):
-                        step2 = 1
-                        while True:
-                            lr, lc = pr + dr * step2, pc + dc * step2
-                            if not is_playable(lr, lc) or board[lr][lc] != '.': break
-                            nb = copy.deepcopy(board)
-                            nb[pr][pc] = '.'
-                            nb[cr][cc] = '.'
-                            nb[lr][lc] = p
-                            backtrack(nb, lr, lc, path + [(lr, lc)])
-                            found = True
-                            step2 += 1
-                    break
-            else:
-                pr, pc = cr + dr, cc + dc
-                lr, lc = cr + 2*dr, cc + 2*dc
-                if is_playable(pr, pc) and is_playable(lr, lc) and piece_color(board[pr][pc]) == opponent(col) and board[lr][lc] == '.':
-                    nb = copy.deepcopy(board)
-                    nb[pr][pc] = '.'
-                    nb[cr][cc] = '.'
-                    nb[lr][lc] = p
-                    backtrack(nb, lr, lc, path + [(lr, lc)])
-                    found = True
-        if not found and path:
-            seqs.append([(r, c)] + path)
-    backtrack(b, r, c, [])
-    return seqs
-
-def get_simple_moves(b, r, c):
-    p = b[r][c]
-    col = piece_color(p)
-    moves = []
-    for dr, dc in [(-1,-1),(-1,1),(1,-1),(1,1)]:
-        if p.islower():
-            if (col == 'w' and dr < 0) or (col == 'b' and dr > 0):
-                continue
-            nr, nc = r + dr, c + dc
-            if is_playable(nr, nc) and b[nr][nc] == '.':
-                moves.append([(r, c), (nr, nc)])
-        else:
-            step = 1
-            while True:
-                nr, nc = r + dr*step, c + dc*step
-                if not is_playable(nr, nc) or b[nr][nc] != '.':
-                    break
-                moves.append([(r, c), (nr, nc)])
-                step += 1
-    return moves
+def load_core():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'checkers core.py')
+    spec = importlib.util.spec_from_file_location('checkers_core', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# The rules live in the bitboard core of ../checkers core.py, shared with the console game
+core = load_core()
+init_board, opponent, piece_color = core.init_board, core.opponent, core.piece_color
+SQUARES, SQUARE_INDEX, BitBoard = core.SQUARES, core.SQUARE_INDEX, core.BitBoard
+generate_moves = core.generate_moves
+
+# Legal moves are generated once per position and shared by check_win, drop validation and highlighting.
+# apply_move clears the cache; the position key guards against any other board edits.
+MOVE_CACHE = {}
+CACHE_STATS = {'hits': 0, 'misses': 0}
 
 def get_all_valid_moves(b, p):
-    caps = {}
-    for r in range(ROWS):
-        for c in range(COLS):
-            if piece_color(b[r][c]) == p:
-                seqs = get_capture_moves(b, r, c)
-                if seqs:
-                    caps[(r, c)] = seqs
-    if caps:
-        return caps, True
-    simples = {}
-    for r in range(ROWS):
-        for c in range(COLS):
-            if piece_color(b[r][c]) == p:
-                seqs = get_simple_moves(b, r, c)
-                if seqs:
-                    simples[(r, c)] = seqs
-    return simples, False
+    key = (p, tuple(map(tuple, b)))
+    res = MOVE_CACHE.get(key)
+    if res is None:
+        CACHE_STATS['misses'] += 1
+        res = MOVE_CACHE[key] = generate_moves(b, p)
+    else:
+        CACHE_STATS['hits'] += 1
+    return res
+
+def invalidate_moves():
+    MOVE_CACHE.clear()
 
 def apply_move(b, path, p):
-    r0, c0 = path[0]
-    piece = b[r0][c0]
-    b[r0][c0] = '.'
-    for r1, c1 in path[1:]:
-        if abs(r1 - r0) > 1:
-            dr = (r1 - r0) // abs(r1 - r0)
-            dc = (c1 - c0) // abs(c1 - c0)
-            rr, cc = r0 + dr, c0 + dc
-            while (rr, cc) != (r1, c1):
-                if piece_color(b[rr][cc]) == opponent(p):
-                    b[rr][cc] = '.'
-                    break
-                rr += dr; cc += dc
-        r0, c0 = r1, c1
-    if (p == 'w' and r0 == ROWS - 1) or (p == 'b' and r0 == 0):
-        piece = piece.upper()
-    b[r0][c0] = piece
+    invalidate_moves()
+    bb = BitBoard.from_board(b)
+    bb.apply([SQUARE_INDEX[rc] for rc in path], p)
+    bb.to_board(b)
+
+class SearchTimeout(Exception):
+    pass
+
+class CheckersAI:
+    MAN, KING = 100, 300
+    WIN = 100000
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, time_limit=1.0, table_bits=18):
+        self.time_limit = time_limit
+        rng = random.Random(2024)
+        # one key per (men w, men b, kings w, kings b) x square, plus the side to move
+        self.zobrist = [[rng.getrandbits(64) for _ in range(32)] for _ in range(4)]
+        self.zobrist_side = rng.getrandbits(64)
+        self.table_mask = (1 << table_bits) - 1
+        self.table = [None] * (1 << table_bits)
+        self.generation = 0
+        self.stats = {}
+
+    def hash_state(self, state, p):
+        h = self.zobrist_side if p == 'b' else 0
+        for kind, mask in enumerate(state):
+            while mask:
+                low = mask & -mask
+                h ^= self.zobrist[kind][low.bit_length() - 1]
+                mask ^= low
+        return h
+
+    def update_hash(self, h, old, new):
+        # only the squares that changed between two states are toggled
+        h ^= self.zobrist_side
+        for kind in range(4):
+            diff = old[kind] ^ new[kind]
+            while diff:
+                low = diff & -diff
+                h ^= self.zobrist[kind][low.bit_length() - 1]
+                diff ^= low
+        return h
+
+    def probe(self, h):
+        self.tt_probes += 1
+        entry = self.table[h & self.table_mask]
+        if entry is not None and entry[0] == h:
+            self.tt_hits += 1
+            return entry
+        return None
+
+    def store(self, h, depth, score, flag, move):
+        # replacement: keep the deeper entry from the current search, always overwrite older searches
+        slot = h & self.table_mask
+        entry = self.table[slot]
+        if entry is None or entry[5] != self.generation or depth >= entry[1]:
+            self.table[slot] = (h, depth, score, flag, move, self.generation)
+
+    def evaluate(self, bb, p):
+        score = 0
+        for side, sign in ((p, 1), (opponent(p), -1)):
+            score += sign * (self.MAN * bb.men[side].bit_count() + self.KING * bb.kings[side].bit_count())
+        return score
+
+    def ordered_moves(self, bb, p, tt_move, ply):
+        moves, capture = bb.valid_moves(p)
+        flat = [tuple(seq) for seqs in moves.values() for seq in seqs]
+        killers = self.killers[ply] if ply < len(self.killers) else ()
+        def key(move):
+            if move == tt_move:
+                return 0
+            if capture:
+                return 1 - len(move) * 0.01
+            if move in killers:
+                return 2
+            return 3
+        flat.sort(key=key)
+        return flat, capture
+
+    def negamax(self, bb, p, h, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+        alpha_orig = alpha
+        entry = self.probe(h)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry[4]
+            if entry[1] >= depth:
+                if entry[3] == self.EXACT:
+                    return entry[2]
+                if entry[3] == self.LOWER:
+                    alpha = max(alpha, entry[2])
+                else:
+                    beta = min(beta, entry[2])
+                if alpha >= beta:
+                    return entry[2]
+        moves, capture = self.ordered_moves(bb, p, tt_move, ply)
+        if not moves:
+            return -self.WIN + ply
+        # captures are forced, so they do not use up depth at the horizon
+        if depth <= 0 and not capture:
+            return self.evaluate(bb, p)
+        best, best_move = -self.WIN * 2, moves[0]
+        old = bb.state()
+        for move in moves:
+            bb.apply(list(move), p)
+            try:
+                score = -self.negamax(bb, opponent(p), self.update_hash(h, old, bb.state()),
+                                      depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                bb.set_state(old)
+            if score > best:
+                best, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                if not capture and ply < len(self.killers) and move not in self.killers[ply]:
+                    self.killers[ply] = [move, self.killers[ply][0]]
+                break
+        flag = self.UPPER if best <= alpha_orig else self.LOWER if best >= beta else self.EXACT
+        self.store(h, depth, best, flag, best_move)
+        return best
+
+    def choose_move(self, bb, p):
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit
+        self.generation += 1
+        self.nodes = self.tt_probes = self.tt_hits = 0
+        self.killers = [[None, None] for _ in range(64)]
+        bb = bb.copy()
+        h = self.hash_state(bb.state(), p)
+        moves, _ = self.ordered_moves(bb, p, None, 0)
+        if not moves:
+            return None
+        best_move, best_score, depth_done = moves[0], 0, 0
+        for depth in range(1, 64):
+            try:
+                self.negamax(bb, p, h, depth, -self.WIN * 2, self.WIN * 2, 0)
+            except SearchTimeout:
+                break
+            entry = self.table[h & self.table_mask]
+            if entry is not None and entry[0] == h:
+                best_move, best_score = entry[4], entry[2]
+            depth_done = depth
+            if abs(best_score) > self.WIN - 100 or len(moves) == 1:
+                break
+        elapsed = time.perf_counter() - start
+        self.stats = {
+            'depth': depth_done,
+            'score': best_score,
+            'nodes': self.nodes,
+            'nps': self.nodes / elapsed if elapsed > 0 else 0.0,
+            'tt_hit_rate': self.tt_hits / self.tt_probes if self.tt_probes else 0.0,
+        }
+        return list(best_move)
 
 def check_win(b, p):
     moves, _ = get_all_valid_moves(b, p)
@@ -143,56 +211,153 @@ class CheckersApp:
         master.title("Russian Checkers")
         self.new_button = tk.Button(master, text="Новая игра", command=self.new_game)
         self.new_button.pack()
+        self.ai_enabled = tk.BooleanVar(value=False)
+        self.ai_check = tk.Checkbutton(master, text="Компьютер играет за чёрных", variable=self.ai_enabled,
+                                       command=self.maybe_start_ai)
+        self.ai_check.pack()
         self.canvas = tk.Canvas(master, width=COLS*SQUARE, height=ROWS*SQUARE)
         self.canvas.pack()
         self.canvas.bind("<ButtonPress-1>", self.on_press)
         self.canvas.bind("<B1-Motion>", self.on_motion)
         self.canvas.bind("<ButtonRelease-1>", self.on_release)
-        self.selected_tag = None
+        self.info = tk.Label(master, text="")
+        self.info.pack()
+        self.selected = None
         self.drag_data = {}
+        # the board layer is drawn once; piece items live on and are moved between squares
+        self.draw_squares()
+        self.pieces = {}
+        self.spare = []
+        self.drawn = [[None] * COLS for _ in range(ROWS)]
+        self.targets = {}
+        self.ai = CheckersAI(time_limit=1.0)
+        self.ai_thread = None
+        self.ai_result = None
+        self.game_id = 0
         self.new_game()
 
     def new_game(self):
         self.board = init_board()
         self.current = 'w'
+        self.game_over = False
+        self.game_id += 1
         self.draw_board()
+        self.maybe_start_ai()
 
-    def draw_board(self):
-        self.canvas.delete("all")
-        self.tag_map = {}
+    def finish_move(self, path):
+        apply_move(self.board, path, self.current)
+        win = check_win(self.board, opponent(self.current))
+        if not win:
+            self.current = opponent(self.current)
+        self.draw_board()
+        if win:
+            self.game_over = True
+            messagebox.showinfo("Игра окончена", f"{'White' if win == 'w' else 'Black'} wins")
+        else:
+            self.maybe_start_ai()
+
+    def ai_turn(self):
+        return self.ai_enabled.get() and self.current == 'b' and not self.game_over
+
+    def maybe_start_ai(self):
+        if not self.ai_turn() or self.ai_thread is not None:
+            return
+        # the search runs on a copy in a worker thread; the Tk loop only polls for the result
+        bb = BitBoard.from_board(self.board)
+        game_id = self.game_id
+        def work():
+            self.ai_result = (game_id, self.ai.choose_move(bb, 'b'))
+        self.info.config(text="Компьютер думает...")
+        self.ai_thread = threading.Thread(target=work, daemon=True)
+        self.ai_thread.start()
+        self.master.after(50, self.poll_ai)
+
+    def poll_ai(self):
+        if self.ai_thread.is_alive():
+            self.master.after(50, self.poll_ai)
+            return
+        self.ai_thread = None
+        game_id, path = self.ai_result
+        if game_id != self.game_id:
+            self.maybe_start_ai()
+            return
+        stats = self.ai.stats
+        self.info.config(text=f"Глубина {stats['depth']}, узлов {stats['nodes']} ({stats['nps']:.0f}/с), "
+                              f"попаданий в таблицу {stats['tt_hit_rate']:.0%}")
+        if path is None or not self.ai_turn():
+            return
+        self.finish_move([SQUARES[sq] for sq in path])
+
+    def draw_squares(self):
+        self.highlights = {}
         for r in range(ROWS):
             for c in range(COLS):
                 x1 = c * SQUARE
                 y1 = r * SQUARE
-                x2 = x1 + SQUARE
-                y2 = y1 + SQUARE
                 color = "#F0D9B5" if (r + c) % 2 == 0 else "#B58863"
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
-                piece = self.board[r][c]
-                if piece and piece != '.':
-                    tag = f"p{r}_{c}"
-                    fill = "white" if piece.lower() == 'w' else "black"
-                    self.canvas.create_oval(x1+5, y1+5, x2-5, y2-5, fill=fill, tags=tag)
-                    if piece.isupper():
-                        self.canvas.create_text((x1+x2)/2, (y1+y2)/2, text="K", font=("Arial", SQUARE//2), tags=tag)
-                    self.tag_map[tag] = (r, c)
+                self.canvas.create_rectangle(x1, y1, x1 + SQUARE, y1 + SQUARE, fill=color, outline="")
+        for r, c in SQUARES:
+            x1 = c * SQUARE
+            y1 = r * SQUARE
+            self.highlights[(r, c)] = self.canvas.create_rectangle(x1 + 2, y1 + 2, x1 + SQUARE - 2, y1 + SQUARE - 2,
+                                                                   outline="#4CAF50", width=3, state="hidden")
+
+    def create_piece(self):
+        oval = self.canvas.create_oval(0, 0, 0, 0)
+        text = self.canvas.create_text(0, 0, text="K", font=("Arial", SQUARE//2))
+        return oval, text
+
+    def place_piece(self, items, r, c):
+        oval, text = items
+        piece = self.board[r][c]
+        x1 = c * SQUARE
+        y1 = r * SQUARE
+        self.canvas.coords(oval, x1+5, y1+5, x1+SQUARE-5, y1+SQUARE-5)
+        self.canvas.coords(text, x1 + SQUARE/2, y1 + SQUARE/2)
+        self.canvas.itemconfig(oval, fill="white" if piece.lower() == 'w' else "black", state="normal")
+        self.canvas.itemconfig(text, state="normal" if piece.isupper() else "hidden")
+
+    def draw_board(self):
+        # only squares whose content changed are touched; items of removed pieces are kept for reuse
+        changed = [(r, c) for r, c in SQUARES if self.drawn[r][c] != self.board[r][c]]
+        freed = [self.pieces.pop(sq) for sq in changed if sq in self.pieces]
+        self.spare.extend(freed)
+        for r, c in changed:
+            piece = self.board[r][c]
+            if piece and piece != '.':
+                items = self.spare.pop() if self.spare else self.create_piece()
+                self.place_piece(items, r, c)
+                self.pieces[(r, c)] = items
+            self.drawn[r][c] = piece
+        for items in freed:
+            if items not in self.spare:
+                continue
+            for item in items:
+                self.canvas.itemconfig(item, state="hidden")
+        # legal moves of the new position, looked up on press and on drop
+        moves, _ = get_all_valid_moves(self.board, self.current)
+        self.targets = {}
+        for start, seqs in moves.items():
+            ends = self.targets.setdefault(start, {})
+            for seq in seqs:
+                ends.setdefault(seq[-1], seq)
 
     def on_press(self, event):
-        items = self.canvas.find_withtag("current")
+        if self.game_over or self.ai_turn():
+            return
+        sq = (int(event.y // SQUARE), int(event.x // SQUARE))
+        items = self.pieces.get(sq)
+        if not items or piece_color(self.board[sq[0]][sq[1]]) != self.current:
+            return
+        self.selected = sq
+        self.drag_data = {"items": items, "x": event.x, "y": event.y}
         for item in items:
-            for tag in self.canvas.gettags(item):
-                if tag in self.tag_map:
-                    r, c = self.tag_map[tag]
-                    if piece_color(self.board[r][c]) == self.current:
-                        self.selected_tag = tag
-                        self.drag_data["items"] = self.canvas.find_withtag(tag)
-                        self.drag_data["x"] = event.x
-                        self.drag_data["y"] = event.y
-                        self.drag_data["orig"] = {i: self.canvas.coords(i) for i in self.drag_data["items"]}
-                    return
+            self.canvas.tag_raise(item)
+        for end in self.targets.get(sq, ()):
+            self.canvas.itemconfig(self.highlights[end], state="normal")
 
     def on_motion(self, event):
-        if self.selected_tag:
+        if self.selected:
             dx = event.x - self.drag_data["x"]
             dy = event.y - self.drag_data["y"]
             for i in self.drag_data["items"]:
@@ -201,32 +366,20 @@ class CheckersApp:
             self.drag_data["y"] = event.y
 
     def on_release(self, event):
-        if not self.selected_tag:
+        if not self.selected:
             return
-        sr, sc = self.tag_map[self.selected_tag]
-        dr = int(event.y // SQUARE)
-        dc = int(event.x // SQUARE)
-        moves, _ = get_all_valid_moves(self.board, self.current)
-        path = None
-        if (sr, sc) in moves:
-            for seq in moves[(sr, sc)]:
-                if seq[-1] == (dr, dc):
-                    path = seq
-                    break
-        if path:
-            apply_move(self.board, path, self.current)
-            win = check_win(self.board, self.current)
-            if not win:
-                self.current = opponent(self.current)
-            self.draw_board()
-            if win:
-                messagebox.showinfo("Игра окончена", f"{'White' if win == 'w' else 'Black'} wins")
-        else:
-            messagebox.showerror("Ошибка", "Недопустимый ход")
-            for i, coords in self.drag_data["orig"].items():
-                self.canvas.coords(i, *coords)
-        self.selected_tag = None
+        start = self.selected
+        ends = self.targets.get(start, {})
+        path = ends.get((int(event.y // SQUARE), int(event.x // SQUARE)))
+        for end in ends:
+            self.canvas.itemconfig(self.highlights[end], state="hidden")
+        self.selected = None
         self.drag_data = {}
+        if path:
+            self.finish_move(path)
+            return
+        messagebox.showerror("Ошибка", "Недопустимый ход")
+        self.place_piece(self.pieces[start], *start)
 
 if __name__ == '__main__':
     root = tk.Tk()
@@ -1,4 +1,5 @@
 import random
+from collections import deque
 
 class UnoCard:
     def __init__(self, color, value):
@@ -19,14 +20,69 @@ class UnoCard:
     def is_wild(self):
         return self.color == "Wild"
 
+class UnoHand:
+    # A hand that keeps the positions of its cards by color and by value, so finding the playable
+    # cards or a card of the current color does not scan the whole hand. The cards sit in a plain list
+    # that only append and pop change, so the index cannot miss an edit; playing a card keeps the order
+    # of the others and shifts the positions after it down by one.
+    def __init__(self):
+        self.cards = []
+        self.by_color = {}
+        self.by_value = {}
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __getitem__(self, index):
+        return self.cards[index]
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __repr__(self):
+        return repr(self.cards)
+
+    def append(self, card):
+        self.cards.append(card)
+        self._add_position(card, len(self.cards) - 1)
+
+    def pop(self, index=-1):
+        if index < 0:
+            index += len(self.cards)
+        card = self.cards.pop(index)
+        self._remove_position(card, index)
+        for position in range(index, len(self.cards)):
+            moved = self.cards[position]
+            self._remove_position(moved, position + 1)
+            self._add_position(moved, position)
+        return card
+
+    def _add_position(self, card, position):
+        self.by_color.setdefault(card.color, set()).add(position)
+        self.by_value.setdefault(card.value, set()).add(position)
+
+    def _remove_position(self, card, position):
+        self.by_color[card.color].discard(position)
+        self.by_value[card.value].discard(position)
+
+    def has_color(self, color):
+        return bool(self.by_color.get(color))
+
+    def playable_positions(self, color, value):
+        positions = self.by_color.get(color, set()) | self.by_value.get(value, set()) | self.by_color.get("Wild", set())
+        # Wild Draw Four only when no card matches the current color
+        if self.has_color(color):
+            positions -= self.by_value.get("Wild Draw Four", set())
+        return sorted(positions)
+
 class UnoGame:
     def __init__(self, num_players):
         self.colors = ["Red", "Green", "Blue", "Yellow"]
         self.values = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "Skip", "Reverse", "Draw Two"]
         self.wild_cards = ["Wild", "Wild Draw Four"]
         self.deck = self._create_deck()
-        self.players = [[] for _ in range(num_players)]
-        self.discard_pile = []
+        self.players = [UnoHand() for _ in range(num_players)]
+        self.discard_pile = deque()
         self.current_player_index = 0
         self.direction = 1 # 1 for clockwise (left), -1 for counter-clockwise (right)
         self.game_over = False
@@ -44,7 +100,7 @@ class UnoGame:
             deck.append(UnoCard("Wild", "Wild"))
             deck.append(UnoCard("Wild", "Wild Draw Four")) # Four Wild Draw 4 cards 
         random.shuffle(deck)
-        return deck
+        return deque(deck)
 
     def _deal_cards(self):
         for i in range(len(self.players)):
@@ -53,21 +109,20 @@ class UnoGame:
 
     def _draw_card(self):
         if not self.deck:
-            if not self.discard_pile:
+            if len(self.discard_pile) <= 1:
                 print("No cards left to draw! Game might be stuck.")
                 return None
             last_card = self.discard_pile.pop() # Keep the top card on discard 
-            self.deck = self.discard_pile
-            random.shuffle(self.deck)
-            self.discard_pile = [last_card]
-        return self.deck.pop(0)
+            random.shuffle(self.discard_pile)
+            self.deck, self.discard_pile = self.discard_pile, self.deck
+            self.discard_pile.append(last_card)
+        return self.deck.popleft()
 
     def _setup_discard_pile(self):
         while True:
             first_card = self._draw_card()
             if first_card.value == "Wild" or first_card.value == "Wild Draw Four": # If top card is Wild or Wild Draw 4, return it and pick another 
-                self.deck.append(first_card)
-                random.shuffle(self.deck)
+                self.deck.insert(random.randint(0, len(self.deck)), first_card)
             elif first_card.value == "Draw Two": # If Draw 2 is turned up, first player must draw 2 cards 
                 self.discard_pile.append(first_card)
                 self.current_color = first_card.color
@@ -118,6 +173,9 @@ class UnoGame:
 
         return False
 
+    def get_playable_cards_indices(self, player_index):
+        return self.players[player_index].playable_positions(self.current_color, self.current_value)
+
     def play_card(self, player_index, card_index, chosen_color=None):
         player_hand = self.players[player_index]
         card_to_play = player_hand[card_index]
@@ -127,12 +185,7 @@ class UnoGame:
             return False
 
         if card_to_play.value == "Wild Draw Four": # Check Wild Draw Four rules 
-            has_matching_color = False
-            for card in player_hand:
-                if card.color == self.current_color and not card.is_wild():
-                    has_matching_color = True
-                    break
-            if has_matching_color:
+            if player_hand.has_color(self.current_color):
                 print("You have a card matching the current color. You can only play Wild Draw Four if you don't have a card in hand that matches the color of the card previously played.")
                 # Implement challenge option here, but for simplicity, we'll prevent it if a matching color is found.
                 return False # Prevent playing illegally by default for AI, or prompt user.
@@ -194,10 +247,7 @@ class UnoGame:
             print(f"Top card on discard: {self.discard_pile[-1]} (Current color: {self.current_color})")
             print(f"Your hand: {current_player_hand}")
 
-            playable_cards_indices = []
-            for i, card in enumerate(current_player_hand):
-                if self.is_valid_play(card):
-                    playable_cards_indices.append(i)
+            playable_cards_indices = self.get_playable_cards_indices(self.current_player_index)
             
             if not playable_cards_indices:
                 print("No playable cards. Drawing a card...")
@@ -41,8 +41,7 @@ class UnoGame:
                 player.append(self.deck.pop())
         self.discard_pile.append(self.deck.pop())
         while self.discard_pile[-1].value == 'Wild Draw Four':
-            self.deck.append(self.discard_pile.pop())
-            random.shuffle(self.deck)
+            self.deck.insert(random.randint(0, len(self.deck)), self.discard_pile.pop())
             self.discard_pile.append(self.deck.pop())
 
     def play(self):
@@ -105,8 +104,7 @@ class UnoGame:
             self.current_player = (self.current_player + self.direction) % self.num_players
         elif card.value == 'Draw Two':
             next_player = (self.current_player + self.direction) % self.num_players
-            for _ in range(2):
-                self.players[next_player].append(self.deck.pop())
+            self.draw_penalty(next_player, 2)
         elif card.value == 'Wild':
             color = input("Choose a color (Red/Yellow/Green/Blue): ")
             card.color = color
@@ -114,15 +112,34 @@ class UnoGame:
             color = input("Choose a color (Red/Yellow/Green/Blue): ")
             card.color = color
             next_player = (self.current_player + self.direction) % self.num_players
-            for _ in range(4):
-                self.players[next_player].append(self.deck.pop())
+            self.draw_penalty(next_player, 4)
 
-    def draw_card(self):
+    def _draw(self):
         if len(self.deck) == 0:
-            self.deck = self.discard_pile[:-1]
-            self.discard_pile = deque([self.discard_pile[-1]])
-            random.shuffle(self.deck)
-        card = self.deck.pop()
+            if len(self.discard_pile) <= 1:
+                return None
+            top = self.discard_pile.pop()
+            for card in self.discard_pile:
+                if card.value in ('Wild', 'Wild Draw Four'):
+                    card.color = None
+            random.shuffle(self.discard_pile)
+            self.deck, self.discard_pile = self.discard_pile, self.deck
+            self.discard_pile.append(top)
+        return self.deck.pop()
+
+    def draw_penalty(self, player, count):
+        for _ in range(count):
+            card = self._draw()
+            if card is None:
+                print("No cards left to draw")
+                return
+            self.players[player].append(card)
+
+    def draw_card(self):
+        card = self._draw()
+        if card is None:
+            print("No cards left to draw")
+            return
         self.players[self.current_player].append(card)
         if self.can_play_card(card):
             print(f"Drew {card}, playing it")
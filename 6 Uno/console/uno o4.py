@@ -1,9 +1,10 @@
 import random
+from collections import Counter, deque
 
 COLORS=['R','G','B','Y']
 VALUES=[str(i) for i in range(1,10)]+['+2','Skip','Reverse']
 def create_deck():
-    deck=[]
+    deck=deque()
     for c in COLORS:
         deck.append(c+'0')
         for v in VALUES:
@@ -17,8 +18,22 @@ def create_deck():
 def shuffle_deck(deck):
     random.shuffle(deck)
 
+class Hand(list):
+    def __init__(self,cards=()):
+        super().__init__()
+        self.colors=Counter()
+        for c in cards:
+            self.append(c)
+    def append(self,card):
+        super().append(card)
+        self.colors[card[0]]+=1
+    def pop(self,i=-1):
+        card=super().pop(i)
+        self.colors[card[0]]-=1
+        return card
+
 def deal(deck,players,hand_size=7):
-    hands=[[] for _ in range(players)]
+    hands=[Hand() for _ in range(players)]
     for _ in range(hand_size):
         for h in hands:
             h.append(deck.pop())
@@ -26,15 +41,17 @@ def deal(deck,players,hand_size=7):
 
 def draw_card(deck,discard):
     if not deck:
-        deck.extend(discard[:-1])
-        random.shuffle(deck)
-        discard[:] = [discard[-1]]
+        top=discard.pop()
+        random.shuffle(discard)
+        deck.extend(discard)
+        discard.clear()
+        discard.append(top)
     return deck.pop()
 
 def can_play(card,top_color,top_value,hand):
     if card in ('W','W4'):
         if card=='W4':
-            return all(c[0]!=top_color for c in hand if c not in ('W','W4'))
+            return hand.colors[top_color]==0
         return True
     if card[0]==top_color or card[1:]==top_value:
         return True
@@ -79,7 +96,7 @@ def main():
     hands=deal(deck,players)
     discard=[deck.pop()]
     while discard[-1] in ('W','W4'):
-        deck.insert(0,discard.pop())
+        deck.appendleft(discard.pop())
         discard.append(deck.pop())
     top_color=discard[-1][0]
     top_value=discard[-1][1:]
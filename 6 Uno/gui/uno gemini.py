@@ -1,4 +1,5 @@
 import random
+from collections import deque
 import tkinter as tk
 from tkinter import messagebox, simpledialog, scrolledtext
 
@@ -23,6 +24,61 @@ class UnoCard:
     def is_wild(self):
         return self.color == "Wild"
 
+class UnoHand:
+    # A hand that keeps the positions of its cards by color and by value, so finding the playable
+    # cards or a card of the current color does not scan the whole hand. The cards sit in a plain list
+    # that only append and pop change, so the index cannot miss an edit; playing a card keeps the order
+    # of the others and shifts the positions after it down by one.
+    def __init__(self):
+        self.cards = []
+        self.by_color = {}
+        self.by_value = {}
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __getitem__(self, index):
+        return self.cards[index]
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __repr__(self):
+        return repr(self.cards)
+
+    def append(self, card):
+        self.cards.append(card)
+        self._add_position(card, len(self.cards) - 1)
+
+    def pop(self, index=-1):
+        if index < 0:
+            index += len(self.cards)
+        card = self.cards.pop(index)
+        self._remove_position(card, index)
+        for position in range(index, len(self.cards)):
+            moved = self.cards[position]
+            self._remove_position(moved, position + 1)
+            self._add_position(moved, position)
+        return card
+
+    def _add_position(self, card, position):
+        self.by_color.setdefault(card.color, set()).add(position)
+        self.by_value.setdefault(card.value, set()).add(position)
+
+    def _remove_position(self, card, position):
+        self.by_color[card.color].discard(position)
+        self.by_value[card.value].discard(position)
+
+    def has_color(self, color):
+        return bool(self.by_color.get(color))
+
+    def playable_positions(self, color, value):
+        positions = self.by_color.get(color, set()) | self.by_value.get(value, set()) | self.by_color.get("Wild", set())
+        # Wild Draw Four only when no card matches the current color
+        if self.has_color(color):
+            positions -= self.by_value.get("Wild Draw Four", set())
+        return sorted(positions)
+
 class UnoGame:
     def __init__(self, gui_app, num_players=2):
         self.gui_app = gui_app
@@ -30,8 +86,8 @@ class UnoGame:
         self.values = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "Skip", "Reverse", "Draw Two"]
         self.wild_cards = ["Wild", "Wild Draw Four"] # Renamed for clarity in card object
         self.deck = self._create_deck()
-        self.players = [[] for _ in range(num_players)]
-        self.discard_pile = []
+        self.players = [UnoHand() for _ in range(num_players)]
+        self.discard_pile = deque()
         self.current_player_index = 0
         self.direction = 1 # 1 for clockwise (left), -1 for counter-clockwise (right)
         self.game_over = False
@@ -49,7 +105,7 @@ class UnoGame:
             deck.append(UnoCard("Wild", "Wild"))
             deck.append(UnoCard("Wild", "Wild Draw Four")) # Four Wild Draw 4 cards
         random.shuffle(deck)
-        return deck
+        return deque(deck)
 
     def _deal_cards(self):
         for i in range(len(self.players)):
@@ -62,11 +118,11 @@ class UnoGame:
                 self.gui_app.log_message("No cards left to draw! Game might be stuck.")
                 return None
             last_card = self.discard_pile.pop() # Keep the top card on discard
-            self.deck = self.discard_pile
-            random.shuffle(self.deck)
-            self.discard_pile = [last_card]
+            random.shuffle(self.discard_pile)
+            self.deck, self.discard_pile = self.discard_pile, self.deck
+            self.discard_pile.append(last_card)
             self.gui_app.log_message("Shuffling discard pile to create new deck.")
-        return self.deck.pop(0)
+        return self.deck.popleft()
 
     def _setup_discard_pile(self):
         while True:
@@ -77,8 +133,7 @@ class UnoGame:
                 return
 
             if first_card.value in ["Wild", "Wild Draw Four"]:
-                self.deck.append(first_card)
-                random.shuffle(self.deck)
+                self.deck.insert(random.randint(0, len(self.deck)), first_card)
                 continue
             else:
                 self.discard_pile.append(first_card)
@@ -106,8 +161,8 @@ class UnoGame:
         self.game_over = False
         self.deck = self._create_deck()
         num_players = len(self.players)
-        self.players = [[] for _ in range(num_players)] # Reset player hands
-        self.discard_pile = []
+        self.players = [UnoHand() for _ in range(num_players)] # Reset player hands
+        self.discard_pile = deque()
         self.current_player_index = 0
         self.direction = 1
         
@@ -136,11 +191,7 @@ class UnoGame:
         return False
 
     def get_playable_cards_indices(self, player_index):
-        playable_indices = []
-        for i, card in enumerate(self.players[player_index]):
-            if self.is_valid_play(card):
-                playable_indices.append(i)
-        return playable_indices
+        return self.players[player_index].playable_positions(self.current_color, self.current_value)
 
     def attempt_play_card(self, player_index, card_index, chosen_color=None):
         player_hand = self.players[player_index]
@@ -157,12 +208,7 @@ class UnoGame:
 
         # Specific rule for Wild Draw Four
         if card_to_play.value == "Wild Draw Four":
-            has_matching_color = False
-            for card in player_hand:
-                if card.color == self.current_color and not card.is_wild():
-                    has_matching_color = True
-                    break
-            if has_matching_color:
+            if player_hand.has_color(self.current_color):
                 self.gui_app.show_error("You have a card matching the current color. You cannot play Wild Draw Four.")
                 return False # Prevent playing illegally
 
@@ -332,7 +378,7 @@ class UnoGUI:
         self.clear_hand_display()
         if self.game.players:
             player_hand = self.game.players[0] # Assuming player 1 is controlled by GUI
-            playable_indices = self.game.get_playable_cards_indices(0)
+            playable_indices = set(self.game.get_playable_cards_indices(0))
 
             for i, card in enumerate(player_hand):
                 btn = tk.Button(self.player_hand_frame, text=str(card), 
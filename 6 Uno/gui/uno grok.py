@@ -18,6 +18,7 @@ class UnoGame:
         self.values = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9', 'Skip', 'Reverse', 'Draw Two', 'Wild', 'Wild Draw Four']
         self.deck = [Card(color, value) for color in self.colors for value in self.values if value not in ['Wild', 'Wild Draw Four']] + [Card('Wild', 'Wild') for _ in range(4)] + [Card('Wild', 'Wild Draw Four') for _ in range(4)]
         random.shuffle(self.deck)
+        self.deck = deque(self.deck)
         self.players = [[] for _ in range(num_players)]
         self.discard_pile = deque()
         self.current_player = 0
@@ -47,21 +48,36 @@ class UnoGame:
             self.advance_player()
         elif card.value == 'Draw Two':
             next_player = (self.current_player + self.direction) % self.num_players
-            for _ in range(2):
-                if self.deck:
-                    self.players[next_player].append(self.deck.pop())
+            self.draw_penalty(next_player, 2)
         elif card.value == 'Wild Draw Four':
             next_player = (self.current_player + self.direction) % self.num_players
-            for _ in range(4):
-                if self.deck:
-                    self.players[next_player].append(self.deck.pop())
+            self.draw_penalty(next_player, 4)
     
-    def draw_card(self, root):
+    def _draw(self):
         if len(self.deck) == 0:
-            self.deck = list(self.discard_pile)[:-1]
-            self.discard_pile = deque([self.discard_pile[-1]])
-            random.shuffle(self.deck)
-        card = self.deck.pop()
+            if len(self.discard_pile) <= 1:
+                return None
+            top = self.discard_pile.pop()
+            for card in self.discard_pile:
+                if card.value in ('Wild', 'Wild Draw Four'):
+                    card.color = 'Wild'
+            random.shuffle(self.discard_pile)
+            self.deck, self.discard_pile = self.discard_pile, self.deck
+            self.discard_pile.append(top)
+        return self.deck.pop()
+    
+    def draw_penalty(self, player, count):
+        for _ in range(count):
+            card = self._draw()
+            if card is None:
+                return
+            self.players[player].append(card)
+    
+    def draw_card(self, root):
+        card = self._draw()
+        if card is None:
+            messagebox.showinfo("Колода пуста", "Нет карт для добора", parent=root)
+            return
         self.players[self.current_player].append(card)
         if self.can_play_card(card):
             if card.value in ('Wild', 'Wild Draw Four'):
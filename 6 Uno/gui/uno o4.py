@@ -1,12 +1,13 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 import random
+from collections import Counter, deque
 
 COLORS=['R','G','B','Y']
 VALUES=[str(i) for i in range(1,10)]+['+2','Skip','Reverse']
 
 def create_deck():
-    deck=[]
+    deck=deque()
     for c in COLORS:
         deck.append(c+'0')
         for v in VALUES:
@@ -17,17 +18,33 @@ def create_deck():
         deck.append('W4')
     return deck
 
+class Hand(list):
+    def __init__(self,cards=()):
+        super().__init__()
+        self.colors=Counter()
+        for c in cards:
+            self.append(c)
+    def append(self,card):
+        super().append(card)
+        self.colors[card[0]]+=1
+    def pop(self,i=-1):
+        card=super().pop(i)
+        self.colors[card[0]]-=1
+        return card
+
 def draw_card(deck,discard):
     if not deck:
-        deck.extend(discard[:-1])
-        random.shuffle(deck)
-        discard[:] = [discard[-1]]
+        top=discard.pop()
+        random.shuffle(discard)
+        deck.extend(discard)
+        discard.clear()
+        discard.append(top)
     return deck.pop()
 
 def can_play(card,top_color,top_value,hand):
     if card in ('W','W4'):
         if card=='W4':
-            return all(c[0]!=top_color for c in hand if c not in ('W','W4'))
+            return hand.colors[top_color]==0
         return True
     if card[0]==top_color or card[1:]==top_value:
         return True
@@ -88,10 +105,10 @@ class UnoApp:
         self.players=2
         self.deck=create_deck()
         random.shuffle(self.deck)
-        self.hands=[ [self.deck.pop() for _ in range(7)] for _ in range(self.players) ]
+        self.hands=[ Hand(self.deck.pop() for _ in range(7)) for _ in range(self.players) ]
         self.discard=[self.deck.pop()]
         while self.discard[-1] in ('W','W4'):
-            self.deck.insert(0,self.discard.pop())
+            self.deck.appendleft(self.discard.pop())
             self.discard.append(self.deck.pop())
         self.top_color=self.discard[-1][0]
         self.top_value=self.discard[-1][1:]